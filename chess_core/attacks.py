@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import List
+
+from chess_core.pieces import PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, BLACK
+
+# ตารางช่องที่คำนวณไว้ล่วงหน้า (index = x*8 + y) ใช้ร่วมกันทั้ง movegen และการตรวจเช็ค
+
+
+def _on_board(x: int, y: int) -> bool:
+    return 0 <= x < 8 and 0 <= y < 8
+
+
+def _leaper_targets(deltas) -> List[List[int]]:
+    table = []
+    for sq in range(64):
+        x, y = sq >> 3, sq & 7
+        table.append([(x + dx) * 8 + y + dy for dx, dy in deltas if _on_board(x + dx, y + dy)])
+    return table
+
+
+def _ray_targets(dx: int, dy: int) -> List[List[int]]:
+    table = []
+    for sq in range(64):
+        x, y = (sq >> 3) + dx, (sq & 7) + dy
+        ray = []
+        while _on_board(x, y):
+            ray.append(x * 8 + y)
+            x += dx
+            y += dy
+        table.append(ray)
+    return table
+
+
+KNIGHT_TARGETS = _leaper_targets([(1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)])
+KING_TARGETS = _leaper_targets([(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)])
+
+ROOK_RAYS = [_ray_targets(dx, dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))]
+BISHOP_RAYS = [_ray_targets(dx, dy) for dx, dy in ((1, 1), (1, -1), (-1, 1), (-1, -1))]
+QUEEN_RAYS = ROOK_RAYS + BISHOP_RAYS
+
+# PAWN_ATTACKERS[0][sq] = ช่องที่ pawn ขาวยืนแล้วโจมตี sq ได้ ; [1] = pawn ดำ
+PAWN_ATTACKERS = [
+    _leaper_targets([(-1, -1), (-1, 1)]),
+    _leaper_targets([(1, -1), (1, 1)]),
+]
+
+
+def is_square_attacked(squares, sq: int, by_white: bool) -> bool:
+    """
+    ช่อง sq โดนฝ่าย by_white โจมตีหรือไม่ — ไล่ออกจากช่อง sq เอง
+    (knight jump, pawn เฉียง, king รอบตัว, ray ของ rook/bishop จนเจอตัวขวางตัวแรก)
+    """
+    side = 0 if by_white else BLACK
+
+    knight = KNIGHT | side
+    for s in KNIGHT_TARGETS[sq]:
+        if squares[s] == knight:
+            return True
+
+    pawn = PAWN | side
+    for s in PAWN_ATTACKERS[0 if by_white else 1][sq]:
+        if squares[s] == pawn:
+            return True
+
+    king = KING | side
+    for s in KING_TARGETS[sq]:
+        if squares[s] == king:
+            return True
+
+    queen = QUEEN | side
+    rook = ROOK | side
+    for ray in ROOK_RAYS:
+        for s in ray[sq]:
+            code = squares[s]
+            if code:
+                if code == rook or code == queen:
+                    return True
+                break
+
+    bishop = BISHOP | side
+    for ray in BISHOP_RAYS:
+        for s in ray[sq]:
+            code = squares[s]
+            if code:
+                if code == bishop or code == queen:
+                    return True
+                break
+
+    return False
@@ -1,5 +1,9 @@
 from chess_core.square import *
 from chess_core.pieces import *
+from chess_core.position import Position, CASTLE_MASK, CASTLE_WK, CASTLE_WQ, CASTLE_BK, CASTLE_BQ
+from chess_core.game_state import GAME_STATE
+from chess_core.attacks import is_square_attacked
+from chess_core.moves import encode_move, FLAG_CAPTURE, FLAG_DOUBLE_PUSH, FLAG_EN_PASSANT, FLAG_CASTLE
 
 def board_range(num): #used to verify movements of most pieces
 
@@ -11,245 +15,229 @@ def board_range(num): #used to verify movements of most pieces
         return range(-1, num, -1)
 
 #O tabuleiro em si. Temos o método create_board(), que preenche o tabuleiro com peças
-#   Nesta classe o movimento de cada peça é verificado e em métodos como has_path_rook e can_castle,
-#além de realizar o movimento propriamente dito
+#   Neste módulo o movimento de cada peça é verificado e em métodos como has_path_rook e can_castle,
+#além de realizar o movimento propriamente dito.
+#   Tudo trabalha sobre Position.squares (index = x*8 + y); as funções que recebem Square são
+#apenas uma camada fina por cima das versões por índice.
 
 class Board:
 
+    # กระดาน global เดิม (compatibility shim) — โค้ดใหม่ควรใช้ Position ของแต่ละเกม
     board = []
+    position = Position(board=board, state=GAME_STATE)
 
     def create_board():
+        Board.position.reset()
+        Board.position.board  # เติม view ลงใน Board.board
 
-        line = [Square(0, 0 ,Rook(True)),
-                Square(0, 1 ,Knight(True)),
-                Square(0, 2 ,Bishop(True)),
-                Square(0, 3 ,Queen(True)),
-                Square(0, 4 ,King(True)),
-                Square(0, 5 ,Bishop(True)),
-                Square(0, 6 ,Knight(True)),
-                Square(0, 7 ,Rook(True))]
-        Board.board.append(line)
-
-        line = []
-        for i in range(8):
-            line.append(Square(1, i, Pawn(True)))
-        Board.board.append(line)
-
-        for i in range(2, 6):
-            line = []
-            for j in range(8):
-                line.append(Square(i, j))
-
-            Board.board.append(line)
-
-        line = []
-        for i in range(8):
-            line.append(Square(6, i, Pawn(False)))
-        Board.board.append(line)
-
-        line = [Square(7, 0 ,Rook(False)),
-                Square(7, 1 ,Knight(False)),
-                Square(7, 2 ,Bishop(False)),
-                Square(7, 3 ,Queen(False)),
-                Square(7, 4 ,King(False)),
-                Square(7, 5 ,Bishop(False)),
-                Square(7, 6 ,Knight(False)),
-                Square(7, 7 ,Rook(False))]
-        Board.board.append(line)
-
-        
-    def print_board() -> None:
-
-        for x in Board.board[::-1]:
+    def print_board(position: Position = None) -> None:
+
+        for x in (Board.position if position is None else position).board[::-1]:
             for y in x:
                 print(y, end=' ')
             print()
 
-def has_path_rook(start: Square, end: Square) -> bool: #check if path is clear for rook
 
-    #See if is a possible move
-    if not start.piece.possible_move(start, end):
-        return False
+def _position(position) -> Position:
+    # position=None -> ใช้กระดาน global เดิม
+    return Board.position if position is None else position
 
-    x = end.x - start.x
-    y = end.y - start.y
+
+def _clear_line(squares, x1: int, y1: int, x2: int, y2: int) -> bool: #path of rook (same line or column)
+
+    x = x2 - x1
+    y = y2 - y1
 
     #If moving in the same column
     if x != 0:
         for i in board_range(x):
-            if not isinstance(Board.board[start.x + i][start.y].piece, EmptySquare):
+            if squares[(x1 + i) * 8 + y1]:
                 return False
         return True
-    
+
     #Else, moving in the same line
     for i in board_range(y):
-        if not isinstance(Board.board[start.x][start.y + i].piece, EmptySquare):
+        if squares[x1 * 8 + y1 + i]:
             return False
     return True
 
-def has_path_bishop(start : Square, end : Square) -> bool: #check if path is clear for bishop
 
-    if not start.piece.possible_move(start, end):
-        return False
-    
-    x = end.x - start.x 
-    y = end.y - start.y
-
-    #verify this for the Queen move
-    if x == 0 or y == 0:
-        return False
+def _clear_diagonal(squares, x1: int, y1: int, x2: int, y2: int) -> bool: #path of bishop
 
     #Using zip because x and y absolute values are the same
-    for i, j in zip(board_range(x), board_range(y)):
-        if not isinstance(Board.board[start.x + i][start.y + j].piece, EmptySquare):
+    for i, j in zip(board_range(x2 - x1), board_range(y2 - y1)):
+        if squares[(x1 + i) * 8 + y1 + j]:
             return False
     return True
 
 
-def pawn_can_capture(start : Square, end : Square) -> bool:
-
-    x = end.x - start.x
-    y = abs(end.y - start.y)
-
-    if not isinstance(end.piece, EmptySquare) and start.piece.iswhite != end.piece.iswhite:
-        if start.piece.iswhite and x == 1 and y == 1:
-            return True
-        elif not start.piece.iswhite and x == -1 and y == 1:
-            return True
-        
-    #Checking for en passant
-    if isinstance(end.piece, EmptySquare) and isinstance(Board.board[start.x][end.y].piece, Pawn):
-        if start.piece.iswhite and y == 1 and x == 1:
-            if Board.board[start.x][end.y].piece.en_passantable:
-                return True 
-        if not start.piece.iswhite and x == -1 and y == 1:
-            if Board.board[start.x][end.y].piece.en_passantable:
-                return True 
+def attacks_square(squares, s: int, t: int) -> bool:
+    """หมากที่ช่อง s โจมตีช่อง t ได้หรือไม่ (ไม่สนว่าช่อง t มีหมากของใคร)"""
+
+    code = squares[s]
+    ptype = code & TYPE_MASK
+    x1, y1 = s >> 3, s & 7
+    x2, y2 = t >> 3, t & 7
+    x = x2 - x1
+    y = y2 - y1
+
+    if ptype == PAWN:
+        return abs(y) == 1 and x == (-1 if code & BLACK else 1)
+    if ptype == KNIGHT:
+        return (abs(x) == 2 and abs(y) == 1) or (abs(x) == 1 and abs(y) == 2)
+    if ptype == KING:
+        return s != t and abs(x) <= 1 and abs(y) <= 1
+    if ptype in (ROOK, QUEEN) and (x == 0) != (y == 0):
+        return _clear_line(squares, x1, y1, x2, y2)
+    if ptype in (BISHOP, QUEEN) and x != 0 and abs(x) == abs(y):
+        return _clear_diagonal(squares, x1, y1, x2, y2)
     return False
 
 
-def can_castle(start : Square, end : Square) -> bool:
+def can_reach(position: Position, s: int, t: int) -> bool:
+    """เดินจาก s ไป t ได้ตามรูปแบบหมาก (ยังไม่ตรวจว่าคิงตัวเองโดนเช็คหรือไม่, ไม่รวม castling)"""
+
+    squares = position.squares
+    code = squares[s]
+    target = squares[t]
+    if not code or s == t:
+        return False
+
+    #Can't move if the square is ocupied by own piece
+    if target and (target & BLACK) == (code & BLACK):
+        return False
+
+    if code & TYPE_MASK == PAWN:
+        forward = -1 if code & BLACK else 1
+        x = (t >> 3) - (s >> 3)
+        y = (t & 7) - (s & 7)
+
+        # เดินตรง: ปลายทางต้องว่าง, 2 ช่องได้เฉพาะจาก rank เริ่มต้นและห้ามข้ามตัวหมาก
+        if y == 0:
+            if target:
+                return False
+            if x == forward:
+                return True
+            start_rank = 6 if code & BLACK else 1
+            return x == 2 * forward and (s >> 3) == start_rank and not squares[s + 8 * forward]
+
+        # capture เฉียง (รวม en passant)
+        return abs(y) == 1 and x == forward and (target != EMPTY or t == position.ep_square)
+
+    return attacks_square(squares, s, t)
 
-    x = end.x - start.x
-    y = end.y - start.y
 
-    if start.piece.moved or abs(y) != 2 or x != 0:
+def can_castle_at(position: Position, s: int, t: int) -> bool:
+
+    squares = position.squares
+    code = squares[s]
+    if code & TYPE_MASK != KING or abs(t - s) != 2 or (t >> 3) != (s >> 3):
         return False
-    
-    #Find correct rook square and square rook will move to
-    if y > 0:
-        rook_square : Square = Board.board[start.x][7]
-        move_square : Square = Board.board[start.x][start.y + 1]
+
+    #Find correct rook square and the castling right
+    iswhite = not code & BLACK
+    if t > s:
+        rook = (s & ~7) | 7
+        right = CASTLE_WK if iswhite else CASTLE_BK
     else:
-        rook_square : Square = Board.board[start.x][0]
-        move_square : Square = Board.board[start.x][start.y - 1]  
-    
-    #Verifies if rook_square is rook and has not moved
-    if (not isinstance(rook_square.piece, Rook)) or rook_square.piece.moved == True:
+        rook = s & ~7
+        right = CASTLE_WQ if iswhite else CASTLE_BQ
+
+    if not position.castling & right or squares[rook] != make_code(ROOK, iswhite):
         return False
-    
-    #Verifies path
-    if has_path_rook(rook_square, move_square):
-        move_piece(rook_square, move_square)
-        return True
-    return False
 
+    #Verifies path between king and rook
+    if not _clear_line(squares, s >> 3, s & 7, rook >> 3, rook & 7):
+        return False
+
+    #King can't castle out of check or through an attacked square
+    step = 1 if t > s else -1
+    return not (
+        square_attacked(position, s, not iswhite)
+        or square_attacked(position, s + step, not iswhite)
+    )
+
+
+def square_attacked(position: Position, sq: int, by_white: bool) -> bool:
+    return is_square_attacked(position.squares, sq, by_white)
 
-def _pawn_forward_path_clear(start: Square, end: Square) -> bool:
+
+def apply_move(position: Position, s: int, t: int) -> None:
     """
-    NEW: กันบั๊ก pawn เดิน 2 ช่องแล้วข้ามตัวหมาก
-    ตรวจเฉพาะ "เดินตรง" (ไฟล์เดิม) เท่านั้น
+    เดินหมากจาก s ไป t (รวม rook ตอน castling และ pawn ที่โดน en passant) ผ่าน Position.make_move
+    hash / eval / นาฬิกาอัปเดตเหมือน move ปกติ, สลับฝ่ายที่ต้องเดิน และย้อนด้วย unmake_move ได้
+    pawn ที่ถึงแถวสุดท้ายไม่ promote (API เดิมไม่มีตัวเลือก promotion)
     """
-    if start.y != end.y:
-        return True  # ไม่ใช่เดินตรง (capture จะตรวจที่อื่น)
-
-    dx = end.x - start.x
-    if start.piece.iswhite:
-        if dx == 2:
-            mid = Board.board[start.x + 1][start.y]
-            return isinstance(mid.piece, EmptySquare)
-    else:
-        if dx == -2:
-            mid = Board.board[start.x - 1][start.y]
-            return isinstance(mid.piece, EmptySquare)
-    return True
 
+    squares = position.squares
+    ptype = squares[s] & TYPE_MASK
+    flags = FLAG_CAPTURE if squares[t] else 0
 
-def move_piece(start: Square, end: Square) -> bool:
-
-    # Move the rook
-    if isinstance(start.piece, Rook):
-        if has_path_rook(start, end):
-            start.piece.moved = True
-            Board.board[end.x][end.y].piece = start.piece
-            Board.board[start.x][start.y] = Square(start.x, start.y)
-            return True
-
-    # Move the bishop
-    elif isinstance(start.piece, Bishop):
-        if has_path_bishop(start, end):
-            Board.board[end.x][end.y].piece = start.piece
-            Board.board[start.x][start.y] = Square(start.x, start.y)
-            return True
-
-    # Move the queen
-    elif isinstance(start.piece, Queen):
-        if has_path_rook(start, end):
-            Board.board[end.x][end.y].piece = start.piece
-            Board.board[start.x][start.y] = Square(start.x, start.y)
-            return True
-        elif has_path_bishop(start, end):
-            Board.board[end.x][end.y].piece = start.piece
-            Board.board[start.x][start.y] = Square(start.x, start.y)
-            return True
-
-    # Move the King 
-    elif isinstance(start.piece, King):
-        if start.piece.possible_move(start, end) or can_castle(start, end):
-            start.piece.moved = True
-            Board.board[end.x][end.y].piece = start.piece
-            Board.board[start.x][start.y] = Square(start.x, start.y)
-            return True
-
-    # Move the knight
-    elif isinstance(start.piece, Knight):
-        if start.piece.possible_move(start, end):
-            Board.board[end.x][end.y].piece = start.piece
-            Board.board[start.x][start.y] = Square(start.x, start.y)
-            return True
-
-    # Move the pawn
-    elif isinstance(start.piece, Pawn):
-        # NEW: ถ้าเดินตรง 2 ช่อง ต้องไม่มีตัวขวาง
-        if not _pawn_forward_path_clear(start, end):
-            return False
+    if ptype == PAWN:
+        # en passant: capture เฉียงไปช่อง ep -> pawn ที่โดนกินอยู่ rank เดิมของผู้เดิน
+        if t == position.ep_square and (t & 7) != (s & 7):
+            flags |= FLAG_EN_PASSANT | FLAG_CAPTURE
+        elif abs(t - s) == 16:
+            flags |= FLAG_DOUBLE_PUSH
+    elif ptype == KING and abs(t - s) == 2:
+        flags |= FLAG_CASTLE
 
-        if ((start.piece.possible_move(start, end) and isinstance(end.piece, EmptySquare))
-            or pawn_can_capture(start, end)):
-            
-            start.piece.moved = True
-
-            if abs(start.x - end.x) == 2:
-                start.piece.en_passantable = True
-            
-            # if en passant (capture เฉียงแต่ปลายทางว่าง)
-            if isinstance(end.piece, EmptySquare) and start.y != end.y:
-                Board.board[start.x][end.y] = Square(start.x, end.y)
-
-            Board.board[end.x][end.y].piece = start.piece
-            Board.board[start.x][start.y] = Square(start.x, start.y)
-            return True
+    position.make_move(encode_move(s, t, flags))
+
+
+def move_piece_at(position: Position, s: int, t: int) -> bool:
+    if can_reach(position, s, t) or can_castle_at(position, s, t):
+        apply_move(position, s, t)
+        return True
     return False
 
 
+# ----- API เดิมที่รับ Square -----
+def has_path_rook(start: Square, end: Square, position=None) -> bool: #check if path is clear for rook
+
+    #See if is a possible move
+    if not start.piece.possible_move(start, end):
+        return False
+    if start.x != end.x and start.y != end.y:
+        return False
+    return _clear_line(_position(position).squares, start.x, start.y, end.x, end.y)
+
+
+def has_path_bishop(start : Square, end : Square, position=None) -> bool: #check if path is clear for bishop
+
+    if not start.piece.possible_move(start, end):
+        return False
+
+    #verify this for the Queen move
+    if start.x == end.x or start.y == end.y:
+        return False
+    return _clear_diagonal(_position(position).squares, start.x, start.y, end.x, end.y)
+
+
+def pawn_can_capture(start : Square, end : Square, position=None) -> bool:
+
+    position = _position(position)
+    if start.piece.code & TYPE_MASK != PAWN or start.y == end.y:
+        return False
+    return can_reach(position, start.index, end.index)
+
+
+def can_castle(start : Square, end : Square, position=None) -> bool:
+    return can_castle_at(_position(position), start.index, end.index)
+
+
+def move_piece(start: Square, end: Square, position=None) -> bool:
+    return move_piece_at(_position(position), start.index, end.index)
+
+
 def main():
     Board.create_board()
 
-    Board.board[1][0] = Square(1,0)
-    Board.board[1][3] = Square(1,3)
-    Board.board[6][3] = Square(6,3)
-    Board.board[6][1] = Square(6,1)
+    Board.board[1][0].piece = None
+    Board.board[1][3].piece = None
+    Board.board[6][3].piece = None
+    Board.board[6][1].piece = None
     Board.print_board()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
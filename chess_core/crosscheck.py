@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from chess_core.position import Position
+from chess_core.moves import move_to_uci
+from chess_core.movegen import generate_legal_moves, game_status, CHECKMATE, STALEMATE
+
+# โหมดตรวจเทียบกับ python-chess (ไม่บังคับติดตั้ง) — ใช้ debug กติกา / SAN ของ engine เอง
+# import chess เฉพาะตอนเรียกตรวจครั้งแรก เพื่อไม่ให้โปรแกรมปกติต้องโหลด library นี้
+
+_chess = None
+
+
+class CrossCheckError(Exception):
+    pass
+
+
+def _load_chess():
+    global _chess
+    if _chess is None:
+        try:
+            import chess
+        except ImportError as exc:
+            raise RuntimeError("Cross-check mode needs python-chess (pip install python-chess)") from exc
+        _chess = chess
+    return _chess
+
+
+def check_position(position: Position) -> None:
+    """legal move ทั้งหมด + checkmate/stalemate ต้องตรงกับ python-chess ไม่งั้น CrossCheckError"""
+    chess = _load_chess()
+    fen = position.to_fen()
+    board = chess.Board(fen)
+
+    ours = {move_to_uci(m) for m in generate_legal_moves(position)}
+    theirs = {m.uci() for m in board.legal_moves}
+    if ours != theirs:
+        raise CrossCheckError(
+            f"Legal moves differ for {fen}: "
+            f"missing {sorted(theirs - ours)}, extra {sorted(ours - theirs)}"
+        )
+
+    status = game_status(position)
+    if (status == CHECKMATE) != board.is_checkmate() or (status == STALEMATE) != board.is_stalemate():
+        raise CrossCheckError(f"Game status differs for {fen}: {status}")
+
+
+def check_san(position: Position, move: int, san: str) -> None:
+    # เรียกก่อนเดิน move (position ยังเป็นตำแหน่งก่อนเดิน)
+    chess = _load_chess()
+    board = chess.Board(position.to_fen())
+    expected = board.san(chess.Move.from_uci(move_to_uci(move)))
+    if san != expected:
+        raise CrossCheckError(f"SAN differs for {move_to_uci(move)} in {board.fen()}: {san} != {expected}")
+
+
+def is_available() -> bool:
+    try:
+        _load_chess()
+    except RuntimeError:
+        return False
+    return True
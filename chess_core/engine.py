@@ -0,0 +1,300 @@
+"""
+engine สำหรับเล่นคนเดียว: negamax alpha-beta + iterative deepening บน Position (make_move / unmake_move)
+
+    engine = Engine()
+    result = engine.search(position, SearchLimits(movetime=1.0))
+    result.best_move, result.score, result.pv
+
+จำกัดการค้นได้ทั้ง depth / เวลา (วินาที) / จำนวน node ; ครบ budget กลาง iteration -> ใช้ผลของ depth ล่าสุดที่ค้นจบ
+ปลาย search ต่อด้วย quiescence (capture / promotion ที่ SEE ไม่ขาดทุน) จนกระดาน "นิ่ง" ก่อน evaluate
+transposition table (chess_core.tt) ขนาดคงที่ตาม hash_mb — memory ต่อ Engine ไม่โตตามจำนวน node
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from chess_core.position import Position
+from chess_core.moves import move_to_uci, FLAG_CAPTURE, FLAG_PROMOTION
+from chess_core.movegen import generate_legal_moves, in_check
+from chess_core.tt import TranspositionTable, EXACT, LOWER, UPPER
+from chess_core.ordering import MoveOrderer
+from chess_core.see import see
+from chess_core.evaluation import evaluate
+
+# คะแนนเป็น centipawn จากมุมของฝ่ายที่ต้องเดิน
+MATE_SCORE = 100000
+MATE_BOUND = MATE_SCORE - 1000  # |score| เกินนี้ = เจอ mate
+INFINITY = MATE_SCORE + 1
+MAX_PLY = 128
+DEFAULT_HASH_MB = 16
+
+
+def _score_to_tt(score: int, ply: int) -> int:
+    # mate score ใน TT นับระยะจาก node นั้น (ไม่ใช่จาก root) เพื่อใช้ซ้ำที่ ply อื่นได้
+    if score >= MATE_BOUND:
+        return score + ply
+    if score <= -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def _score_from_tt(score: int, ply: int) -> int:
+    if score >= MATE_BOUND:
+        return score - ply
+    if score <= -MATE_BOUND:
+        return score + ply
+    return score
+
+
+@dataclass
+class SearchLimits:
+    depth: Optional[int] = None      # None = ไม่จำกัด (ใช้เวลา/node แทน)
+    movetime: Optional[float] = None  # วินาที
+    nodes: Optional[int] = None
+
+
+@dataclass
+class SearchResult:
+    best_move: int = 0               # 0 = ไม่มี legal move
+    score: int = 0
+    depth: int = 0
+    nodes: int = 0
+    time: float = 0.0
+    pv: List[int] = field(default_factory=list)
+
+    @property
+    def mate_in(self) -> Optional[int]:
+        # จำนวนตา (move) จนถึง mate: บวก = ฝ่ายที่เดินชนะ, ลบ = แพ้
+        if abs(self.score) < MATE_BOUND:
+            return None
+        plies = MATE_SCORE - abs(self.score)
+        moves = (plies + 1) // 2
+        return moves if self.score > 0 else -moves
+
+    def pv_uci(self) -> List[str]:
+        return [move_to_uci(m) for m in self.pv]
+
+
+class SearchStopped(Exception):
+    pass
+
+
+class Engine:
+    """
+    1 Engine ต่อ 1 ผู้เล่น/1 thread ; search() แก้ position ระหว่างค้น (make/unmake) แต่คืนสภาพเดิมเสมอ
+    stop() เรียกจาก thread อื่นได้ (เช่น UCI "stop") — search จะหยุดแล้วคืนผลของ depth ล่าสุด
+    search(..., stop=Event) ผูก search ครั้งนั้นกับ token ของ caller: set ได้ตั้งแต่ก่อน search เริ่ม (stop() ทำแบบนั้นไม่ได้
+    เพราะ search ล้าง flag ตอนเริ่ม)
+    """
+
+    CHECK_EVERY = 1024  # ตรวจเวลา / stop ทุก ๆ กี่ node
+
+    def __init__(self, hash_mb: float = DEFAULT_HASH_MB) -> None:
+        self.tt = TranspositionTable(hash_mb)
+        self.ordering = MoveOrderer(MAX_PLY)
+        self.nodes = 0
+        self._deadline: Optional[float] = None
+        self._node_limit: Optional[int] = None
+        self._stop = False
+        self._stop_token: Optional[threading.Event] = None
+        self._pv: List[List[int]] = [[] for _ in range(MAX_PLY + 2)]
+        self._prev_pv: List[int] = []
+
+    def stop(self) -> None:
+        self._stop = True
+
+    def stats(self) -> dict:
+        """ตัวนับของ search ล่าสุด: TT (hit rate) + move ordering (cutoff จาก move แรก)"""
+        return {"nodes": self.nodes, "tt": self.tt.stats(), "ordering": self.ordering.stats()}
+
+    def new_game(self) -> None:
+        # เกมใหม่: entry ของเกมเก่าไม่มีประโยชน์แล้ว
+        self.tt.clear()
+
+    def search(
+        self,
+        position: Position,
+        limits: Optional[SearchLimits] = None,
+        on_iteration: Optional[Callable[[SearchResult], None]] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> SearchResult:
+        """
+        iterative deepening: depth 1, 2, ... จนครบ limits ; on_iteration เรียกหลังค้นจบแต่ละ depth
+        stop: token ของ caller — set แล้ว (ก่อนหรือระหว่างค้น) search หยุดและคืนผลของ depth ล่าสุด
+        """
+        limits = limits or SearchLimits(depth=4)
+        start = time.perf_counter()
+        self.nodes = 0
+        self._stop = False
+        self._stop_token = stop
+        self._deadline = start + limits.movetime if limits.movetime is not None else None
+        self._node_limit = limits.nodes
+        self.tt.new_search()
+        self.tt.reset_stats()
+        self.ordering.new_search()
+        max_depth = limits.depth or MAX_PLY
+
+        root_moves = list(generate_legal_moves(position))
+        result = SearchResult()
+        if not root_moves:
+            result.score = -MATE_SCORE if in_check(position) else 0
+            return result
+        result.best_move = root_moves[0]
+        result.pv = [root_moves[0]]
+        self._prev_pv = []
+
+        for depth in range(1, max_depth + 1):
+            if stop is not None and stop.is_set():
+                break
+            try:
+                score = self._negamax(position, depth, -INFINITY, INFINITY, 0)
+            except SearchStopped:
+                break
+            result = SearchResult(
+                best_move=self._pv[0][0] if self._pv[0] else result.best_move,
+                score=score,
+                depth=depth,
+                nodes=self.nodes,
+                time=time.perf_counter() - start,
+                pv=list(self._pv[0]),
+            )
+            self._prev_pv = result.pv
+            if on_iteration is not None:
+                on_iteration(result)
+            if abs(score) >= MATE_BOUND and MATE_SCORE - abs(score) <= depth:
+                break  # เจอ mate ที่สั้นที่สุดในระยะที่ค้นแล้ว
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                break
+
+        result.nodes = self.nodes
+        result.time = time.perf_counter() - start
+        return result
+
+    # ----- search -----
+    def _check_limits(self) -> None:
+        if self._stop or self._stop_token is not None and self._stop_token.is_set():
+            raise SearchStopped
+        if self._node_limit is not None and self.nodes >= self._node_limit:
+            raise SearchStopped
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchStopped
+
+    def _order_moves(self, position: Position, moves: List[int], ply: int, hash_move: int = 0) -> List[int]:
+        # ไม่มี move จาก TT (entry ถูกทับ): ใช้ move ใน PV ของ iteration ก่อนที่ ply เดียวกันแทน
+        if not hash_move and ply < len(self._prev_pv):
+            hash_move = self._prev_pv[ply]
+        return self.ordering.order(position.squares, moves, ply, hash_move)
+
+    def _negamax(self, position: Position, depth: int, alpha: int, beta: int, ply: int) -> int:
+        if depth <= 0 or ply >= MAX_PLY:
+            return self._quiesce(position, alpha, beta, ply)
+
+        self.nodes += 1
+        if self.nodes % self.CHECK_EVERY == 0:
+            self._check_limits()
+        self._pv[ply] = []
+
+        # draw: position ซ้ำ (ในเกมหรือใน search) / 50-move
+        if ply and (position.repetition_count() >= 2 or position.halfmove_clock >= 100):
+            return 0
+
+        key = position.hash_key
+        hash_move = 0
+        entry = self.tt.probe(key)
+        if entry is not None:
+            hash_move, tt_depth, tt_score, bound = entry
+            # root ค้นเองเสมอ (ต้องได้ PV / best move)
+            if ply and tt_depth >= depth:
+                tt_score = _score_from_tt(tt_score, ply)
+                if (
+                    bound == EXACT
+                    or (bound == LOWER and tt_score >= beta)
+                    or (bound == UPPER and tt_score <= alpha)
+                ):
+                    return tt_score
+
+        moves = list(generate_legal_moves(position))
+        if not moves:
+            return -MATE_SCORE + ply if in_check(position) else 0
+
+        alpha_orig = alpha
+        best = -INFINITY
+        best_move = 0
+        for index, move in enumerate(self._order_moves(position, moves, ply, hash_move)):
+            position.make_move(move)
+            try:
+                score = -self._negamax(position, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                position.unmake_move()
+
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    best_move = move
+                    self._pv[ply] = [move] + self._pv[ply + 1]
+                    if alpha >= beta:
+                        self.ordering.cutoff(position.squares, move, ply, depth, index)
+                        break
+
+        if best >= beta:
+            bound = LOWER
+        elif best > alpha_orig:
+            bound = EXACT
+        else:
+            bound = UPPER
+        self.tt.store(key, depth, _score_to_tt(best, ply), bound, best_move)
+        return best
+
+    def _quiesce(self, position: Position, alpha: int, beta: int, ply: int) -> int:
+        # ค้นต่อเฉพาะ capture / promotion จนไม่มีให้กิน ; โดนรุกอยู่ต้องดูทุก move (หนีรุก)
+        self.nodes += 1
+        if self.nodes % self.CHECK_EVERY == 0:
+            self._check_limits()
+        self._pv[ply] = []
+
+        # capture รีเซ็ต halfmove -> ตรวจ draw เฉพาะ node แรกหลัง move เงียบ
+        if ply and position.halfmove_clock and (position.repetition_count() >= 2 or position.halfmove_clock >= 100):
+            return 0
+        if ply >= MAX_PLY:
+            return evaluate(position)
+
+        checked = in_check(position)
+        if checked:
+            best = -INFINITY
+        else:
+            # stand pat: ไม่กินอะไรเลยก็ได้คะแนนนี้
+            best = evaluate(position)
+            if best >= beta:
+                return best
+            if best > alpha:
+                alpha = best
+
+        moves = list(generate_legal_moves(position))
+        if checked:
+            if not moves:
+                return -MATE_SCORE + ply
+        else:
+            # capture ที่ SEE ติดลบ (เสีย material แน่) ไม่ต้องค้น
+            moves = [
+                m for m in moves
+                if (m >> 12) & (FLAG_CAPTURE | FLAG_PROMOTION) and see(position, m) >= 0
+            ]
+
+        for move in self.ordering.order(position.squares, moves, ply):
+            position.make_move(move)
+            try:
+                score = -self._quiesce(position, -beta, -alpha, ply + 1)
+            finally:
+                position.unmake_move()
+
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best
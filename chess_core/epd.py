@@ -0,0 +1,167 @@
+"""
+อ่านไฟล์ EPD / FEN ทีละบรรทัดแบบ streaming (memory คงที่ ไม่ว่าไฟล์จะใหญ่แค่ไหน)
+
+    for position, ops in read_epd("puzzles.epd"):
+        ...
+
+benchmark ความเร็วการอ่าน:
+    python -m chess_core.epd positions.epd [--reuse]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+from chess_core.position import Position
+from chess_core.fen import from_fen
+
+Source = Union[str, "os.PathLike[str]", TextIO]
+
+
+def _split_ops(text: str) -> Dict[str, str]:
+    # 'bm Nf3; id "a; b";' -> {"bm": "Nf3", "id": '"a; b"'} (';' ใน "..." ไม่ใช่ตัวแบ่ง)
+    ops: Dict[str, str] = {}
+    if '"' not in text:
+        for op in text.split(";"):
+            opcode, _, operand = op.strip().partition(" ")
+            if opcode:
+                ops[opcode] = operand.strip()
+        return ops
+
+    current = []
+    quoted = False
+    for ch in text + ";":
+        if ch == '"':
+            quoted = not quoted
+        if ch == ";" and not quoted:
+            op = "".join(current).strip()
+            current = []
+            if op:
+                opcode, _, operand = op.partition(" ")
+                ops[opcode] = operand.strip()
+            continue
+        current.append(ch)
+    return ops
+
+
+def _clock_op(ops: Dict[str, str], opcode: str, default: str) -> str:
+    value = ops.get(opcode)
+    if value is None:
+        return default
+    if not value.isdigit():
+        raise ValueError(f"Invalid {opcode} operand: {value!r}")
+    return value
+
+
+def split_epd_line(line: str) -> Tuple[str, Dict[str, str]]:
+    """
+    บรรทัด EPD หรือ FEN -> (FEN 6 ช่อง, operations)
+    รับได้ทั้ง 'FEN 4 ช่อง + ops', 'FEN 6 ช่อง' และ 'FEN 6 ช่อง ;D1 20 ;D2 400' (แบบ perftsuite.epd)
+    clock ของ FEN 4 ช่องมาจาก opcode hmvc / fmvn (ไม่มี -> 0 / 1)
+    """
+    fields = line.split(None, 4)
+    if len(fields) < 4:
+        raise ValueError(f"Invalid EPD line: {line.strip()!r}")
+    rest = fields[4] if len(fields) == 5 else ""
+
+    clocks = None
+    parts = rest.split(None, 2)
+    if len(parts) >= 2 and parts[0].isdigit() and parts[1].isdigit():
+        clocks = f"{parts[0]} {parts[1]}"
+        rest = parts[2] if len(parts) == 3 else ""
+
+    ops = _split_ops(rest) if rest.strip() else {}
+    if clocks is None:
+        # halfmove clock ใช้ตัดสินเสมอ 50 ตา — ต้องตรงกับ EPD ไม่ใช่ 0 เสมอ
+        clocks = f"{_clock_op(ops, 'hmvc', '0')} {_clock_op(ops, 'fmvn', '1')}"
+    fen = " ".join(fields[:4]) + " " + clocks
+    return fen, ops
+
+
+def _lines(source: Source) -> Iterator[Tuple[int, str]]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8", buffering=1 << 20) as f:
+            yield from _numbered(f)
+    else:
+        yield from _numbered(source)
+
+
+def _numbered(f: TextIO) -> Iterator[Tuple[int, str]]:
+    for number, line in enumerate(f, start=1):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield number, line
+
+
+def read_fens(source: Source) -> Iterator[str]:
+    """yield FEN (6 ช่อง) ทีละบรรทัดโดยไม่สร้าง Position (เช่นส่งต่อให้ worker ใน chess_core.parallel)"""
+    for number, line in _lines(source):
+        try:
+            yield split_epd_line(line)[0]
+        except ValueError as exc:
+            raise ValueError(f"line {number}: {exc}") from None
+
+
+def read_epd(
+    source: Source,
+    reuse_position: bool = False,
+    skip_invalid: bool = False,
+) -> Iterator[Tuple[Position, Dict[str, str]]]:
+    """
+    yield (Position, operations) ทีละบรรทัด — อ่านไฟล์ทีละบรรทัด ไม่โหลดทั้งไฟล์
+    - reuse_position: เติมลง Position ตัวเดิมทุกบรรทัด (เร็วกว่า แต่ต้องใช้ให้เสร็จก่อนดึงตัวถัดไป)
+    - skip_invalid: ข้ามบรรทัดที่อ่านไม่ได้ แทนการ raise ValueError (ระบุเลขบรรทัด)
+    """
+    position = Position() if reuse_position else None
+    for number, line in _lines(source):
+        try:
+            fen, ops = split_epd_line(line)
+            yield from_fen(fen, position), ops
+        except ValueError as exc:
+            if skip_invalid:
+                continue
+            raise ValueError(f"line {number}: {exc}") from None
+
+
+# ----- benchmark -----
+def peak_rss_mb() -> Optional[float]:
+    """peak RSS ของ process นี้ (MB) ; None ถ้า OS ไม่มี resource (Windows)"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chess_core.epd", description="EPD/FEN loading benchmark")
+    parser.add_argument("path")
+    parser.add_argument("--reuse", action="store_true", help="refill one Position instead of creating one per line")
+    parser.add_argument("--skip-invalid", action="store_true")
+    args = parser.parse_args(argv)
+
+    size = os.path.getsize(args.path)
+    start = time.perf_counter()
+    count = 0
+    for _position, _ops in read_epd(args.path, args.reuse, args.skip_invalid):
+        count += 1
+    elapsed = time.perf_counter() - start
+
+    rate = count / elapsed if elapsed > 0 else 0.0
+    mb_rate = size / (1 << 20) / elapsed if elapsed > 0 else 0.0
+    print(f"Positions: {count}")
+    print(f"Time: {elapsed:.3f} s")
+    print(f"Positions/sec: {rate:,.0f}")
+    print(f"MB/sec: {mb_rate:.2f}")
+    peak = peak_rss_mb()
+    if peak is not None:
+        print(f"Peak RSS: {peak:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+evaluation แบบ incremental: material + piece-square table (midgame / endgame) แล้ว taper ตาม phase
+
+Position เก็บผลรวม eval_mg / eval_eg / phase ไว้ และ make_move / unmake_move อัปเดตทีละหมากที่ขยับ
+(แบบเดียวกับ Zobrist key) — evaluate() จึงไม่ต้องไล่ 64 ช่อง
+
+    evaluate(position)        คะแนน (centipawn) จากมุมฝ่ายที่ต้องเดิน (ใช้ใน search)
+    white_score(position)     คะแนนจากมุมขาว (ใช้กับ eval bar)
+
+material จาก Piece.VALUE * 100 ; ตาราง PST อิง "Simplified Evaluation Function" (เขียนจากมุมขาว แถวบน = rank 8)
+"""
+from __future__ import annotations
+
+from typing import List
+
+from chess_core.pieces import PIECE_CLASSES, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, BLACK
+
+# phase: knight/bishop = 1, rook = 2, queen = 4 ; หมากครบกระดาน = 24 (midgame ล้วน), เหลือแต่คิง/pawn = 0 (endgame ล้วน)
+MAX_PHASE = 24
+_PHASE_WEIGHTS = {KNIGHT: 1, BISHOP: 1, ROOK: 2, QUEEN: 4}
+
+# fmt: off
+_PAWN_MG = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+    50,  50,  50,  50,  50,  50,  50,  50,
+    10,  10,  20,  30,  30,  20,  10,  10,
+     5,   5,  10,  25,  25,  10,   5,   5,
+     0,   0,   0,  20,  20,   0,   0,   0,
+     5,  -5, -10,   0,   0, -10,  -5,   5,
+     5,  10,  10, -20, -20,  10,  10,   5,
+     0,   0,   0,   0,   0,   0,   0,   0,
+)
+_PAWN_EG = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+    80,  80,  80,  80,  80,  80,  80,  80,
+    50,  50,  50,  50,  50,  50,  50,  50,
+    30,  30,  30,  30,  30,  30,  30,  30,
+    20,  20,  20,  20,  20,  20,  20,  20,
+    10,  10,  10,  10,  10,  10,  10,  10,
+    10,  10,  10,  10,  10,  10,  10,  10,
+     0,   0,   0,   0,   0,   0,   0,   0,
+)
+_KNIGHT = (
+   -50, -40, -30, -30, -30, -30, -40, -50,
+   -40, -20,   0,   0,   0,   0, -20, -40,
+   -30,   0,  10,  15,  15,  10,   0, -30,
+   -30,   5,  15,  20,  20,  15,   5, -30,
+   -30,   0,  15,  20,  20,  15,   0, -30,
+   -30,   5,  10,  15,  15,  10,   5, -30,
+   -40, -20,   0,   5,   5,   0, -20, -40,
+   -50, -40, -30, -30, -30, -30, -40, -50,
+)
+_BISHOP = (
+   -20, -10, -10, -10, -10, -10, -10, -20,
+   -10,   0,   0,   0,   0,   0,   0, -10,
+   -10,   0,   5,  10,  10,   5,   0, -10,
+   -10,   5,   5,  10,  10,   5,   5, -10,
+   -10,   0,  10,  10,  10,  10,   0, -10,
+   -10,  10,  10,  10,  10,  10,  10, -10,
+   -10,   5,   0,   0,   0,   0,   5, -10,
+   -20, -10, -10, -10, -10, -10, -10, -20,
+)
+_ROOK = (
+     0,   0,   0,   0,   0,   0,   0,   0,
+     5,  10,  10,  10,  10,  10,  10,   5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+     0,   0,   0,   5,   5,   0,   0,   0,
+)
+_QUEEN = (
+   -20, -10, -10,  -5,  -5, -10, -10, -20,
+   -10,   0,   0,   0,   0,   0,   0, -10,
+   -10,   0,   5,   5,   5,   5,   0, -10,
+    -5,   0,   5,   5,   5,   5,   0,  -5,
+     0,   0,   5,   5,   5,   5,   0,  -5,
+   -10,   5,   5,   5,   5,   5,   0, -10,
+   -10,   0,   5,   0,   0,   0,   0, -10,
+   -20, -10, -10,  -5,  -5, -10, -10, -20,
+)
+_KING_MG = (
+   -30, -40, -40, -50, -50, -40, -40, -30,
+   -30, -40, -40, -50, -50, -40, -40, -30,
+   -30, -40, -40, -50, -50, -40, -40, -30,
+   -30, -40, -40, -50, -50, -40, -40, -30,
+   -20, -30, -30, -40, -40, -30, -30, -20,
+   -10, -20, -20, -20, -20, -20, -20, -10,
+    20,  20,   0,   0,   0,   0,  20,  20,
+    20,  30,  10,   0,   0,  10,  30,  20,
+)
+_KING_EG = (
+   -50, -40, -30, -20, -20, -30, -40, -50,
+   -30, -20, -10,   0,   0, -10, -20, -30,
+   -30, -10,  20,  30,  30,  20, -10, -30,
+   -30, -10,  30,  40,  40,  30, -10, -30,
+   -30, -10,  30,  40,  40,  30, -10, -30,
+   -30, -10,  20,  30,  30,  20, -10, -30,
+   -30, -30,   0,   0,   0,   0, -30, -30,
+   -50, -30, -30, -30, -30, -30, -30, -50,
+)
+# fmt: on
+
+_TABLES = {
+    PAWN: (_PAWN_MG, _PAWN_EG),
+    KNIGHT: (_KNIGHT, _KNIGHT),
+    BISHOP: (_BISHOP, _BISHOP),
+    ROOK: (_ROOK, _ROOK),
+    QUEEN: (_QUEEN, _QUEEN),
+    KING: (_KING_MG, _KING_EG),
+}
+
+
+def _build(phase_index: int) -> List[List[int]]:
+    # [code][sq] มีเครื่องหมายแล้ว (ขาว +, ดำ -) ; sq = x*8 + y -> แถวในตาราง = 7 - x (ขาว), x (ดำ กลับด้าน)
+    table = [[0] * 64 for _ in range(16)]
+    for ptype, cls in PIECE_CLASSES.items():
+        material = cls.VALUE * 100 if ptype != KING else 0
+        pst = _TABLES[ptype][phase_index]
+        for sq in range(64):
+            x, y = sq >> 3, sq & 7
+            table[ptype][sq] = material + pst[(7 - x) * 8 + y]
+            table[ptype | BLACK][sq] = -(material + pst[x * 8 + y])
+    return table
+
+
+MG_TABLE = _build(0)
+EG_TABLE = _build(1)
+PHASE = [0] * 16
+for _ptype, _weight in _PHASE_WEIGHTS.items():
+    PHASE[_ptype] = PHASE[_ptype | BLACK] = _weight
+
+
+def compute_eval(squares):
+    """(mg, eg, phase) ทั้งกระดาน (ใช้ตอนตั้ง position ; ระหว่างเกม make_move อัปเดตแบบ incremental)"""
+    mg = eg = phase = 0
+    for sq in range(64):
+        code = squares[sq]
+        if code:
+            mg += MG_TABLE[code][sq]
+            eg += EG_TABLE[code][sq]
+            phase += PHASE[code]
+    return mg, eg, phase
+
+
+def white_score(position) -> int:
+    """คะแนน taper แล้วจากมุมขาว (centipawn)"""
+    phase = position.phase
+    if phase > MAX_PHASE:
+        phase = MAX_PHASE  # promotion ทำให้เกิน 24 ได้
+    total = position.eval_mg * phase + position.eval_eg * (MAX_PHASE - phase)
+    # ปัดเข้าหา 0 ทั้งสองฝั่ง: position ที่กลับสีกันได้คะแนนตรงข้ามกันพอดี
+    return total // MAX_PHASE if total >= 0 else -(-total // MAX_PHASE)
+
+
+def evaluate(position) -> int:
+    """คะแนนจากมุมฝ่ายที่ต้องเดิน — O(1) จากค่าที่ make/unmake อัปเดตไว้"""
+    score = white_score(position)
+    return score if position.white_to_move else -score
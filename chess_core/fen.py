@@ -1,37 +1,29 @@
 from __future__ import annotations
 
+from typing import Optional
+
 from chess_core.board import Board
-from chess_core.square import EmptySquare
-from chess_core.pieces import King, Queen, Rook, Bishop, Knight, Pawn
+from chess_core.position import Position, CASTLE_WK, CASTLE_WQ, CASTLE_BK, CASTLE_BQ
+from chess_core.pieces import EMPTY, BLACK, TYPE_MASK, PIECE_CLASSES
 
 _FILES = "abcdefgh"
 
 
-def _piece_to_fen_char(piece) -> str:
-    if isinstance(piece, EmptySquare):
+def _piece_to_fen_char(code: int) -> str:
+    if code == EMPTY:
         raise ValueError("EmptySquare cannot be converted to FEN piece char")
 
-    if isinstance(piece, King):
-        ch = "k"
-    elif isinstance(piece, Queen):
-        ch = "q"
-    elif isinstance(piece, Rook):
-        ch = "r"
-    elif isinstance(piece, Bishop):
-        ch = "b"
-    elif isinstance(piece, Knight):
-        ch = "n"
-    elif isinstance(piece, Pawn):
-        ch = "p"
-    else:
-        raise TypeError(f"Unknown piece type: {type(piece)}")
-
-    return ch.upper() if piece.iswhite else ch
-
-
-def _board_placement() -> str:
+    cls = PIECE_CLASSES.get(code & TYPE_MASK)
+    if cls is None:
+        raise TypeError(f"Unknown piece code: {code}")
+
+    ch = cls.LETTER
+    return ch if code & BLACK else ch.upper()
+
+
+def _board_placement(squares) -> str:
     """
-    Board.board[x][y]
+    squares[x*8 + y]
       x=0 -> rank1
       x=7 -> rank8
     แต่ FEN ต้องเรียง rank8 -> rank1
@@ -41,78 +33,112 @@ def _board_placement() -> str:
         empty = 0
         row = []
         for y in range(8):
-            piece = Board.board[x][y].piece
-            if isinstance(piece, EmptySquare):
+            code = squares[x * 8 + y]
+            if code == EMPTY:
                 empty += 1
             else:
                 if empty:
                     row.append(str(empty))
                     empty = 0
-                row.append(_piece_to_fen_char(piece))
+                row.append(_piece_to_fen_char(code))
         if empty:
             row.append(str(empty))
         ranks.append("".join(row))
     return "/".join(ranks)
 
 
-def _castling_rights() -> str:
-    """
-    คำนวณสิทธิ์เข้าปราสาทจากตำแหน่งมาตรฐาน + flag moved
-    - White king e1: (0,4), rooks a1/h1: (0,0)/(0,7)
-    - Black king e8: (7,4), rooks a8/h8: (7,0)/(7,7)
+def to_fen(
+    side_to_move_iswhite: Optional[bool] = None,
+    halfmove_clock: Optional[int] = None,
+    fullmove_number: Optional[int] = None,
+    position=None,
+) -> str:
     """
-    rights = []
-
-    # White
-    wk = Board.board[0][4].piece
-    if isinstance(wk, King) and wk.iswhite and (not wk.moved):
-        wr_h = Board.board[0][7].piece
-        wr_a = Board.board[0][0].piece
-        if isinstance(wr_h, Rook) and wr_h.iswhite and (not wr_h.moved):
-            rights.append("K")
-        if isinstance(wr_a, Rook) and wr_a.iswhite and (not wr_a.moved):
-            rights.append("Q")
-
-    # Black
-    bk = Board.board[7][4].piece
-    if isinstance(bk, King) and (not bk.iswhite) and (not bk.moved):
-        br_h = Board.board[7][7].piece
-        br_a = Board.board[7][0].piece
-        if isinstance(br_h, Rook) and (not br_h.iswhite) and (not br_h.moved):
-            rights.append("k")
-        if isinstance(br_a, Rook) and (not br_a.iswhite) and (not br_a.moved):
-            rights.append("q")
-
-    return "".join(rights) if rights else "-"
-
-
-def _en_passant_target() -> str:
+    position=None -> ใช้กระดาน global เดิม (Board.position)
+    ค่าที่ไม่ได้ส่งมาจะอ่านจาก position (ฝ่ายที่ต้องเดิน / นาฬิกา)
     """
-    คืนค่า ep-target square สำหรับ FEN เช่น e3/e6 หรือ '-'
+    if position is None:
+        position = Board.position
+    if side_to_move_iswhite is None:
+        side_to_move_iswhite = position.white_to_move
+    if halfmove_clock is None:
+        halfmove_clock = position.halfmove_clock
+    if fullmove_number is None:
+        fullmove_number = position.fullmove_number
+
+    placement = _board_placement(position.squares)
+    active = "w" if side_to_move_iswhite else "b"
+    castling = position.castling_rights()
+    ep = position.en_passant_target()
+    return f"{placement} {active} {castling} {ep} {halfmove_clock} {fullmove_number}"
 
-    model ของคุณ:
-    - Pawn.en_passantable=True เมื่อเดิน 2 ช่อง
-    - white: x 1->3 (pawn อยู่ x=3) => target x=2 => rank3 => rank = x
-    - black: x 6->4 (pawn อยู่ x=4) => target x=5 => rank6 => rank = x+2
-    """
-    for x in range(8):
-        for y in range(8):
-            p = Board.board[x][y].piece
-            if isinstance(p, Pawn) and getattr(p, "en_passantable", False):
-                file_ = _FILES[y]
-                if p.iswhite:
-                    return f"{file_}{x}"
-                return f"{file_}{x + 2}"
-    return "-"
 
+# ตัวอักษร FEN -> code ตรง ๆ (ตัวใหญ่ = ขาว) ; ตัวเลข = จำนวนช่องว่าง
+_FEN_CODES = {}
+for _ptype, _cls in PIECE_CLASSES.items():
+    _FEN_CODES[_cls.LETTER.upper()] = _ptype
+    _FEN_CODES[_cls.LETTER] = _ptype | BLACK
+_EMPTY_RUNS = {str(n): n for n in range(1, 9)}
+_CASTLING_BITS = {"K": CASTLE_WK, "Q": CASTLE_WQ, "k": CASTLE_BK, "q": CASTLE_BQ}
 
-def to_fen(
-    side_to_move_iswhite: bool,
-    halfmove_clock: int = 0,
-    fullmove_number: int = 1,
-) -> str:
-    placement = _board_placement()
-    active = "w" if side_to_move_iswhite else "b"
-    castling = _castling_rights()
-    ep = _en_passant_target()
-    return f"{placement} {active} {castling} {ep} {halfmove_clock} {fullmove_number}"
\ No newline at end of file
+
+def from_fen(fen: str, position: Optional[Position] = None) -> Position:
+    """
+    ตั้ง position จาก FEN (รับแบบ 4 ช่องของ EPD ได้: ไม่มีนาฬิกา -> 0 / 1)
+    position=None -> สร้าง Position ใหม่ ; FEN ผิดรูปแบบ -> ValueError
+    """
+    fields = fen.split()
+    if len(fields) not in (4, 6):
+        raise ValueError(f"Invalid FEN (expected 4 or 6 fields): {fen!r}")
+    placement, active, castling, ep = fields[:4]
+
+    squares = bytearray(64)
+    rows = placement.split("/")
+    if len(rows) != 8:
+        raise ValueError(f"Invalid FEN placement: {placement!r}")
+    for i, row in enumerate(rows):
+        base = (7 - i) * 8
+        y = 0
+        for ch in row:
+            code = _FEN_CODES.get(ch)
+            if code is None:
+                run = _EMPTY_RUNS.get(ch)
+                if run is None:
+                    raise ValueError(f"Invalid FEN placement: {placement!r}")
+                y += run
+                continue
+            if y > 7:
+                raise ValueError(f"Invalid FEN placement: {placement!r}")
+            squares[base + y] = code
+            y += 1
+        if y != 8:
+            raise ValueError(f"Invalid FEN placement: {placement!r}")
+
+    if active not in ("w", "b"):
+        raise ValueError(f"Invalid FEN side to move: {active!r}")
+
+    rights = 0
+    if castling != "-":
+        for ch in castling:
+            bit = _CASTLING_BITS.get(ch)
+            if bit is None:
+                raise ValueError(f"Invalid FEN castling rights: {castling!r}")
+            rights |= bit
+
+    ep_square = -1
+    if ep != "-":
+        if len(ep) != 2 or ep[0] not in _FILES or ep[1] not in "36":
+            raise ValueError(f"Invalid FEN en passant square: {ep!r}")
+        ep_square = (int(ep[1]) - 1) * 8 + _FILES.index(ep[0])
+
+    halfmove_clock, fullmove_number = 0, 1
+    if len(fields) == 6:
+        try:
+            halfmove_clock, fullmove_number = int(fields[4]), int(fields[5])
+        except ValueError:
+            raise ValueError(f"Invalid FEN clocks: {fen!r}") from None
+
+    if position is None:
+        position = Position()
+    position.setup(squares, active == "w", rights, ep_square, halfmove_clock, fullmove_number)
+    return position
@@ -0,0 +1,149 @@
+"""
+load test ของ chess_core.server: เปิดหลาย connection แต่ละอันเล่นหลายเกมพร้อมกันด้วย move สุ่ม (จาก legal list ของ server)
+
+    python -m chess_core.server --port 8765 &
+    python -m chess_core.loadtest --port 8765 --clients 32 --games 4 --plies 60
+    python -m chess_core.loadtest --unix /tmp/chess.sock --engine-games 0.1 --movetime 0.05
+
+รายงาน: จำนวน move, moves/sec (นับ move ของ engine ที่ตอบกลับด้วย) และ latency ต่อ request "move" (p50 / p99 / max)
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+
+LINE_LIMIT = 1 << 16
+
+
+class Client:
+    """1 connection ; request ส่งต่อกันได้หลายอัน (pipelined) แล้วจับคู่ response ด้วย "id" """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader_task = asyncio.ensure_future(self._read())
+
+    async def request(self, op: str, **fields) -> dict:
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self.writer.write((json.dumps(dict(fields, op=op, id=request_id)) + "\n").encode())
+        await self.writer.drain()
+        return await future
+
+    async def _read(self) -> None:
+        try:
+            async for line in self.reader:
+                response = json.loads(line)
+                future = self._pending.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("server closed the connection"))
+
+    async def close(self) -> None:
+        self.writer.close()
+        self._reader_task.cancel()
+
+
+async def connect(args: argparse.Namespace) -> Client:
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix, limit=LINE_LIMIT)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port, limit=LINE_LIMIT)
+    return Client(reader, writer)
+
+
+class Stats:
+
+    def __init__(self) -> None:
+        self.moves = 0
+        self.games = 0
+        self.errors = 0
+        self.latencies: List[float] = []
+
+
+async def play_game(client: Client, args: argparse.Namespace, rng: random.Random, stats: Stats) -> None:
+    engine = rng.choice(("white", "black")) if rng.random() < args.engine_games else None
+    state = await client.request("new", engine=engine, movetime=args.movetime, legal=True)
+    if not state["ok"]:
+        stats.errors += 1
+        return
+    game = state["game"]
+    stats.moves += "reply" in state
+    while state["status"] == "ONGOING" and state["plies"] < args.plies and state["legal"]:
+        start = time.perf_counter()
+        state = await client.request("move", game=game, move=rng.choice(state["legal"]), legal=True)
+        stats.latencies.append(time.perf_counter() - start)
+        if not state["ok"]:
+            stats.errors += 1
+            break
+        stats.moves += 2 if state.get("reply") else 1
+    await client.request("close", game=game)
+    stats.games += 1
+
+
+async def run_client(args: argparse.Namespace, seed: int, stats: Stats) -> None:
+    client = await connect(args)
+    rng = random.Random(seed)
+    try:
+        # เกมทั้งหมดของ client ใช้ connection เดียวกัน (server ต้องจัดการ request ที่สลับกันหลายเกม)
+        await asyncio.gather(*(play_game(client, args, rng, stats) for _ in range(args.games)))
+    finally:
+        await client.close()
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run(args: argparse.Namespace) -> Stats:
+    stats = Stats()
+    await asyncio.gather(*(run_client(args, args.seed + i, stats) for i in range(args.clients)))
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chess_core.loadtest", description="load test for chess_core.server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="connect to a Unix socket path instead of TCP")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent connections")
+    parser.add_argument("--games", type=int, default=4, help="concurrent games per connection")
+    parser.add_argument("--plies", type=int, default=80, help="stop each game after this many plies")
+    parser.add_argument("--engine-games", type=float, default=0.0, help="fraction of games played against the engine")
+    parser.add_argument("--movetime", type=float, default=0.05, help="engine time per move (seconds)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        stats = asyncio.run(run(args))
+    except ConnectionError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    ms = [t * 1000 for t in stats.latencies]
+    print(f"{args.clients} clients x {args.games} games: {stats.games} games, {stats.moves} moves in {elapsed:.2f}s")
+    print(f"moves/sec: {stats.moves / elapsed:.0f}")
+    print(f"move latency: p50 {percentile(ms, 0.50):.2f} ms  p99 {percentile(ms, 0.99):.2f} ms  max {max(ms, default=0):.2f} ms")
+    if stats.errors:
+        print(f"errors: {stats.errors}")
+    return 0 if not stats.errors else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+from typing import Iterator, Optional
+
+from chess_core.pieces import PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, BLACK, TYPE_MASK
+from chess_core.position import Position
+from chess_core.board import can_castle_at, square_attacked
+from chess_core.attacks import (
+    KNIGHT_TARGETS,
+    KING_TARGETS,
+    ROOK_RAYS,
+    BISHOP_RAYS,
+    QUEEN_RAYS,
+    PAWN_ATTACKERS,
+    is_square_attacked,
+)
+from chess_core.moves import (
+    encode_move,
+    move_from,
+    parse_uci,
+    FLAG_CAPTURE,
+    FLAG_DOUBLE_PUSH,
+    FLAG_EN_PASSANT,
+    FLAG_CASTLE,
+    FLAG_PROMOTION,
+    PROMOTION_TYPES,
+)
+
+# ----- move generation backend -----
+# "mailbox": สร้าง move จาก Position.squares ด้วยตาราง offset ที่คำนวณไว้ล่วงหน้า
+# "bitboard": สร้าง legal move ทั้งฝ่ายในรอบเดียวด้วย bitboard (chess_core.bitboard)
+#             import ตอนเลือก backend นี้เท่านั้น (ตาราง BETWEEN ไม่ต้องสร้างตอนเปิดโปรแกรม)
+#             ช้ากว่า mailbox ใน CPython — ใช้ตรวจคำตอบของ mailbox (perft) ไม่ใช่เพื่อความเร็ว
+MOVE_BACKENDS = ("mailbox", "bitboard")
+_move_backend = "mailbox"
+_bitboard = None
+
+
+def set_move_backend(name: str) -> None:
+    global _move_backend, _bitboard
+    if name not in MOVE_BACKENDS:
+        raise ValueError(f"Unknown move backend: {name}")
+    if name == "bitboard" and _bitboard is None:
+        from chess_core import bitboard
+
+        _bitboard = bitboard
+    _move_backend = name
+
+
+def get_move_backend() -> str:
+    return _move_backend
+
+
+_SLIDER_RAYS = {BISHOP: BISHOP_RAYS, ROOK: ROOK_RAYS, QUEEN: QUEEN_RAYS}
+
+
+def _pawn_moves(position: Position, s: int, code: int) -> Iterator[int]:
+    squares = position.squares
+    black = code & BLACK
+    forward = -8 if black else 8
+    last_rank = 0 if black else 7
+    start_rank = 6 if black else 1
+
+    one = s + forward
+    promote = (one >> 3) == last_rank
+
+    if not squares[one]:
+        if promote:
+            for promo in PROMOTION_TYPES:
+                yield encode_move(s, one, FLAG_PROMOTION, promo)
+        else:
+            yield encode_move(s, one)
+            two = one + forward
+            if (s >> 3) == start_rank and not squares[two]:
+                yield encode_move(s, two, FLAG_DOUBLE_PUSH)
+
+    for dy in (-1, 1):
+        y = (s & 7) + dy
+        if not 0 <= y < 8:
+            continue
+        t = one + dy
+        target = squares[t]
+        if target and (target & BLACK) != black:
+            if promote:
+                for promo in PROMOTION_TYPES:
+                    yield encode_move(s, t, FLAG_CAPTURE | FLAG_PROMOTION, promo)
+            else:
+                yield encode_move(s, t, FLAG_CAPTURE)
+        elif t == position.ep_square and not target:
+            yield encode_move(s, t, FLAG_CAPTURE | FLAG_EN_PASSANT)
+
+
+def generate_pseudo_moves(position: Position, iswhite: bool, from_square: Optional[int] = None) -> Iterator[int]:
+    """move ตามรูปแบบหมาก (ยังไม่ตรวจว่าคิงตัวเองโดนเช็ค) ; from_square=None -> ทุกตัวของฝ่ายนั้น"""
+
+    squares = position.squares
+    side = 0 if iswhite else BLACK
+    origins = range(64) if from_square is None else (from_square,)
+
+    for s in origins:
+        code = squares[s]
+        if not code or (code & BLACK) != side:
+            continue
+        ptype = code & TYPE_MASK
+
+        if ptype == PAWN:
+            yield from _pawn_moves(position, s, code)
+            continue
+
+        if ptype == KNIGHT or ptype == KING:
+            for t in (KNIGHT_TARGETS if ptype == KNIGHT else KING_TARGETS)[s]:
+                target = squares[t]
+                if not target:
+                    yield encode_move(s, t)
+                elif (target & BLACK) != side:
+                    yield encode_move(s, t, FLAG_CAPTURE)
+            if ptype == KING:
+                for t in (s + 2, s - 2):
+                    if 0 <= t < 64 and can_castle_at(position, s, t):
+                        yield encode_move(s, t, FLAG_CASTLE)
+            continue
+
+        for ray in _SLIDER_RAYS[ptype]:
+            for t in ray[s]:
+                target = squares[t]
+                if not target:
+                    yield encode_move(s, t)
+                    continue
+                if (target & BLACK) != side:
+                    yield encode_move(s, t, FLAG_CAPTURE)
+                break
+
+
+def _is_legal(position: Position, move: int, iswhite: bool) -> bool:
+    # ลองเดินแล้ว unmake (ใช้เฉพาะ en passant ซึ่งเกิดไม่บ่อย)
+    position.make_move(move)
+    king = position.king_square(iswhite)
+    legal = king < 0 or not square_attacked(position, king, not iswhite)
+    position.unmake_move()
+    return legal
+
+
+def checks_and_pins(squares, king: int, iswhite: bool):
+    """
+    คำนวณครั้งเดียวต่อ position:
+    - checkers: ช่องของหมากฝ่ายตรงข้ามที่กำลังเช็คคิง
+    - evasion: ช่องที่ move (ที่ไม่ใช่คิง) ต้องไปลงเพื่อแก้เช็ค 1 ตัว (กินตัวที่เช็ค / บังแนว)
+    - pins: {ช่องหมากที่ถูก pin: ช่องบนแนว pin ที่ยังเดินได้ (รวมกินตัวที่ pin)}
+    """
+    side = 0 if iswhite else BLACK
+    enemy = BLACK if iswhite else 0
+    checkers = []
+    evasion = set()
+    pins = {}
+
+    knight = KNIGHT | enemy
+    for s in KNIGHT_TARGETS[king]:
+        if squares[s] == knight:
+            checkers.append(s)
+            evasion.add(s)
+
+    pawn = PAWN | enemy
+    for s in PAWN_ATTACKERS[1 if iswhite else 0][king]:
+        if squares[s] == pawn:
+            checkers.append(s)
+            evasion.add(s)
+
+    for rays, slider in ((ROOK_RAYS, ROOK | enemy), (BISHOP_RAYS, BISHOP | enemy)):
+        queen = QUEEN | enemy
+        for ray in rays:
+            pinned = -1
+            path = []
+            for s in ray[king]:
+                code = squares[s]
+                path.append(s)
+                if not code:
+                    continue
+                if (code & BLACK) == side:
+                    if pinned >= 0:
+                        break  # หมากตัวเองสองตัวขวางอยู่: ไม่มี pin
+                    pinned = s
+                    continue
+                if code == slider or code == queen:
+                    if pinned < 0:
+                        checkers.append(s)
+                        evasion.update(path)
+                    else:
+                        pins[pinned] = set(path)
+                break
+
+    return checkers, evasion, pins
+
+
+def generate_legal_moves(
+    position: Position,
+    from_square: Optional[int] = None,
+    iswhite: Optional[bool] = None,
+) -> Iterator[int]:
+    """
+    yield legal move (int ดู chess_core.moves) ของฝ่ายที่ต้องเดิน
+    - from_square: จำกัดเฉพาะหมากตัวนั้น (index = x*8 + y)
+    - iswhite: None -> position.white_to_move
+    ห้ามแก้ position ระหว่างวน iterator (pin / check คำนวณไว้ตอนเริ่ม)
+    """
+    if iswhite is None:
+        iswhite = position.white_to_move
+
+    if _move_backend == "bitboard":
+        for move in _bitboard.generate_moves(position, iswhite):
+            if from_square is None or move_from(move) == from_square:
+                yield move
+        return
+
+    squares = position.squares
+    king = position.king_square(iswhite)
+    if king < 0:
+        # กระดานทดลองที่ไม่มีคิง: ไม่มีอะไรให้ตรวจ
+        yield from generate_pseudo_moves(position, iswhite, from_square)
+        return
+
+    checkers, evasion, pins = checks_and_pins(squares, king, iswhite)
+    double_check = len(checkers) > 1
+    if double_check and from_square is None:
+        from_square = king  # โดนเช็คสองทาง: เดินได้แต่คิง
+
+    king_code = squares[king]
+    enemy_white = not iswhite
+
+    for move in generate_pseudo_moves(position, iswhite, from_square):
+        s = move & 63
+        t = (move >> 6) & 63
+
+        if s == king:
+            # ยกคิงออกก่อนตรวจ เพื่อไม่ให้คิงบังแนว sliding piece ของตัวเอง
+            squares[king] = 0
+            attacked = is_square_attacked(squares, t, enemy_white)
+            squares[king] = king_code
+            if not attacked:
+                yield move
+            continue
+
+        if double_check:
+            continue
+        if (move >> 12) & FLAG_EN_PASSANT:
+            # en passant เอา pawn ออกสองตัวจาก rank เดียวกัน — ลองเดินจริงง่ายกว่า
+            if _is_legal(position, move, iswhite):
+                yield move
+            continue
+        if checkers and t not in evasion:
+            continue
+        pin = pins.get(s)
+        if pin is not None and t not in pin:
+            continue
+        yield move
+
+
+def parse_uci_move(position: Position, token: str) -> int:
+    """UCI ('e2e4' / 'e7e8q') -> legal move ของฝ่ายที่ต้องเดิน ; ผิดรูปแบบหรือไม่ legal -> ValueError"""
+    s, t, promotion = parse_uci(token)
+    # สร้างเฉพาะ move ของหมากตัวที่เดิน (เร็วกว่าสร้างทั้งกระดาน)
+    for move in generate_legal_moves(position, s):
+        if (move >> 6) & 63 == t and (move >> 17) == promotion:
+            return move
+    raise ValueError(f"Illegal UCI move: {token!r}")
+
+
+# ----- game status (ไม่แก้ state ของเกม: ไม่มี SAN / FEN / clocks) -----
+ONGOING = "ONGOING"
+CHECK = "CHECK"
+CHECKMATE = "CHECKMATE"
+STALEMATE = "STALEMATE"
+
+
+def has_any_legal_move(position: Position, iswhite: Optional[bool] = None) -> bool:
+    # หยุดทันทีที่เจอ legal move ตัวแรก
+    for _move in generate_legal_moves(position, None, iswhite):
+        return True
+    return False
+
+
+def in_check(position: Position, iswhite: Optional[bool] = None) -> bool:
+    if iswhite is None:
+        iswhite = position.white_to_move
+    king = position.king_square(iswhite)
+    return king >= 0 and square_attacked(position, king, not iswhite)
+
+
+def game_status(position: Position) -> str:
+    """สถานะของฝ่ายที่ต้องเดิน: ONGOING / CHECK / CHECKMATE / STALEMATE"""
+    iswhite = position.white_to_move
+    checked = in_check(position, iswhite)
+    if has_any_legal_move(position, iswhite):
+        return CHECK if checked else ONGOING
+    return CHECKMATE if checked else STALEMATE
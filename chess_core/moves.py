@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import re
+
+from chess_core.pieces import QUEEN, ROOK, BISHOP, KNIGHT
+
+_FILES = "abcdefgh"
+
+# move แทนด้วย int เดียว (ไม่สร้าง object ต่อ move):
+#   bit 0-5   from square (index = x*8 + y)
+#   bit 6-11  to square
+#   bit 12-16 flags
+#   bit 17-19 piece type ที่ promote (0 = ไม่ promote)
+FLAG_CAPTURE = 1
+FLAG_DOUBLE_PUSH = 2
+FLAG_EN_PASSANT = 4
+FLAG_CASTLE = 8
+FLAG_PROMOTION = 16
+
+PROMOTION_TYPES = (QUEEN, ROOK, BISHOP, KNIGHT)
+_PROMOTION_LETTERS = {QUEEN: "q", ROOK: "r", BISHOP: "b", KNIGHT: "n"}
+_PROMOTION_FROM_LETTER = {v: k for k, v in _PROMOTION_LETTERS.items()}
+# token ที่หน้าตาเป็น UCI (ใช้แยกจาก SAN ตอนรับ move ได้ทั้งสองแบบ)
+UCI_RE = re.compile(r"[a-h][1-8][a-h][1-8][qrbnQRBN]?")
+
+
+def encode_move(s: int, t: int, flags: int = 0, promotion: int = 0) -> int:
+    return s | (t << 6) | (flags << 12) | (promotion << 17)
+
+
+def move_from(move: int) -> int:
+    return move & 63
+
+
+def move_to(move: int) -> int:
+    return (move >> 6) & 63
+
+
+def move_flags(move: int) -> int:
+    return (move >> 12) & 31
+
+
+def move_promotion(move: int) -> int:
+    return move >> 17
+
+
+def move_to_uci(move: int) -> str:
+    s = move & 63
+    t = (move >> 6) & 63
+    uci = f"{_FILES[s & 7]}{(s >> 3) + 1}{_FILES[t & 7]}{(t >> 3) + 1}"
+    promotion = move >> 17
+    if promotion:
+        uci += _PROMOTION_LETTERS[promotion]
+    return uci
+
+
+def parse_uci(uci: str):
+    """'e2e4' / 'e7e8q' -> (from, to, promotion type) ; ผิดรูปแบบ -> ValueError"""
+    uci = uci.strip()
+    if len(uci) not in (4, 5) or uci[0] not in _FILES or uci[2] not in _FILES:
+        raise ValueError(f"Invalid UCI move: {uci!r}")
+    if uci[1] not in "12345678" or uci[3] not in "12345678":
+        raise ValueError(f"Invalid UCI move: {uci!r}")
+    s = (int(uci[1]) - 1) * 8 + _FILES.index(uci[0])
+    t = (int(uci[3]) - 1) * 8 + _FILES.index(uci[2])
+    promotion = 0
+    if len(uci) == 5:
+        promotion = _PROMOTION_FROM_LETTER.get(uci[4].lower(), 0)
+        if not promotion:
+            raise ValueError(f"Invalid promotion in UCI move: {uci!r}")
+    return s, t, promotion
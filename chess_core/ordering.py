@@ -0,0 +1,101 @@
+"""
+เรียง move ก่อน search (alpha-beta ตัดได้มากเมื่อ move ที่ดีมาก่อน)
+
+    hash move (จาก TT)  >  capture / promotion ตาม MVV-LVA  >  killer ของ ply นั้น  >  quiet ตาม history
+
+MVV-LVA ใช้ Piece.VALUE จาก pieces.py: กินหมากที่แพงที่สุดด้วยหมากที่ถูกที่สุดก่อน
+killer = quiet move ที่ทำ beta cutoff ล่าสุดที่ ply เดียวกัน (2 ช่อง) ; history = คะแนนสะสม [หมาก][ช่องปลายทาง]
+"""
+from __future__ import annotations
+
+from typing import List
+
+from chess_core.pieces import PIECE_CLASSES, PAWN, QUEEN, TYPE_MASK
+from chess_core.moves import FLAG_CAPTURE, FLAG_PROMOTION
+
+_HASH_SCORE = 1 << 30
+_CAPTURE_SCORE = 1 << 24
+_KILLER_SCORES = (1 << 23, (1 << 23) - 1)
+_HISTORY_MAX = 1 << 20  # history ต้องต่ำกว่า killer เสมอ ; เกินนี้ลดทั้งตารางลงครึ่งหนึ่ง
+
+_VALUE = [0] * 8
+for _ptype, _cls in PIECE_CLASSES.items():
+    _VALUE[_ptype] = _cls.VALUE
+
+# MVV_LVA[victim][attacker] ; victim 0 = ไม่มี (promotion เฉย ๆ)
+MVV_LVA = [[_VALUE[v] * 1000 - _VALUE[a] for a in range(8)] for v in range(8)]
+
+
+class MoveOrderer:
+    """killer / history ของ Engine 1 ตัว + ตัวนับ cutoff (ดูว่า move แรกตัดได้บ่อยแค่ไหน)"""
+
+    def __init__(self, max_ply: int) -> None:
+        self.max_ply = max_ply
+        self.killers = [[0, 0] for _ in range(max_ply + 2)]
+        self.history = [0] * (16 * 64)  # [code * 64 + to]
+        self.reset_stats()
+
+    def new_search(self) -> None:
+        # killer ผูกกับ ply ของ search ก่อน -> ล้าง ; history ยังใช้ได้แต่ลดน้ำหนักลง
+        for slots in self.killers:
+            slots[0] = slots[1] = 0
+        self.history = [h >> 1 for h in self.history]
+        self.reset_stats()
+
+    # ----- stats -----
+    def reset_stats(self) -> None:
+        self.cutoff_nodes = 0
+        self.first_move_cutoffs = 0
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """สัดส่วน node ที่ beta cutoff เกิดจาก move แรก (ยิ่งใกล้ 1 ยิ่งเรียงดี)"""
+        return self.first_move_cutoffs / self.cutoff_nodes if self.cutoff_nodes else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "cutoff_nodes": self.cutoff_nodes,
+            "first_move_cutoffs": self.first_move_cutoffs,
+            "first_move_cutoff_rate": self.first_move_cutoff_rate,
+        }
+
+    # ----- ordering -----
+    def order(self, squares, moves: List[int], ply: int, hash_move: int = 0) -> List[int]:
+        killer1, killer2 = self.killers[ply]
+        history = self.history
+
+        def score(m: int) -> int:
+            if m == hash_move:
+                return _HASH_SCORE
+            flags = (m >> 12) & 31
+            if flags & (FLAG_CAPTURE | FLAG_PROMOTION):
+                # en passant: ช่องปลายทางว่าง แต่กิน pawn
+                victim = squares[(m >> 6) & 63] & TYPE_MASK or (PAWN if flags & FLAG_CAPTURE else 0)
+                s = _CAPTURE_SCORE + MVV_LVA[victim][squares[m & 63] & TYPE_MASK]
+                if m >> 17 == QUEEN:
+                    s += _VALUE[QUEEN] * 1000
+                return s
+            if m == killer1:
+                return _KILLER_SCORES[0]
+            if m == killer2:
+                return _KILLER_SCORES[1]
+            return history[(squares[m & 63] << 6) | ((m >> 6) & 63)]
+
+        moves.sort(key=score, reverse=True)
+        return moves
+
+    def cutoff(self, squares, move: int, ply: int, depth: int, move_index: int) -> None:
+        """beta cutoff ที่ move นี้ — เรียกหลัง unmake (squares ต้องเป็นสภาพก่อนเดิน move)"""
+        self.cutoff_nodes += 1
+        if move_index == 0:
+            self.first_move_cutoffs += 1
+        if (move >> 12) & (FLAG_CAPTURE | FLAG_PROMOTION):
+            return  # capture เรียงด้วย MVV-LVA อยู่แล้ว
+        slots = self.killers[ply]
+        if slots[0] != move:
+            slots[1] = slots[0]
+            slots[0] = move
+        index = (squares[move & 63] << 6) | ((move >> 6) & 63)
+        self.history[index] += depth * depth
+        if self.history[index] > _HISTORY_MAX:
+            self.history = [h >> 1 for h in self.history]
@@ -0,0 +1,145 @@
+"""
+perft / วิเคราะห์ FEN จำนวนมากแบบขนานด้วย ProcessPoolExecutor
+แต่ละ task ส่งแค่ FEN + move (int) ไปให้ worker สร้าง Position ของตัวเอง (ไม่ใช้กระดาน global)
+
+    python -m chess_core.perft --depth 5 --workers 8
+    python -m chess_core.perft --fen-file positions.epd --depth 3 --workers 8 --chunksize 64
+"""
+from __future__ import annotations
+
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from chess_core.fen import from_fen
+from chess_core.moves import move_to_uci
+from chess_core.movegen import (
+    generate_legal_moves,
+    game_status,
+    set_move_backend,
+    get_move_backend,
+    CHECK,
+    CHECKMATE,
+)
+from chess_core.perft import perft
+
+
+def _perft_task(task: Tuple[str, Tuple[int, ...], int, str]) -> int:
+    fen, path, depth, backend = task
+    set_move_backend(backend)
+    position = from_fen(fen)
+    for move in path:
+        position.make_move(move)
+    return perft(position, depth - len(path))
+
+
+def _split(fen: str, depth: int, min_tasks: int) -> List[Tuple[int, ...]]:
+    """
+    แตก tree เป็น task: เริ่มจาก root move แต่ละตัว ถ้ายังน้อยกว่า min_tasks (เช่น position ที่มี root move
+    ไม่กี่ตัว) แตกต่ออีก 1 ply เพื่อให้ worker ได้งานใกล้เคียงกัน
+    """
+    position = from_fen(fen)
+    paths = [(move,) for move in generate_legal_moves(position)]
+    if len(paths) >= min_tasks or depth < 3:
+        return paths
+
+    deeper = []
+    for (move,) in paths:
+        position.make_move(move)
+        replies = list(generate_legal_moves(position))
+        position.unmake_move()
+        if replies:
+            deeper.extend((move, reply) for reply in replies)
+        else:
+            deeper.append((move,))  # mate / stalemate: ไม่มีอะไรให้แตกต่อ
+    return deeper
+
+
+def parallel_divide(
+    fen: str,
+    depth: int,
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+) -> List[Tuple[str, int]]:
+    """เหมือน perft.divide แต่กระจาย subtree ไปหลาย process แล้วรวมผลตาม root move"""
+    if depth < 1:
+        raise ValueError("depth must be >= 1")
+    backend = get_move_backend()
+    paths = _split(fen, depth, min_tasks=4 * (workers or 1))
+    tasks = [(fen, path, depth, backend) for path in paths]
+
+    totals: Dict[int, int] = OrderedDict()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path, nodes in zip(paths, pool.map(_perft_task, tasks, chunksize=chunksize)):
+            totals[path[0]] = totals.get(path[0], 0) + nodes
+    return [(move_to_uci(move), nodes) for move, nodes in totals.items()]
+
+
+def parallel_perft(fen: str, depth: int, workers: Optional[int] = None, chunksize: int = 1) -> int:
+    if depth <= 0:
+        return 1
+    return sum(nodes for _uci, nodes in parallel_divide(fen, depth, workers, chunksize))
+
+
+# ----- batch: FEN หลายตัว -----
+def _run_chunk(fn: Callable, chunk: list) -> list:
+    return [fn(item) for item in chunk]
+
+
+def chunked_map(fn: Callable, items: Iterable, workers: Optional[int], chunksize: int) -> Iterator:
+    """
+    เหมือน pool.map(..., chunksize) แต่อ่าน input ทีละช่วง: มีงานค้างไม่เกิน 2 chunk ต่อ worker
+    (pool.map ดึง input ทั้งหมดมาสร้าง task ก่อน — ไฟล์ FEN ใหญ่ ๆ จะกิน memory)
+    ผลลัพธ์ออกตามลำดับ input
+    """
+    workers = workers or os.cpu_count() or 1
+    window = 2 * workers
+    it = iter(items)
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            while len(pending) < window:
+                chunk = list(islice(it, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_run_chunk, fn, chunk))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
+def _fen_perft_task(task: Tuple[str, int, str]) -> Tuple[str, int]:
+    fen, depth, backend = task
+    set_move_backend(backend)
+    return fen, perft(from_fen(fen), depth)
+
+
+def analyze_fen(fen: str) -> dict:
+    """สรุป position เดียว: สถานะเกม, จำนวน legal move, legal move (UCI)"""
+    position = from_fen(fen)
+    moves = [move_to_uci(m) for m in generate_legal_moves(position)]
+    status = game_status(position)
+    return {
+        "fen": fen,
+        "status": status,
+        "in_check": status in (CHECK, CHECKMATE),
+        "legal_moves": len(moves),
+        "moves": moves,
+    }
+
+
+def batch_perft(
+    fens: Iterable[str],
+    depth: int,
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+) -> Iterator[Tuple[str, int]]:
+    """yield (fen, nodes) ตามลำดับ input ; chunksize = จำนวน FEN ต่อการส่งงาน 1 ครั้งไปยัง worker"""
+    backend = get_move_backend()
+    yield from chunked_map(_fen_perft_task, ((fen, depth, backend) for fen in fens), workers, chunksize)
+
+
+def batch_analyze(fens: Iterable[str], workers: Optional[int] = None, chunksize: int = 64) -> Iterator[dict]:
+    yield from chunked_map(analyze_fen, fens, workers, chunksize)
@@ -0,0 +1,176 @@
+"""
+perft: นับจำนวน node ของ move tree ถึงความลึกที่กำหนด ใช้ตรวจความถูกต้องของ movegen และวัดความเร็ว
+
+    python -m chess_core.perft --fen "<FEN>" --depth 4 --divide
+    python -m chess_core.perft --suite --depth 3
+    python -m chess_core.perft --suite --backend bitboard     (ตรวจไขว้กับ generator อีกตัว ; ช้ากว่า mailbox)
+    python -m chess_core.perft --depth 5 --workers 8            (แบ่ง root move ไปหลาย process)
+    python -m chess_core.perft --fen-file positions.fen --depth 3 --workers 8
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from chess_core.position import Position
+from chess_core.fen import from_fen
+from chess_core.moves import move_to_uci
+from chess_core.movegen import generate_legal_moves, set_move_backend, MOVE_BACKENDS
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# (ชื่อ, FEN, จำนวน node ที่ depth 1, 2, 3, ...) — ค่ามาตรฐานจาก chessprogramming wiki / ชุดทดสอบของ TalkChess
+SUITE: List[Tuple[str, str, List[int]]] = [
+    ("start", START_FEN, [20, 400, 8902, 197281, 4865609]),
+    ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+     [48, 2039, 97862, 4085603]),
+    ("position3", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", [14, 191, 2812, 43238, 674624]),
+    ("position4", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+     [6, 264, 9467, 422333]),
+    ("position5", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", [44, 1486, 62379, 2103487]),
+    ("position6", "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+     [46, 2079, 89890, 3894594]),
+    # edge cases: en passant / castling / promotion / stalemate
+    ("illegal-ep-1", "3k4/3p4/8/K1P4r/8/8/8/8 b - - 0 1", [18, 92, 1670, 10138, 185429, 1134888]),
+    ("illegal-ep-2", "8/8/4k3/8/2p5/8/B2P2K1/8 w - - 0 1", [13, 102, 1266, 10276, 135655, 1015133]),
+    ("ep-gives-check", "8/8/1k6/2b5/2pP4/8/5K2/8 b - d3 0 1", [15, 126, 1928, 13931, 206379, 1440467]),
+    ("short-castle-check", "5k2/8/8/8/8/8/8/4K2R w K - 0 1", [15, 66, 1198, 6399, 120330, 661072]),
+    ("long-castle-check", "3k4/8/8/8/8/8/8/R3K3 w Q - 0 1", [16, 71, 1286, 7418, 141077, 803711]),
+    ("castle-rights", "r3k2r/1b4bq/8/8/8/8/7B/R3K2R w KQkq - 0 1", [26, 1141, 27826, 1274206]),
+    ("castle-prevented", "r3k2r/8/3Q4/8/8/5q2/8/R3K2R b KQkq - 0 1", [44, 1494, 50509, 1720476]),
+    ("promote-out-of-check", "2K2r2/4P3/8/8/8/8/8/3k4 w - - 0 1", [11, 133, 1442, 19174, 266199, 3821001]),
+    ("discovered-check", "8/8/1P2K3/8/2n5/1q6/8/5k2 b - - 0 1", [29, 165, 5160, 31961, 1004658]),
+    ("promote-check", "4k3/1P6/8/8/8/8/K7/8 w - - 0 1", [9, 40, 472, 2661, 38983, 217342]),
+    ("underpromote-check", "8/P1k5/K7/8/8/8/8/8 w - - 0 1", [6, 27, 273, 1329, 18135, 92683]),
+    ("self-stalemate", "K1k5/8/P7/8/8/8/8/8 w - - 0 1", [2, 6, 13, 63, 382, 2217]),
+    ("stalemate-checkmate", "8/k1P5/8/1K6/8/8/8/8 w - - 0 1", [10, 25, 268, 926, 10857, 43261, 567584]),
+    ("double-check", "8/8/2k5/5q2/5n2/8/5K2/8 b - - 0 1", [37, 183, 6559, 23527]),
+]
+
+
+def perft(position: Position, depth: int) -> int:
+    """จำนวน leaf node ที่ความลึก depth (depth 1 นับจากความยาว move list เลย ไม่ต้องเดินจริง)"""
+    if depth <= 0:
+        return 1
+    moves = list(generate_legal_moves(position))
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        position.make_move(move)
+        nodes += perft(position, depth - 1)
+        position.unmake_move()
+    return nodes
+
+
+def divide(position: Position, depth: int) -> List[Tuple[str, int]]:
+    """[(uci, จำนวน node ใต้ move นั้น)] ของทุก root move — ใช้หา move ที่นับผิดเทียบกับ engine อื่น"""
+    result = []
+    for move in list(generate_legal_moves(position)):
+        position.make_move(move)
+        result.append((move_to_uci(move), perft(position, depth - 1)))
+        position.unmake_move()
+    return result
+
+
+def _report(nodes: int, elapsed: float) -> None:
+    nps = nodes / elapsed if elapsed > 0 else 0.0
+    print(f"Nodes: {nodes}")
+    print(f"Time: {elapsed:.3f} s")
+    print(f"NPS: {nps:,.0f}")
+
+
+def run_suite(max_depth: int) -> bool:
+    ok = True
+    total_nodes = 0
+    total_time = 0.0
+    for name, fen, counts in SUITE:
+        position = from_fen(fen)
+        for depth, expected in enumerate(counts[:max_depth], start=1):
+            start = time.perf_counter()
+            nodes = perft(position, depth)
+            elapsed = time.perf_counter() - start
+            total_nodes += nodes
+            total_time += elapsed
+            status = "ok" if nodes == expected else "FAIL"
+            if nodes != expected:
+                ok = False
+            print(f"{name:<20} depth {depth}: {nodes:>10} (expected {expected:>10}) {elapsed:8.3f} s  {status}")
+    _report(total_nodes, total_time)
+    return ok
+
+
+def _run_fen_file(path: str, depth: int, workers: int, chunksize: int) -> int:
+    from chess_core.parallel import batch_perft
+    from chess_core.epd import read_fens
+
+    start = time.perf_counter()
+    total = 0
+    fens = read_fens(path)  # EPD ก็ได้ (ตัด operations ทิ้ง)
+    if workers > 1:
+        results = batch_perft(fens, depth, workers, chunksize)
+    else:
+        results = ((fen, perft(from_fen(fen), depth)) for fen in fens)
+    for fen, nodes in results:
+        total += nodes
+        print(f"{nodes:>12}  {fen}")
+    _report(total, time.perf_counter() - start)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chess_core.perft", description="perft node count / benchmark")
+    parser.add_argument("--fen", default=START_FEN, help="position (default: start position)")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--divide", action="store_true", help="print node count per root move")
+    parser.add_argument("--suite", action="store_true", help="run the standard positions with known counts")
+    parser.add_argument(
+        "--backend",
+        choices=MOVE_BACKENDS,
+        default="mailbox",
+        help="move generator; bitboard is an independent cross-check and is slower than mailbox in CPython",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="process count (>1 = chess_core.parallel)")
+    parser.add_argument("--chunksize", type=int, default=None, help="tasks per worker submission")
+    parser.add_argument("--fen-file", help="perft every FEN/EPD line in this file")
+    args = parser.parse_args(argv)
+
+    set_move_backend(args.backend)
+
+    if args.suite:
+        return 0 if run_suite(args.depth) else 1
+
+    if args.fen_file:
+        return _run_fen_file(args.fen_file, args.depth, args.workers, args.chunksize or 16)
+
+    try:
+        position = from_fen(args.fen)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    start = time.perf_counter()
+    if args.workers > 1:
+        from chess_core.parallel import parallel_divide
+
+        rows = parallel_divide(args.fen, args.depth, args.workers, args.chunksize or 1)
+        if args.divide:
+            for uci, count in rows:
+                print(f"{uci}: {count}")
+            print()
+        nodes = sum(count for _uci, count in rows)
+    elif args.divide:
+        rows = divide(position, args.depth)
+        for uci, count in rows:
+            print(f"{uci}: {count}")
+        print()
+        nodes = sum(count for _uci, count in rows)
+    else:
+        nodes = perft(position, args.depth)
+    _report(nodes, time.perf_counter() - start)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
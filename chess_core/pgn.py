@@ -0,0 +1,259 @@
+"""
+PGN: เขียนเกม (tags + SAN จาก SanHistory + ผลจาก GameState) และอ่านไฟล์ PGN ทีละเกมแบบ streaming
+
+    with open("games.pgn", "w", encoding="utf-8") as f:
+        write_game(f, position, tags={"White": "A", "Black": "B"})
+
+    for game in read_pgn("archive.pgn"):
+        if game.error: ...
+
+benchmark การอ่าน (ตรวจทุก move กับ engine):
+    python -m chess_core.pgn archive.pgn [--no-validate]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+from chess_core.position import Position
+from chess_core.game_state import GameState
+from chess_core.san_history import SanHistory
+from chess_core.fen import from_fen
+from chess_core.san import parse_san
+from chess_core.epd import peak_rss_mb
+
+Source = Union[str, "os.PathLike[str]", TextIO]
+
+RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+_SEVEN_TAGS = ("Event", "Site", "Date", "Round", "White", "Black", "Result")
+
+_TAG_RE = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+# comment {...} / ; ถึงท้ายบรรทัด / NAG / variation / เลข move / token อื่น (SAN, ผลเกม)
+_TOKEN_RE = re.compile(r"\{[^}]*\}|;[^\n]*|\$\d+|[()]|\d+\.+|[^\s(){};$]+")
+
+
+# ----- writer -----
+def result_from_state(state: GameState) -> str:
+    """แปลง GameState.result_text ('Checkmate: White wins' / 'Draw by ...') เป็นผลแบบ PGN"""
+    text = state.result_text
+    if not state.game_over or not text:
+        return "*"
+    if text.startswith("Draw"):
+        return "1/2-1/2"
+    if "White wins" in text:
+        return "1-0"
+    if "Black wins" in text:
+        return "0-1"
+    return "*"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def format_game(
+    history: SanHistory,
+    state: GameState,
+    tags: Optional[Dict[str, str]] = None,
+    start_fen: Optional[str] = None,
+    line_width: int = 80,
+) -> str:
+    """PGN 1 เกม (seven tag roster + tag เพิ่มเติม + movetext ตัดบรรทัดที่ line_width)"""
+    result = result_from_state(state)
+    header = {
+        "Event": "?",
+        "Site": "?",
+        "Date": date.today().strftime("%Y.%m.%d"),
+        "Round": "?",
+        "White": "?",
+        "Black": "?",
+    }
+    if tags:
+        header.update(tags)
+    header["Result"] = result
+
+    white_first, move_no = True, 1
+    if start_fen and start_fen != START_FEN:
+        header["SetUp"] = "1"
+        header["FEN"] = start_fen
+        fields = start_fen.split()
+        white_first = fields[1] == "w"
+        move_no = int(fields[5]) if len(fields) == 6 else 1
+
+    ordered = list(_SEVEN_TAGS) + [k for k in header if k not in _SEVEN_TAGS]
+    lines = [f'[{key} "{_escape(header[key])}"]' for key in ordered]
+    lines.append("")
+
+    tokens: List[str] = []
+    iswhite = white_first
+    for i, san in enumerate(history.sans):
+        # เลข move ติดกับ SAN เสมอ (ไม่ถูกตัดบรรทัดแยกกัน)
+        if iswhite:
+            tokens.append(f"{move_no}. {san}")
+        elif i == 0:
+            tokens.append(f"{move_no}... {san}")
+        else:
+            tokens.append(san)
+        if not iswhite:
+            move_no += 1
+        iswhite = not iswhite
+    tokens.append(result)
+
+    row = ""
+    for token in tokens:
+        if row and len(row) + 1 + len(token) > line_width:
+            lines.append(row)
+            row = token
+        else:
+            row = f"{row} {token}" if row else token
+    lines.append(row)
+    return "\n".join(lines) + "\n\n"
+
+
+def write_game(
+    out: TextIO,
+    position: Position,
+    tags: Optional[Dict[str, str]] = None,
+    start_fen: Optional[str] = None,
+) -> None:
+    out.write(format_game(position.history, position.state, tags, start_fen))
+
+
+# ----- reader -----
+@dataclass
+class PgnGame:
+    tags: Dict[str, str] = field(default_factory=dict)
+    sans: List[str] = field(default_factory=list)
+    result: str = "*"
+    # validate=True: move (int) ที่ตรวจกับ engine แล้ว + FEN สุดท้าย ; error = move แรกที่ไม่ legal
+    moves: List[int] = field(default_factory=list)
+    final_fen: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _movetext_tokens(text: str) -> Tuple[List[str], Optional[str]]:
+    # ข้าม comment / NAG / variation (ซ้อนกันได้) เหลือแต่ SAN ของเส้นหลัก
+    sans: List[str] = []
+    result = None
+    depth = 0
+    for token in _TOKEN_RE.findall(text):
+        first = token[0]
+        if first == "(":
+            depth += 1
+        elif first == ")":
+            depth = max(depth - 1, 0)
+        elif depth or first in "{;$" or first.isdigit() and token.endswith("."):
+            continue
+        elif token in RESULTS:
+            result = token
+        else:
+            sans.append(token)
+    return sans, result
+
+
+def _validate(game: PgnGame, position: Position) -> None:
+    fen = game.tags.get("FEN", START_FEN)
+    try:
+        from_fen(fen, position)
+    except ValueError as exc:
+        game.error = f"bad FEN tag: {exc}"
+        return
+    for ply, san in enumerate(game.sans, start=1):
+        try:
+            move = parse_san(position, san)
+        except ValueError as exc:
+            game.error = f"ply {ply}: {exc}"
+            return
+        position.make_move(move)
+        game.moves.append(move)
+    game.final_fen = position.to_fen()
+
+
+def _raw_games(lines) -> Iterator[Tuple[Dict[str, str], str]]:
+    # แบ่งไฟล์เป็นเกม: tag section + movetext ; เกมจบเมื่อเจอผลเกมท้ายบรรทัด หรือ tag หลัง movetext
+    tags: Dict[str, str] = {}
+    movetext: List[str] = []
+    in_comment = False  # อยู่ใน {...} หลายบรรทัด: บรรทัดที่ขึ้นต้นด้วย '[' ยังเป็น comment
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("[") and not in_comment:
+            if movetext:
+                yield tags, "".join(movetext)
+                tags, movetext = {}, []
+            match = _TAG_RE.match(stripped)
+            if match:
+                tags[match.group(1)] = match.group(2).replace('\\"', '"').replace("\\\\", "\\")
+            continue
+        if stripped or movetext:
+            movetext.append(line)
+            opened, closed = line.rfind("{"), line.rfind("}")
+            if opened > closed:
+                in_comment = True
+            elif closed > opened:
+                in_comment = False
+            if stripped and not in_comment and stripped.split()[-1] in RESULTS:
+                yield tags, "".join(movetext)
+                tags, movetext = {}, []
+    if tags or any(part.strip() for part in movetext):
+        yield tags, "".join(movetext)
+
+
+def read_pgn(source: Source, validate: bool = True) -> Iterator[PgnGame]:
+    """
+    yield PgnGame ทีละเกม — อ่านไฟล์ทีละบรรทัด (memory ขึ้นกับเกมเดียว ไม่ใช่ทั้งไฟล์)
+    validate: เดินทุก move บน Position ของ engine (parse_san) ; move ผิดจะใส่ไว้ใน game.error ไม่ raise
+    """
+    position = Position()
+    if isinstance(source, (str, os.PathLike)):
+        f = open(source, encoding="utf-8", errors="replace", buffering=1 << 20)
+        close = True
+    else:
+        f, close = source, False
+    try:
+        for tags, text in _raw_games(f):
+            sans, result = _movetext_tokens(text)
+            game = PgnGame(tags=tags, sans=sans, result=result or tags.get("Result", "*"))
+            if validate:
+                _validate(game, position)
+            yield game
+    finally:
+        if close:
+            f.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chess_core.pgn", description="PGN import benchmark")
+    parser.add_argument("path")
+    parser.add_argument("--no-validate", action="store_true", help="only parse, do not replay moves")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    games = plies = invalid = 0
+    for game in read_pgn(args.path, validate=not args.no_validate):
+        games += 1
+        plies += len(game.sans)
+        if game.error:
+            invalid += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"Games: {games}")
+    print(f"Plies: {plies}")
+    print(f"Invalid games: {invalid}")
+    print(f"Time: {elapsed:.3f} s")
+    print(f"Games/sec: {games / elapsed if elapsed > 0 else 0.0:,.1f}")
+    print(f"Plies/sec: {plies / elapsed if elapsed > 0 else 0.0:,.0f}")
+    peak = peak_rss_mb()
+    if peak is not None:
+        print(f"Peak RSS: {peak:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
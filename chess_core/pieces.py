@@ -1,45 +1,88 @@
-from chess_core.square import Square
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chess_core.square import Square
 
 #   Cada peça é uma classe, contendo atributos como iswhite, que determina se a peça é branca ou preta,
-#selected, que serve para mudar a imagem caso a imagem seja selecionada, e o caminho para a imagens 
-#de cada peça.
+#e o caminho para a imagens de cada peça.
+#   O estado real do tabuleiro fica em Position.squares (bytearray de 64 códigos inteiros); as peças
+#aqui são apenas "views" compartilhadas (uma instância por código), criadas sob demanda para a UI.
+
+# ----- รหัสหมากแบบ int (ใช้ใน Position.squares) -----
+EMPTY = 0
+PAWN = 1
+KNIGHT = 2
+BISHOP = 3
+ROOK = 4
+QUEEN = 5
+KING = 6
+
+BLACK = 8       # bit สี: code = type | BLACK สำหรับฝ่ายดำ
+TYPE_MASK = 7
+
+
+def piece_type(code: int) -> int:
+    return code & TYPE_MASK
+
+
+def code_is_white(code: int) -> bool:
+    return code != EMPTY and not code & BLACK
+
+
+def make_code(ptype: int, iswhite: bool) -> int:
+    return ptype if iswhite else ptype | BLACK
+
 
 class Piece:
 
-    def __init__(self, iswhite) -> None:
+    __slots__ = ("iswhite",)
 
+    TYPE = EMPTY
+    NAME = ""
+    LETTER = ""
+    VALUE = 0
+
+    def __init__(self, iswhite) -> None:
         self.iswhite = iswhite
-        self.moved = False
-        self.value = 0
-        self.selected = False
 
-    def get_selected_image(self):
-        if self.selected:
+    @property
+    def code(self) -> int:
+        return make_code(self.TYPE, self.iswhite)
+
+    @property
+    def value(self) -> int:
+        return self.VALUE if self.iswhite else -self.VALUE
+
+    @property
+    def image(self) -> str:
+        return f"images/{'white' if self.iswhite else 'black'}-{self.NAME}.png"
+
+    @property
+    def selected_image(self) -> str:
+        return f"images/selected-{'white' if self.iswhite else 'black'}-{self.NAME}.png"
+
+    def get_selected_image(self, selected: bool = False):
+        if selected:
             return self.selected_image
         return self.image
-        
+
+    def __str__(self) -> str:
+        if self.iswhite:
+            return self.LETTER.upper()
+        return self.LETTER
+
 
 class Pawn(Piece):
 
-    def __init__(self, iswhite) -> None:
-        super().__init__(iswhite)
+    __slots__ = ()
 
-        #Set value of the piece
-        if self.iswhite:
-            self.image = "images/white-pawn.png"
-            self.selected_image = "images/selected-white-pawn.png"
-            self.value = 1
-        else:
-            self.image = "images/black-pawn.png"
-            self.selected_image = "images/selected-black-pawn.png"
-            self.value = -1
-        self.en_passantable = False
+    TYPE = PAWN
+    NAME = "pawn"
+    LETTER = "p"
+    VALUE = 1
 
-    def __str__(self) -> str:
-        if self.iswhite:
-            return 'P'
-        return 'p'
-    
     def possible_move(self, start : Square, end : Square):
         
         #Can't move if the square is ocupied
@@ -50,40 +93,31 @@ class Pawn(Piece):
             return False
 
         # Can only move in one direction
+        # (ยังไม่เคยเดิน = ยังอยู่ rank เริ่มต้น)
         if not self.iswhite:
             if start.x - end.x == 1:
                 return True
             # The first move can be two squares
-            if start.x - end.x == 2 and not self.moved:
+            if start.x - end.x == 2 and start.x == 6:
                 return True
         else:
             if end.x - start.x == 1:
                 return True
             # The first move can be two squares
-            if end.x - start.x == 2 and not self.moved:
+            if end.x - start.x == 2 and start.x == 1:
                 return True
         return False
 
 
 class Bishop(Piece):
-    
-    def __init__(self, iswhite) -> None:
-        super().__init__(iswhite)
 
-        if self.iswhite:
-            self.image = "images/white-bishop.png"
-            self.selected_image = "images/selected-white-bishop.png"
-            self.value = 3
-        else:
-            self.image = "images/black-bishop.png"
-            self.selected_image = "images/selected-black-bishop.png"
-            self.value = -3
+    __slots__ = ()
+
+    TYPE = BISHOP
+    NAME = "bishop"
+    LETTER = "b"
+    VALUE = 3
 
-    def __str__(self) -> str:
-        if self.iswhite:
-            return "B"
-        return 'b'
-    
     def possible_move(self, start : Square, end : Square):
 
         #Can't move if the square is ocupied
@@ -100,25 +134,14 @@ class Bishop(Piece):
     
 
 class Knight(Piece):
-    
-    def __init__(self, iswhite) -> None:
-        super().__init__(iswhite)
 
-        #Set value of the piece
-        if self.iswhite:
-            self.image = "images/white-knight.png"
-            self.selected_image = "images/selected-white-knight.png"
-            self.value = 3
-        else:
-            self.image = "images/black-knight.png"
-            self.selected_image = "images/selected-black-knight.png"
-            self.value = -3
+    __slots__ = ()
+
+    TYPE = KNIGHT
+    NAME = "knight"
+    LETTER = "n"
+    VALUE = 3
 
-    def __str__(self) -> str:
-        if self.iswhite:
-            return 'N'
-        return 'n'
-    
     def possible_move(self, start: Square, end: Square):
         
         #Can't move if the square is ocupied
@@ -135,25 +158,13 @@ class Knight(Piece):
 
 
 class Rook(Piece):
-    
-    def __init__(self, iswhite) -> None:
-        super().__init__(iswhite)
-
-        #Set value of the piece
-        if self.iswhite:
-            self.image = "images/white-rook.png"
-            self.selected_image = "images/selected-white-rook.png"
-            self.value = 5
-        else:
-            self.image = "images/black-rook.png"
-            self.selected_image = "images/selected-black-rook.png"
-            self.value = -5
 
-    def __str__(self) -> str:
+    __slots__ = ()
 
-        if self.iswhite:
-            return 'R'
-        return 'r'
+    TYPE = ROOK
+    NAME = "rook"
+    LETTER = "r"
+    VALUE = 5
 
     def possible_move(self, start : Square, end : Square):
 
@@ -171,26 +182,14 @@ class Rook(Piece):
     
 
 class Queen(Piece):
-    
-    def __init__(self, iswhite) -> None:
-        super().__init__(iswhite)
 
-        #Set value of the piece
-        if self.iswhite:
-            self.image = "images/white-queen.png"
-            self.selected_image = "images/selected-white-queen.png"
-            self.value = 9
-        else:
-            self.image = "images/black-queen.png"
-            self.selected_image = "images/selected-black-queen.png"
-            self.value = -9
+    __slots__ = ()
 
-    def __str__(self) -> str:
+    TYPE = QUEEN
+    NAME = "queen"
+    LETTER = "q"
+    VALUE = 9
 
-        if self.iswhite:
-            return 'Q'
-        return 'q'
-    
     def possible_move(self, start : Square, end : Square):
 
         #Can't move if the square is ocupied
@@ -209,26 +208,14 @@ class Queen(Piece):
     
 
 class King(Piece):
-    
-    def __init__(self, iswhite) -> None:
-        super().__init__(iswhite)
 
-        #Set value of the piece
-        if self.iswhite:
-            self.image = "images/white-king.png"
-            self.selected_image = "images/selected-white-king.png"
-            self.value = 100
-        else:
-            self.image = "images/black-king.png"
-            self.selected_image = "images/selected-black-king.png"
-            self.value = -100
+    __slots__ = ()
 
-    def __str__(self) -> str:
+    TYPE = KING
+    NAME = "king"
+    LETTER = "k"
+    VALUE = 100
 
-        if self.iswhite:
-            return 'K'
-        return 'k'
-    
     def possible_move(self, start: Square, end: Square):
         
         #Can't move if the square is ocupied
@@ -241,4 +228,14 @@ class King(Piece):
 
         if (x == 1 or y == 1) and (not (x > 1 or y > 1)):
             return True
-        return False
\ No newline at end of file
+        return False
+
+
+PIECE_CLASSES = {
+    PAWN: Pawn,
+    KNIGHT: Knight,
+    BISHOP: Bishop,
+    ROOK: Rook,
+    QUEEN: Queen,
+    KING: King,
+}
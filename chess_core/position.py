@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Optional
+
+from chess_core.pieces import PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, BLACK, EMPTY
+from chess_core.square import Square
+from chess_core.game_state import GameState
+from chess_core.san_history import SanHistory
+from chess_core.moves import FLAG_EN_PASSANT, FLAG_CASTLE
+from chess_core.zobrist import PIECE_KEYS, CASTLING_KEYS, SIDE_KEY, ep_key, compute_hash
+from chess_core.evaluation import MG_TABLE, EG_TABLE, PHASE, compute_eval
+
+_FILES = "abcdefgh"
+
+# ----- castling rights (bit) -----
+CASTLE_WK = 1
+CASTLE_WQ = 2
+CASTLE_BK = 4
+CASTLE_BQ = 8
+CASTLE_ALL = CASTLE_WK | CASTLE_WQ | CASTLE_BK | CASTLE_BQ
+
+# สิทธิ์ที่ "เหลือ" เมื่อมีหมากเดินออก/เข้าช่องนั้น (king/rook ตำแหน่งเริ่มต้น)
+CASTLE_MASK = [CASTLE_ALL] * 64
+CASTLE_MASK[0] &= ~CASTLE_WQ
+CASTLE_MASK[7] &= ~CASTLE_WK
+CASTLE_MASK[4] &= ~(CASTLE_WK | CASTLE_WQ)
+CASTLE_MASK[56] &= ~CASTLE_BQ
+CASTLE_MASK[63] &= ~CASTLE_BK
+CASTLE_MASK[60] &= ~(CASTLE_BK | CASTLE_BQ)
+
+_BACK_RANK = (ROOK, KNIGHT, BISHOP, QUEEN, KING, BISHOP, KNIGHT, ROOK)
+START_SQUARES = bytes(
+    list(_BACK_RANK)
+    + [PAWN] * 8
+    + [EMPTY] * 32
+    + [PAWN | BLACK] * 8
+    + [p | BLACK for p in _BACK_RANK]
+)
+
+
+def square_name(index: int) -> str:
+    # index = x*8 + y  (x=0 -> rank1, y=0 -> file a)
+    return f"{_FILES[index & 7]}{(index >> 3) + 1}"
+
+
+class Position:
+    """
+    สถานะของเกม 1 กระดาน (แยกจากกระดาน global เดิม)
+    - squares: bytearray 64 ช่อง เก็บ code ของหมาก (index = x*8 + y, x=0 -> rank1, y=0 -> file a)
+    - white_to_move / castling (bit) / ep_square (-1 = ไม่มี)
+    - kings: [ช่องคิงขาว, ช่องคิงดำ] อัปเดตทุกครั้งที่คิงเดิน (-1 = ไม่มีคิง)
+    - state: นาฬิกา halfmove/fullmove + ผลเกม (GameState)
+    - history: SAN ของเกมนี้
+    - hash_key: Zobrist key 64 bit ของ position ปัจจุบัน (อัปเดตใน make_move / unmake_move)
+    - _hash_counts: {key: จำนวนครั้งที่ position นี้เกิดขึ้นในเกม} ใช้ตรวจ threefold repetition
+    - eval_mg / eval_eg / phase: ผลรวม material + PST (มุมขาว) และ phase ของหมาก (chess_core.evaluation)
+      อัปเดตใน make_move / unmake_move เหมือน hash_key
+    - _undo: stack ของ undo record จาก make_move (ใช้ unmake_move / takeback)
+    board[x][y] (Square/Piece) เป็นแค่ view สำหรับ UI และสร้างเมื่อถูกเรียกใช้ครั้งแรกเท่านั้น
+    """
+
+    __slots__ = (
+        "squares", "white_to_move", "castling", "ep_square", "kings", "state", "history",
+        "hash_key", "_hash_counts", "eval_mg", "eval_eg", "phase", "_undo", "_board",
+    )
+
+    def __init__(
+        self,
+        board: Optional[list] = None,
+        white_to_move: bool = True,
+        state: Optional[GameState] = None,
+        history: Optional[SanHistory] = None,
+    ) -> None:
+        self.squares = bytearray(64)
+        self.white_to_move = white_to_move
+        self.castling = 0
+        self.ep_square = -1
+        self.kings = [-1, -1]
+        self.state = state if state is not None else GameState()
+        self.history = history if history is not None else SanHistory()
+        self._undo = []
+        self.hash_key = 0
+        self._hash_counts = {}
+        self.refresh_hash()
+        self.refresh_eval()
+        # list ที่จะใส่ view (เช่น Board.board เดิม) — เติมแบบ lazy
+        self._board = board
+
+    @classmethod
+    def initial(cls, **kwargs) -> "Position":
+        position = cls(**kwargs)
+        position.squares[:] = START_SQUARES
+        position.castling = CASTLE_ALL
+        position.kings = [4, 60]
+        position.refresh_hash()
+        position.refresh_eval()
+        return position
+
+    @property
+    def board(self) -> list:
+        grid = self._board
+        if grid is None:
+            grid = self._board = []
+        if not grid:
+            grid.extend([Square(x, y, cells=self.squares, position=self) for y in range(8)] for x in range(8))
+        return grid
+
+    # ----- clocks (เก็บใน GameState) -----
+    @property
+    def halfmove_clock(self) -> int:
+        return self.state.halfmove_clock
+
+    @halfmove_clock.setter
+    def halfmove_clock(self, value: int) -> None:
+        self.state.halfmove_clock = value
+
+    @property
+    def fullmove_number(self) -> int:
+        return self.state.fullmove_number
+
+    @fullmove_number.setter
+    def fullmove_number(self, value: int) -> None:
+        self.state.fullmove_number = value
+
+    def king_square(self, iswhite: bool) -> int:
+        return self.kings[0 if iswhite else 1]
+
+    def refresh_kings(self) -> None:
+        # เรียกหลังแก้ squares ตรง ๆ (เช่นวางหมากเอง) เพื่อหาตำแหน่งคิงใหม่
+        self.kings = [self.squares.find(KING), self.squares.find(KING | BLACK)]
+
+    # ----- Zobrist key / repetition -----
+    def refresh_hash(self) -> None:
+        # คำนวณ key ใหม่ทั้งกระดาน และเริ่มนับ repetition จาก position นี้ (เช่นหลังตั้งกระดานจาก FEN)
+        self.hash_key = compute_hash(self)
+        self._hash_counts = {self.hash_key: 1}
+
+    def refresh_eval(self) -> None:
+        # คำนวณ eval_mg / eval_eg / phase ใหม่ทั้งกระดาน (หลังแก้ squares ตรง ๆ)
+        self.eval_mg, self.eval_eg, self.phase = compute_eval(self.squares)
+
+    def repetition_count(self) -> int:
+        # position ปัจจุบันเกิดขึ้นมาแล้วกี่ครั้ง (รวมครั้งนี้)
+        return self._hash_counts.get(self.hash_key, 0)
+
+    # ----- make / unmake (ย้อนกลับได้แบบ O(1)) -----
+    def make_move(self, move: int) -> None:
+        """
+        เดิน move (int จาก movegen) บน position นี้: ย้ายหมาก, castling rook, en passant, promotion,
+        สิทธิ์ castling, ep square, นาฬิกา และสลับฝ่าย
+        เก็บ undo record (move, หมากที่โดนกิน, castling, ep, halfmove, hash, eval) ไว้ให้ unmake_move
+        """
+        squares = self.squares
+        s = move & 63
+        t = (move >> 6) & 63
+        flags = (move >> 12) & 31
+        promotion = move >> 17
+
+        code = squares[s]
+        captured = squares[t]
+        state = self.state
+        key = self.hash_key
+        mg, eg = self.eval_mg, self.eval_eg
+        self._undo.append(
+            (move, captured, self.castling, self.ep_square, state.halfmove_clock, key, mg, eg, self.phase)
+        )
+
+        # Zobrist: XOR ของเก่าออก / ของใหม่เข้า (ep key ของเดิมต้องคิดก่อนแก้กระดาน)
+        key ^= ep_key(squares, self.ep_square, self.white_to_move)
+        key ^= PIECE_KEYS[code][s] ^ PIECE_KEYS[captured][t]
+        # eval: หมากออกจาก s / หมากที่โดนกินออกจาก t (แถว EMPTY เป็น 0)
+        mg -= MG_TABLE[code][s] + MG_TABLE[captured][t]
+        eg -= EG_TABLE[code][s] + EG_TABLE[captured][t]
+        if captured:
+            self.phase -= PHASE[captured]
+
+        if flags & FLAG_EN_PASSANT:
+            victim = (s & ~7) | (t & 7)
+            pawn = squares[victim]
+            key ^= PIECE_KEYS[pawn][victim]
+            mg -= MG_TABLE[pawn][victim]
+            eg -= EG_TABLE[pawn][victim]
+            squares[victim] = EMPTY
+        elif flags & FLAG_CASTLE:
+            rook_from, rook_to = (t + 1, t - 1) if t > s else (t - 2, t + 1)
+            rook = squares[rook_from]
+            key ^= PIECE_KEYS[rook][rook_from] ^ PIECE_KEYS[rook][rook_to]
+            mg += MG_TABLE[rook][rook_to] - MG_TABLE[rook][rook_from]
+            eg += EG_TABLE[rook][rook_to] - EG_TABLE[rook][rook_from]
+            squares[rook_to] = rook
+            squares[rook_from] = EMPTY
+
+        placed = (promotion | (code & BLACK)) if promotion else code
+        key ^= PIECE_KEYS[placed][t]
+        self.eval_mg = mg + MG_TABLE[placed][t]
+        self.eval_eg = eg + EG_TABLE[placed][t]
+        if promotion:
+            self.phase += PHASE[placed]
+        squares[t] = placed
+        squares[s] = EMPTY
+
+        ptype = code & 7
+        if ptype == KING:
+            self.kings[1 if code & BLACK else 0] = t
+
+        castling = self.castling & CASTLE_MASK[s] & CASTLE_MASK[t]
+        key ^= CASTLING_KEYS[self.castling] ^ CASTLING_KEYS[castling]
+        self.castling = castling
+        self.ep_square = (s + t) >> 1 if ptype == PAWN and abs(t - s) == 16 else -1
+
+        # 50-move: รีเซ็ตเมื่อเดิน pawn หรือ capture
+        if ptype == PAWN or captured:
+            state.halfmove_clock = 0
+        else:
+            state.halfmove_clock += 1
+
+        # fullmove เพิ่มหลังดำเดินจบ
+        if code & BLACK:
+            state.fullmove_number += 1
+        self.white_to_move = not self.white_to_move
+
+        key ^= SIDE_KEY ^ ep_key(squares, self.ep_square, self.white_to_move)
+        self.hash_key = key
+        counts = self._hash_counts
+        counts[key] = counts.get(key, 0) + 1
+
+    def unmake_move(self) -> int:
+        """ย้อน move ล่าสุดจาก make_move แล้วคืนค่า move นั้น"""
+        (
+            move, captured, castling, ep_square, halfmove_clock, key,
+            self.eval_mg, self.eval_eg, self.phase,
+        ) = self._undo.pop()
+        counts = self._hash_counts
+        left = counts[self.hash_key] - 1
+        if left:
+            counts[self.hash_key] = left
+        else:
+            del counts[self.hash_key]
+        self.hash_key = key
+
+        squares = self.squares
+        s = move & 63
+        t = (move >> 6) & 63
+        flags = (move >> 12) & 31
+
+        self.white_to_move = not self.white_to_move
+        code = squares[t]
+        if move >> 17:
+            code = PAWN | (code & BLACK)
+
+        squares[s] = code
+        squares[t] = captured
+
+        if flags & FLAG_EN_PASSANT:
+            squares[(s & ~7) | (t & 7)] = PAWN | (BLACK ^ (code & BLACK))
+        elif flags & FLAG_CASTLE:
+            if t > s:
+                squares[t + 1] = squares[t - 1]
+                squares[t - 1] = EMPTY
+            else:
+                squares[t - 2] = squares[t + 1]
+                squares[t + 1] = EMPTY
+
+        if code & 7 == KING:
+            self.kings[1 if code & BLACK else 0] = s
+
+        state = self.state
+        if code & BLACK:
+            state.fullmove_number -= 1
+        state.halfmove_clock = halfmove_clock
+        self.castling = castling
+        self.ep_square = ep_square
+        return move
+
+    def copy(self) -> "Position":
+        """
+        snapshot สำหรับส่งไป thread อื่น (เช่น engine worker): กระดาน, สิทธิ์, นาฬิกา, hash + ตัวนับ repetition, eval
+        ไม่มี undo / SAN history / board view — แก้ตัว copy ไม่กระทบ position เดิม
+        """
+        other = Position(state=replace(self.state))
+        other.squares[:] = self.squares
+        other.white_to_move = self.white_to_move
+        other.castling = self.castling
+        other.ep_square = self.ep_square
+        other.kings = list(self.kings)
+        other.hash_key = self.hash_key
+        other._hash_counts = dict(self._hash_counts)
+        other.eval_mg, other.eval_eg, other.phase = self.eval_mg, self.eval_eg, self.phase
+        return other
+
+    @property
+    def ply_count(self) -> int:
+        # จำนวน move ที่ยังย้อนได้ด้วย unmake_move
+        return len(self._undo)
+
+    # ----- castling / en passant -----
+    def castling_rights(self) -> str:
+        rights = ""
+        if self.castling & CASTLE_WK:
+            rights += "K"
+        if self.castling & CASTLE_WQ:
+            rights += "Q"
+        if self.castling & CASTLE_BK:
+            rights += "k"
+        if self.castling & CASTLE_BQ:
+            rights += "q"
+        return rights or "-"
+
+    def en_passant_target(self) -> str:
+        if self.ep_square < 0:
+            return "-"
+        return square_name(self.ep_square)
+
+    def to_fen(self) -> str:
+        from chess_core.fen import to_fen
+
+        return to_fen(position=self)
+
+    def setup(
+        self,
+        squares,
+        white_to_move: bool = True,
+        castling: int = 0,
+        ep_square: int = -1,
+        halfmove_clock: int = 0,
+        fullmove_number: int = 1,
+    ) -> None:
+        """ตั้ง position ใหม่ทั้งหมด (เริ่มเกมใหม่จากตรงนี้: ล้าง undo / SAN / ผลเกม)"""
+        self.squares[:] = squares
+        self.white_to_move = white_to_move
+        self.castling = castling
+        self.ep_square = ep_square
+        self._undo.clear()
+        self.state.reset()
+        self.history.reset()
+        self.state.halfmove_clock = halfmove_clock
+        self.state.fullmove_number = fullmove_number
+        self.refresh_kings()
+        self.refresh_hash()
+        self.refresh_eval()
+
+    def reset(self) -> None:
+        self.setup(START_SQUARES, True, CASTLE_ALL)
@@ -0,0 +1,177 @@
+"""
+replay เกมแบบไม่มี UI: เดิน move list (UCI หรือ SAN) บน Position แล้วสรุปผล (illegal / mate / draw / FEN สุดท้าย)
+
+    result = replay(["e2e4", "e7e5", "d1h5"])
+    result = replay("f3 e5 g4 Qh4#".split(), notation="san")
+
+CLI (1 บรรทัด = 1 เกม, หรือ --pgn):
+    python -m chess_core.replay games.txt --workers 8
+    python -m chess_core.replay archive.pgn --pgn --workers 8 --quiet
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from chess_core.position import Position
+from chess_core.fen import from_fen
+from chess_core.moves import UCI_RE
+from chess_core.movegen import parse_uci_move, game_status, CHECKMATE, STALEMATE
+from chess_core.san import parse_san
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# สถานะหลัง replay
+ONGOING = "ONGOING"
+ILLEGAL = "ILLEGAL"
+DRAW_REPETITION = "DRAW_REPETITION"
+DRAW_FIFTY_MOVES = "DRAW_FIFTY_MOVES"
+
+NOTATIONS = ("auto", "uci", "san")
+_SKIP_TOKENS = {"1-0", "0-1", "1/2-1/2", "*"}
+
+
+@dataclass
+class ReplayResult:
+    status: str
+    plies: int
+    final_fen: str
+    result: str = "*"
+    error: Optional[str] = None
+
+
+def game_result(position: Position, ply: int, error: Optional[str] = None) -> ReplayResult:
+    """สถานะของ position หลังเดินมา ply ครั้ง (mate / stalemate / เสมอซ้ำ 3 ครั้ง / 50 ตา / ยังเล่นต่อ) ; error -> ILLEGAL"""
+    fen = position.to_fen()
+    if error is not None:
+        return ReplayResult(ILLEGAL, ply, fen, "*", error)
+
+    status = game_status(position)
+    if status == CHECKMATE:
+        return ReplayResult(CHECKMATE, ply, fen, "0-1" if position.white_to_move else "1-0")
+    if status == STALEMATE:
+        return ReplayResult(STALEMATE, ply, fen, "1/2-1/2")
+    if position.repetition_count() >= 3:
+        return ReplayResult(DRAW_REPETITION, ply, fen, "1/2-1/2")
+    if position.halfmove_clock >= 100:
+        return ReplayResult(DRAW_FIFTY_MOVES, ply, fen, "1/2-1/2")
+    return ReplayResult(ONGOING, ply, fen)
+
+
+def replay(
+    moves: Sequence[str],
+    fen: str = START_FEN,
+    notation: str = "auto",
+    position: Optional[Position] = None,
+) -> ReplayResult:
+    """
+    เดิน moves ต่อจาก fen ทีละ move ; หยุดที่ move แรกที่ไม่ legal (status ILLEGAL + error)
+    notation: "uci" / "san" / "auto" (ดูทีละ token) ; position: ส่ง Position มาใช้ซ้ำได้ (batch)
+    draw (threefold / 50-move) นับตาม position สุดท้าย เหมือน rules._draw_reason
+    """
+    if notation not in NOTATIONS:
+        raise ValueError(f"Unknown notation: {notation}")
+    try:
+        position = from_fen(fen, position)
+    except ValueError as exc:
+        return ReplayResult(ILLEGAL, 0, fen, "*", f"bad FEN: {exc}")
+
+    ply = 0
+    for token in moves:
+        if token in _SKIP_TOKENS:
+            continue
+        try:
+            if notation == "uci" or (notation == "auto" and UCI_RE.fullmatch(token)):
+                move = parse_uci_move(position, token)
+            else:
+                move = parse_san(position, token)
+        except ValueError as exc:
+            return game_result(position, ply, f"ply {ply + 1}: {exc}")
+        position.make_move(move)
+        ply += 1
+    return game_result(position, ply)
+
+
+# ----- batch -----
+def _replay_task(task: Tuple[str, Sequence[str], str]) -> ReplayResult:
+    fen, moves, notation = task
+    return replay(moves, fen, notation)
+
+
+def replay_many(
+    games: Iterable[Tuple[str, Sequence[str]]],
+    notation: str = "auto",
+    workers: int = 1,
+    chunksize: int = 64,
+) -> Iterator[ReplayResult]:
+    """games: (fen, moves) ทีละเกม -> ReplayResult ตามลำดับ ; workers > 1 กระจายไปหลาย process"""
+    if workers > 1:
+        from chess_core.parallel import chunked_map
+
+        yield from chunked_map(_replay_task, ((fen, list(moves), notation) for fen, moves in games), workers, chunksize)
+        return
+    position = Position()
+    for fen, moves in games:
+        yield replay(moves, fen, notation, position)
+
+
+def _games_from_text(path: str, fen: str) -> Iterator[Tuple[str, List[str]]]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                # ตัดเลข move แบบ "1." / "12..." ออก เผื่อ copy มาจาก movetext
+                yield fen, [tok for tok in line.split() if not tok.rstrip(".").isdigit()]
+
+
+def _games_from_pgn(path: str) -> Iterator[Tuple[str, List[str]]]:
+    from chess_core.pgn import read_pgn
+
+    for game in read_pgn(path, validate=False):
+        yield game.tags.get("FEN", START_FEN), game.sans
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chess_core.replay", description="headless game replay")
+    parser.add_argument("path", help="one game per line (UCI/SAN moves), or a PGN file with --pgn")
+    parser.add_argument("--pgn", action="store_true")
+    parser.add_argument("--fen", default=START_FEN, help="start position for plain move-list files")
+    parser.add_argument("--notation", choices=NOTATIONS, default="auto")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunksize", type=int, default=64)
+    parser.add_argument("--quiet", action="store_true", help="only print statistics")
+    args = parser.parse_args(argv)
+
+    games = _games_from_pgn(args.path) if args.pgn else _games_from_text(args.path, args.fen)
+    notation = "san" if args.pgn else args.notation
+
+    start = time.perf_counter()
+    statuses: Counter = Counter()
+    count = plies = 0
+    for number, result in enumerate(replay_many(games, notation, args.workers, args.chunksize), start=1):
+        count += 1
+        plies += result.plies
+        statuses[result.status] += 1
+        if not args.quiet:
+            line = f"{number}\t{result.status}\t{result.result}\t{result.plies}\t{result.final_fen}"
+            if result.error:
+                line += f"\t{result.error}"
+            print(line)
+    elapsed = time.perf_counter() - start
+
+    print(f"Games: {count}", file=sys.stderr)
+    print(f"Plies: {plies}", file=sys.stderr)
+    for status, n in sorted(statuses.items()):
+        print(f"  {status}: {n}", file=sys.stderr)
+    print(f"Time: {elapsed:.3f} s", file=sys.stderr)
+    print(f"Games/sec: {count / elapsed if elapsed > 0 else 0.0:,.1f}", file=sys.stderr)
+    print(f"Plies/sec: {plies / elapsed if elapsed > 0 else 0.0:,.0f}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,45 @@
 from chess_core.pieces import *
 from chess_core.square import *
 from chess_core.board import *
+from chess_core.board import _position
 
 from chess_core.fen import to_fen
-from chess_core.san_history import SanHistory
-from chess_core.game_state import GAME_STATE
+from chess_core.san import move_to_san
+from chess_core.see import see
+from chess_core import crosscheck
+from chess_core.position import Position
+from chess_core.movegen import (
+    generate_legal_moves,
+    has_any_legal_move,
+    in_check,
+    game_status,
+    set_move_backend,
+    get_move_backend,
+    MOVE_BACKENDS,
+    ONGOING,
+    CHECK,
+    CHECKMATE,
+    STALEMATE,
+)
+from chess_core.moves import encode_move, move_from, move_to, move_flags, move_promotion, FLAG_CASTLE, FLAG_CAPTURE
 
 from typing import Literal, Tuple, Union, Optional
 
-import chess
+import os
+
+# compatibility shim: ฟังก์ชันที่ไม่ได้ส่ง position มาจะทำงานกับกระดาน global เดิม
+DEFAULT_POSITION = Board.position
 
 # เก็บ SAN history ไว้ใช้ใน UI
-SAN_HISTORY = SanHistory()
+SAN_HISTORY = DEFAULT_POSITION.history
+
+# โหมดตรวจเทียบกับ python-chess ทุก move (ช้า ใช้ตอน debug): CHESS_CROSSCHECK=1 หรือ set_crosscheck(True)
+_crosscheck = os.environ.get("CHESS_CROSSCHECK") == "1"
+
+
+def set_crosscheck(enabled: bool) -> None:
+    global _crosscheck
+    _crosscheck = enabled
 
 # ----- types for promotion/draw flow -----
 PromotionPending = Tuple[
@@ -24,285 +52,219 @@ DrawResult = Tuple[Literal["DRAW"], str]
 TurnResult = Union[bool, PromotionPending, DrawResult]
 
 
-def clear_legal_hints() -> None:
-    for line in Board.board:
+def clear_legal_hints(position: Optional[Position] = None) -> None:
+    for line in _position(position).board:
         for sq in line:
             sq.legal_move = False
             sq.legal_capture = False
+            sq.capture_gain = 0
             sq.legal_castle = False
 
 
-def compute_legal_hints_for(x: int, y: int, iswhite: bool) -> None:
+def compute_legal_hints_for(x: int, y: int, iswhite: bool, position: Optional[Position] = None) -> None:
     """
-    ตั้งค่า flag legal_move / legal_capture / legal_castle ใส่ Board.board
-    โดยคำนวณจากกติกาจริง: เดินแล้วห้ามทำให้คิงตัวเองโดนเช็ค
+    ตั้งค่า flag legal_move / legal_capture / legal_castle ใส่ position.board
+    capture ใส่ capture_gain (SEE) ไว้ให้ UI แยกสีว่ากินแล้วได้หรือเสีย material
+    จาก legal move ของหมากตัวนี้ (generate_legal_moves) — ไม่ต้องลองเดินทั้ง 64 ช่อง
     """
-    clear_legal_hints()
+    position = _position(position)
+    grid = position.board
+    clear_legal_hints(position)
 
-    start: Square = Board.board[x][y]
-    if isinstance(start.piece, EmptySquare):
-        return
-    if start.piece.iswhite != iswhite:
+    code = position.squares[x * 8 + y]
+    if code == EMPTY or code_is_white(code) != iswhite:
         return
 
-    for tx in range(8):
-        for ty in range(8):
-            if tx == x and ty == y:
-                continue
-
-            end: Square = Board.board[tx][ty]
-
-            # snapshot สภาพก่อนลองเดิน (ขั้นต่ำที่จำเป็น)
-            s_piece = start.piece
-            e_piece = end.piece
-            s_moved = getattr(s_piece, "moved", None)
-            e_moved = getattr(e_piece, "moved", None)
-
-            # สำหรับ pawn: ต้องจำ en_passantable ด้วย
-            s_ep = getattr(s_piece, "en_passantable", None)
-            side_sq = None
-            side_piece = None
-            side_moved = None
-            side_ep = None
-
-            # เผื่อ en passant: ถ้าปลายทางว่างและเป็น pawn capture pattern
-            if isinstance(s_piece, Pawn) and isinstance(e_piece, EmptySquare) and pawn_can_capture(start, end):
-                side_sq = Board.board[x][ty]
-                side_piece = side_sq.piece
-                side_moved = getattr(side_piece, "moved", None)
-                side_ep = getattr(side_piece, "en_passantable", None)
-
-            moved = move_piece(start, end)
-            if not moved:
-                # restore
-                start.piece = s_piece
-                end.piece = e_piece
-                if s_moved is not None:
-                    start.piece.moved = s_moved
-                if e_moved is not None and not isinstance(end.piece, EmptySquare):
-                    end.piece.moved = e_moved
-                if s_ep is not None and isinstance(start.piece, Pawn):
-                    start.piece.en_passantable = s_ep
-                if side_sq is not None:
-                    side_sq.piece = side_piece
-                    if side_moved is not None and not isinstance(side_sq.piece, EmptySquare):
-                        side_sq.piece.moved = side_moved
-                    if side_ep is not None and isinstance(side_sq.piece, Pawn):
-                        side_sq.piece.en_passantable = side_ep
-                continue
-
-            illegal = check_for_check(iswhite)
-
-            # revert board กลับเหมือนเดิม
-            Board.board[x][y].piece = s_piece
-            Board.board[tx][ty].piece = e_piece
-            Board.board[x][y].piece.moved = s_moved
-            if not isinstance(Board.board[tx][ty].piece, EmptySquare) and e_moved is not None:
-                Board.board[tx][ty].piece.moved = e_moved
-
-            if isinstance(Board.board[x][y].piece, Pawn) and s_ep is not None:
-                Board.board[x][y].piece.en_passantable = s_ep
-
-            if side_sq is not None:
-                side_sq.piece = side_piece
-                if not isinstance(side_sq.piece, EmptySquare) and side_moved is not None:
-                    side_sq.piece.moved = side_moved
-                if isinstance(side_sq.piece, Pawn) and side_ep is not None:
-                    side_sq.piece.en_passantable = side_ep
-
-            if illegal:
-                continue
-
-            # mark hint
-            is_castle = isinstance(s_piece, King) and (abs(ty - y) == 2) and (tx == x)
-            if is_castle:
-                Board.board[tx][ty].legal_castle = True
-            elif isinstance(e_piece, EmptySquare):
-                Board.board[tx][ty].legal_move = True
-            else:
-                Board.board[tx][ty].legal_capture = True
-
-
-def check_for_check(iswhite: bool) -> bool:
-    king_square = None
-    for line in Board.board:
-        for square in line:
-            if isinstance(square.piece, King) and square.piece.iswhite == iswhite:
-                king_square = square
-                break
-        if king_square:
-            break
-
-    if king_square is None:
-        return False
+    for move in generate_legal_moves(position, x * 8 + y, iswhite):
+        t = move_to(move)
+        end: Square = grid[t >> 3][t & 7]
+        flags = move_flags(move)
+        if flags & FLAG_CASTLE:
+            end.legal_castle = True
+        elif flags & FLAG_CAPTURE:
+            end.legal_capture = True
+            end.capture_gain = see(position, move)
+        else:
+            end.legal_move = True
+
+
+def check_for_check(iswhite: bool, position: Optional[Position] = None) -> bool:
+    return in_check(_position(position), iswhite)
+
 
-    for line in Board.board:
-        for square in line:
-            if square.piece.iswhite == king_square.piece.iswhite or isinstance(square.piece, EmptySquare):
-                continue
-            if isinstance(square.piece, Rook):
-                if has_path_rook(square, king_square):
-                    return True
-            elif isinstance(square.piece, Bishop):
-                if has_path_bishop(square, king_square):
-                    return True
-            elif isinstance(square.piece, Queen):
-                if has_path_bishop(square, king_square) or has_path_rook(square, king_square):
-                    return True
-            elif isinstance(square.piece, King):
-                if square.piece.possible_move(square, king_square):
-                    return True
-            elif isinstance(square.piece, Knight):
-                if square.piece.possible_move(square, king_square):
-                    return True
-            elif isinstance(square.piece, Pawn):
-                if pawn_can_capture(square, king_square):
-                    return True
-    return False
-
-
-def end_turn(iswhite: bool) -> None:
-    # reset en_passantable ของฝ่ายตรงข้าม (มีผล 1 ตา)
-    for line in Board.board:
-        for square in line:
-            if square.piece.iswhite != iswhite and isinstance(square.piece, Pawn):
-                square.piece.en_passantable = False
+def end_turn(iswhite: bool, position: Optional[Position] = None) -> None:
+    # en passant มีผล 1 ตา: ep_square ถูกล้างอัตโนมัติในการเดินครั้งถัดไป (make_move)
+    # เก็บฟังก์ชันไว้เพื่อให้โค้ดเดิมเรียกได้เหมือนเดิม
+    return None
 
 
 # ----- promotion helpers -----
-def needs_promotion(x: int, y: int, iswhite: bool) -> bool:
-    p = Board.board[x][y].piece
-    if not isinstance(p, Pawn):
+_PROMOTION_TYPES = {"q": QUEEN, "r": ROOK, "b": BISHOP, "n": KNIGHT}
+
+
+def needs_promotion(x: int, y: int, iswhite: bool, position: Optional[Position] = None) -> bool:
+    code = _position(position).squares[x * 8 + y]
+    if piece_type(code) != PAWN:
         return False
     return (iswhite and x == 7) or ((not iswhite) and x == 0)
 
 
-def apply_promotion(x: int, y: int, iswhite: bool, promote_to: str) -> None:
-    promote_to = promote_to.lower()
-    if promote_to == "q":
-        Board.board[x][y].piece = Queen(iswhite)
-    elif promote_to == "r":
-        Board.board[x][y].piece = Rook(iswhite)
-    elif promote_to == "b":
-        Board.board[x][y].piece = Bishop(iswhite)
-    elif promote_to == "n":
-        Board.board[x][y].piece = Knight(iswhite)
-    else:
+def apply_promotion(x: int, y: int, iswhite: bool, promote_to: str, position: Optional[Position] = None) -> None:
+    ptype = _PROMOTION_TYPES.get(promote_to.lower())
+    if ptype is None:
         raise ValueError(f"Invalid promotion piece: {promote_to}")
+    _position(position).squares[x * 8 + y] = make_code(ptype, iswhite)
 
 
-def check_for_checkmate(iswhite):
-    for a in range(8):
-        for b in range(8):
-            if isinstance(Board.board[a][b].piece, EmptySquare):
-                continue
-            if Board.board[a][b].piece.iswhite != iswhite:
-                continue
-
-            for c in range(8):
-                for d in range(8):
-                    if a == c and b == d:
-                        continue
-
-                    start_piece = Board.board[a][b].piece
-                    end_piece = Board.board[c][d].piece
+def check_for_checkmate(iswhite, position: Optional[Position] = None):
+    # ไม่มี legal move เหลือ (ใช้คู่กับ check_for_check; ไม่แตะ SAN / clocks)
+    return not has_any_legal_move(_position(position), iswhite)
 
-                    if turn(a, b, c, d, iswhite, True):
-                        Board.board[c][d].piece = end_piece
-                        Board.board[a][b].piece = start_piece
-                        return False
 
-                    if hasattr(Board.board[a][b].piece, "en_passantable"):
-                        Board.board[a][b].piece.en_passantable = False
-    return True
+def finish_promotion(
+    x1: int, y1: int, x2: int, y2: int,
+    iswhite: bool,
+    promote_to: str,
+    fen_before: str,
+    position: Optional[Position] = None,
+    analyze: bool = True,
+) -> TurnResult:
+    """
+    ปิด move ที่ค้าง PROMOTION จาก turn(): เปลี่ยนเป็นหมากที่เลือก + SAN + ตรวจจบเกม
+    (fen_before ไม่ได้ใช้แล้ว — SAN คำนวณจาก position — คงไว้ให้ caller เดิมเรียกได้เหมือนเดิม)
+    analyze=False: ไม่ตรวจจบเกม (caller เรียก analyze_position / apply_analysis เอง เช่นใน worker thread)
+    """
+    position = _position(position)
+    ptype = _PROMOTION_TYPES.get(promote_to.lower())
+    if ptype is None:
+        raise ValueError(f"Invalid promotion piece: {promote_to}")
 
+    # turn() เดินไว้ก่อนเป็น queen ชั่วคราว -> ย้อนแล้วเดินใหม่ด้วยหมากที่เลือก
+    move = position.unmake_move()
+    move = encode_move(move_from(move), move_to(move), move_flags(move), ptype)
+    san = move_to_san(position, move)
+    if _crosscheck:
+        crosscheck.check_san(position, move, san)
+    position.make_move(move)
 
-def _fen(side_to_move_iswhite: bool) -> str:
-    return to_fen(
-        side_to_move_iswhite=side_to_move_iswhite,
-        halfmove_clock=GAME_STATE.halfmove_clock,
-        fullmove_number=GAME_STATE.fullmove_number,
-    )
+    position.history.push(san)
+    if not analyze:
+        return True
+    return _finish_move(iswhite, position)
 
 
-def _update_clocks_after_move(moved_piece, was_capture: bool, moved_iswhite: bool) -> None:
-    # 50-move: รีเซ็ตเมื่อเดิน pawn หรือ capture
-    if isinstance(moved_piece, Pawn) or was_capture:
-        GAME_STATE.halfmove_clock = 0
-    else:
-        GAME_STATE.halfmove_clock += 1
+def undo_last_move(position: Optional[Position] = None) -> bool:
+    """ย้อน move ล่าสุด (unmake_move) พร้อม SAN และสถานะจบเกม ; ไม่มี move ให้ย้อน -> False"""
+    position = _position(position)
+    if not position.ply_count:
+        return False
+    position.unmake_move()
+    position.history.pop()
+    position.state.game_over = False
+    position.state.result_text = ""
+    return True
 
-    # fullmove เพิ่มหลังดำเดินจบ
-    if not moved_iswhite:
-        GAME_STATE.fullmove_number += 1
 
+def _fen(side_to_move_iswhite: bool, position: Position) -> str:
+    return to_fen(side_to_move_iswhite=side_to_move_iswhite, position=position)
 
-def _draw_reason(side_to_move_iswhite: bool) -> Optional[str]:
-    b = chess.Board(_fen(side_to_move_iswhite))
 
-    if b.is_stalemate():
+def _draw_reason(status: str, position: Position) -> Optional[str]:
+    if status == STALEMATE:
         return "Draw by stalemate"
-    if b.can_claim_threefold_repetition():
+
+    # Zobrist key ของ position นี้เกิดขึ้นครบ 3 ครั้งในเกม (นับใน make_move)
+    if position.repetition_count() >= 3:
         return "Draw by threefold repetition (claim)"
-    if b.can_claim_fifty_moves():
+    if position.halfmove_clock >= 100:
         return "Draw by 50-move rule (claim)"
     return None
 
 
-def turn(x1, y1, x2, y2, iswhite, check=False) -> TurnResult:
-    start: Square = Board.board[x1][y1]
-    end: Square = Board.board[x2][y2]
-
-    fen_before = _fen(side_to_move_iswhite=iswhite)
-
-    s_piece = start.piece
-    e_piece = end.piece
-
-    s_moved = s_piece.moved
-    e_moved = e_piece.moved
-
-    if start.piece.iswhite == iswhite:
-        if move_piece(start, end):
-            if check_for_check(iswhite):
-                Board.board[start.x][start.y].piece = s_piece
-                Board.board[end.x][end.y].piece = e_piece
-                Board.board[start.x][start.y].piece.moved = s_moved
-                Board.board[end.x][end.y].piece.moved = e_moved
-                return False
-
-            # promotion pending
-            if needs_promotion(x2, y2, iswhite):
-                return ("PROMOTION", fen_before, x1, y1, x2, y2, iswhite)
-
-            # SAN
-            SAN_HISTORY.push_from_fen_and_coords(
-                fen_before_move=fen_before,
-                x1=x1, y1=y1, x2=x2, y2=y2,
-                promotion=None,
-            )
-
-            was_capture = not isinstance(e_piece, EmptySquare)
-            _update_clocks_after_move(moved_piece=s_piece, was_capture=was_capture, moved_iswhite=iswhite)
-
-            end_turn(iswhite)
-
-            other_iswhite = not iswhite
-            if check_for_check(other_iswhite):
-                if check_for_checkmate(other_iswhite):
-                    for i in range(64):
-                        if (
-                            isinstance(Board.board[i // 8][i % 8].piece, King)
-                            and Board.board[i // 8][i % 8].piece.iswhite == other_iswhite
-                        ):
-                            Board.board[i // 8][i % 8].piece.selected = True
-                    return True
-
-            # NEW: draw
-            reason = _draw_reason(side_to_move_iswhite=other_iswhite)
-            if reason:
-                GAME_STATE.game_over = True
-                GAME_STATE.result_text = reason
-                return ("DRAW", reason)
-
-            return True
-    return False
\ No newline at end of file
+def analyze_position(position: Position) -> Tuple[str, Optional[str]]:
+    """
+    หลังเดินเสร็จ: (status, draw reason) ของฝ่ายที่ต้องเดินต่อ — อ่านอย่างเดียว ไม่แก้ position
+    จึงเรียกกับ snapshot (Position.copy) ใน thread อื่นได้ ; ผลเอาไปใส่ด้วย apply_analysis
+    """
+    if _crosscheck:
+        crosscheck.check_position(position)
+    status = game_status(position)
+    if status == CHECKMATE:
+        return status, None
+    return status, _draw_reason(status, position)
+
+
+def apply_analysis(moved_iswhite: bool, status: str, reason: Optional[str], position: Position) -> TurnResult:
+    # ใส่ผลของ analyze_position ลง GameState / highlight คิงที่โดนรุกจน
+    if status == CHECKMATE:
+        king = position.king_square(not moved_iswhite)
+        position.board[king >> 3][king & 7].selected = True
+        position.state.game_over = True
+        position.state.result_text = f"Checkmate: {'White' if moved_iswhite else 'Black'} wins"
+        return True
+
+    # NEW: draw
+    if reason:
+        position.state.game_over = True
+        position.state.result_text = reason
+        return ("DRAW", reason)
+
+    return True
+
+
+def _finish_move(moved_iswhite: bool, position: Position) -> TurnResult:
+    # หลังเดินเสร็จ (make_move สลับฝ่ายแล้ว): ตรวจ checkmate / draw ของฝ่ายที่ต้องเดินต่อ
+    status, reason = analyze_position(position)
+    return apply_analysis(moved_iswhite, status, reason, position)
+
+
+def turn(
+    x1, y1, x2, y2, iswhite, check=False, position: Optional[Position] = None, analyze: bool = True
+) -> TurnResult:
+    """
+    เดินหมากจาก (x1, y1) ไป (x2, y2) ถ้า legal: SAN + make_move แล้วตรวจจบเกม
+    analyze=False: ข้ามการตรวจจบเกม — caller ส่ง position ไปวิเคราะห์เบื้องหลัง (analyze_position) แล้วค่อย apply_analysis
+    """
+    position = _position(position)
+    squares = position.squares
+
+    s = x1 * 8 + y1
+    t = x2 * 8 + y2
+    code = squares[s]
+    # ฝ่ายที่เดินต้องตรงกับ position (ไม่สลับ white_to_move เอง: hash_key / ep key / repetition จะไม่ตรงกัน)
+    if iswhite != position.white_to_move or code == EMPTY or code_is_white(code) != iswhite:
+        return False
+
+    # promotion: generator ให้ queen มาก่อน (PROMOTION_TYPES) ใช้เป็นหมากชั่วคราวจนกว่าจะเลือก
+    move = next((m for m in generate_legal_moves(position, s, iswhite) if move_to(m) == t), None)
+    if move is None:
+        return False
+
+    # promotion pending (SAN รอจนรู้ว่าเลือกหมากอะไร)
+    if move_promotion(move):
+        fen_before = _fen(iswhite, position)
+        position.make_move(move)
+        return ("PROMOTION", fen_before, x1, y1, x2, y2, iswhite)
+
+    # SAN ต้องคำนวณก่อนเดิน (disambiguation ดูจาก legal move ของ position เดิม)
+    san = move_to_san(position, move)
+    if _crosscheck:
+        crosscheck.check_san(position, move, san)
+    position.make_move(move)
+    position.history.push(san)
+    if not analyze:
+        return True
+    return _finish_move(iswhite, position)
+
+
+def play_move(move: int, position: Optional[Position] = None, analyze: bool = True) -> TurnResult:
+    """เดิน move แบบ int (เช่นจาก engine) ผ่านทางเดียวกับผู้เล่น: SAN + ตรวจจบเกม ; promotion ใช้หมากใน move"""
+    position = _position(position)
+    s, t = move_from(move), move_to(move)
+    iswhite = position.white_to_move
+    result = turn(s >> 3, s & 7, t >> 3, t & 7, iswhite, position=position, analyze=analyze)
+    if isinstance(result, tuple) and result[0] == "PROMOTION":
+        _, fen_before, x1, y1, x2, y2, moved_iswhite = result
+        letter = {QUEEN: "q", ROOK: "r", BISHOP: "b", KNIGHT: "n"}[move_promotion(move)]
+        return finish_promotion(x1, y1, x2, y2, moved_iswhite, letter, fen_before, position, analyze)
+    return result
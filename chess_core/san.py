@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable, List, Optional
+
+from chess_core.pieces import PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, BLACK, TYPE_MASK
+from chess_core.position import Position, square_name
+from chess_core.moves import FLAG_CAPTURE, FLAG_CASTLE
+from chess_core.movegen import generate_legal_moves, game_status, CHECK, CHECKMATE
+
+# SAN (Standard Algebraic Notation) จาก position + legal move ของ engine เอง (ไม่ต้องสร้าง chess.Board)
+
+_PIECE_LETTERS = {KNIGHT: "N", BISHOP: "B", ROOK: "R", QUEEN: "Q", KING: "K"}
+_LETTER_PIECES = {v: k for k, v in _PIECE_LETTERS.items()}
+_FILES = "abcdefgh"
+
+# [piece][from file][from rank][x][to square][=promotion]
+_SAN_RE = re.compile(r"([NBRQK])?([a-h])?([1-8])?(x)?([a-h][1-8])(?:=?([NBRQnbrq]))?")
+
+
+def move_to_san(position: Position, move: int, legal_moves: Optional[List[int]] = None) -> str:
+    """
+    SAN ของ move (ต้องเป็น legal move ของฝ่ายที่เดินใน position) — เรียกก่อนเดิน move นั้น
+    legal_moves: ส่ง list ที่มีอยู่แล้วมาได้ เพื่อไม่ต้อง generate ซ้ำตอนหา disambiguation
+    """
+    squares = position.squares
+    s = move & 63
+    t = (move >> 6) & 63
+    flags = (move >> 12) & 31
+    promotion = move >> 17
+    code = squares[s]
+    ptype = code & TYPE_MASK
+
+    if flags & FLAG_CASTLE:
+        san = "O-O" if t > s else "O-O-O"
+    elif ptype == PAWN:
+        san = f"{_FILES[s & 7]}x" if flags & FLAG_CAPTURE else ""
+        san += square_name(t)
+        if promotion:
+            san += "=" + _PIECE_LETTERS[promotion]
+    else:
+        san = _PIECE_LETTERS[ptype]
+        if ptype != KING:
+            if legal_moves is None:
+                legal_moves = list(generate_legal_moves(position))
+            # หมากชนิดเดียวกันตัวอื่นที่ไปช่องเดียวกันได้ -> ใส่ file / rank / ทั้งคู่
+            others = [m & 63 for m in legal_moves if (m >> 6) & 63 == t and m & 63 != s and squares[m & 63] == code]
+            if others:
+                if all((o & 7) != (s & 7) for o in others):
+                    san += _FILES[s & 7]
+                elif all((o >> 3) != (s >> 3) for o in others):
+                    san += str((s >> 3) + 1)
+                else:
+                    san += square_name(s)
+        if flags & FLAG_CAPTURE:
+            san += "x"
+        san += square_name(t)
+
+    position.make_move(move)
+    status = game_status(position)
+    position.unmake_move()
+    if status == CHECKMATE:
+        san += "#"
+    elif status == CHECK:
+        san += "+"
+    return san
+
+
+def parse_san(position: Position, san: str, legal_moves: Optional[List[int]] = None) -> int:
+    """
+    SAN -> legal move (int) ของฝ่ายที่เดินใน position ; อ่านไม่ได้ / ไม่ legal / กำกวม -> ValueError
+    ไม่ส่ง legal_moves มา: สร้าง move เฉพาะหมากชนิดนั้นที่อยู่บน file/rank ที่ตรงกัน (ไม่ต้องสร้างทั้งกระดาน)
+    """
+    squares = position.squares
+    side = 0 if position.white_to_move else BLACK
+
+    text = san.strip().rstrip("+#!?")
+    castle = text.replace("0", "O")
+    if castle in ("O-O", "O-O-O"):
+        if legal_moves is None:
+            king = position.king_square(position.white_to_move)
+            legal_moves = list(generate_legal_moves(position, king)) if king >= 0 else []
+        for move in legal_moves:
+            if (move >> 12) & FLAG_CASTLE and (((move >> 6) & 63) > (move & 63)) == (castle == "O-O"):
+                return move
+        raise ValueError(f"Illegal SAN move: {san!r}")
+
+    match = _SAN_RE.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Invalid SAN move: {san!r}")
+    letter, from_file, from_rank, _capture, to_name, promo_letter = match.groups()
+
+    ptype = _LETTER_PIECES[letter] if letter else PAWN
+    t = (int(to_name[1]) - 1) * 8 + _FILES.index(to_name[0])
+    promotion = _LETTER_PIECES[promo_letter.upper()] if promo_letter else 0
+
+    if legal_moves is None:
+        code = ptype | side
+        file_index = _FILES.index(from_file) if from_file else -1
+        if ptype == PAWN and file_index < 0:
+            file_index = t & 7  # pawn เดินตรง: อยู่ file เดียวกับช่องปลายทาง
+        rank_index = int(from_rank) - 1 if from_rank else -1
+        legal_moves = []
+        for sq in range(64):
+            if squares[sq] != code or (file_index >= 0 and sq & 7 != file_index):
+                continue
+            if rank_index >= 0 and sq >> 3 != rank_index:
+                continue
+            legal_moves.extend(generate_legal_moves(position, sq))
+
+    candidates = []
+    for move in legal_moves:
+        s = move & 63
+        if (move >> 6) & 63 != t or squares[s] & TYPE_MASK != ptype or (move >> 12) & FLAG_CASTLE:
+            continue
+        if from_file and (s & 7) != _FILES.index(from_file):
+            continue
+        if from_rank and (s >> 3) != int(from_rank) - 1:
+            continue
+        if (move >> 17) != promotion:
+            continue
+        candidates.append(move)
+
+    if not candidates:
+        raise ValueError(f"Illegal SAN move: {san!r}")
+    if len(candidates) > 1:
+        raise ValueError(f"Ambiguous SAN move: {san!r}")
+    return candidates[0]
+
+
+def moves_to_san(position: Position, moves: Iterable[int]) -> List[str]:
+    """SAN ของ move ต่อเนื่องหลายตา (เช่น PV / ทั้งเกม) เดินจริงแล้วย้อนกลับ — position เหมือนเดิมเมื่อจบ"""
+    sans: List[str] = []
+    played = 0
+    try:
+        for move in moves:
+            sans.append(move_to_san(position, move))
+            position.make_move(move)
+            played += 1
+    finally:
+        for _ in range(played):
+            position.unmake_move()
+    return sans
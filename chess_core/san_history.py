@@ -3,15 +3,6 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-import chess
-
-_FILES = "abcdefgh"
-
-
-def _to_uci_square(x: int, y: int) -> str:
-    # x=0 -> rank1, y=0 -> file a
-    return f"{_FILES[y]}{x + 1}"
-
 
 @dataclass
 class SanHistory:
@@ -20,25 +11,12 @@ class SanHistory:
     def reset(self) -> None:
         self.sans.clear()
 
-    def push_from_fen_and_coords(
-        self,
-        fen_before_move: str,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-        promotion: Optional[str] = None,
-    ) -> str:
-        uci = _to_uci_square(x1, y1) + _to_uci_square(x2, y2)
-        if promotion:
-            uci += promotion.lower()
-
-        board = chess.Board(fen_before_move)
-        move = chess.Move.from_uci(uci)
-
-        san = board.san(move)
-        board.push(move)
+    def pop(self) -> Optional[str]:
+        # ใช้ตอน takeback
+        return self.sans.pop() if self.sans else None
 
+    def push(self, san: str) -> str:
+        # SAN คำนวณจาก position ของ engine เอง (chess_core.san.move_to_san)
         self.sans.append(san)
         return san
 
@@ -0,0 +1,110 @@
+"""
+SEE (static exchange evaluation): ผลได้เสีย material (centipawn) ของการกินกันต่อเนื่องบนช่องเดียว
+ถ้าทั้งสองฝ่ายกินกลับด้วยหมากที่ถูกที่สุดก่อน และหยุดได้เมื่อกินต่อแล้วขาดทุน
+
+    see(position, move) > 0   กินแล้วได้ material
+    see(position, move) == 0  แลกเท่ากัน
+    see(position, move) < 0   กินแล้วเสีย material
+
+ใช้ทั้งใน quiescence search (ตัด capture ที่ขาดทุน) และ UI (สีของ legal_capture)
+ไม่ดู pin / check — เป็นค่าประมาณแบบเดียวกับ engine ทั่วไป
+"""
+from __future__ import annotations
+
+from chess_core.pieces import PIECE_CLASSES, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, BLACK, TYPE_MASK
+from chess_core.position import Position
+from chess_core.moves import FLAG_CAPTURE, FLAG_EN_PASSANT
+from chess_core.attacks import KNIGHT_TARGETS, KING_TARGETS, ROOK_RAYS, BISHOP_RAYS, PAWN_ATTACKERS
+
+# centipawn ต่อชนิดหมาก (index = type) ; คิงใช้ Piece.VALUE ตรง ๆ (สูงมาก = ห้ามโดนกิน)
+SEE_VALUES = [0] * 8
+for _ptype, _cls in PIECE_CLASSES.items():
+    SEE_VALUES[_ptype] = _cls.VALUE * 100
+
+
+def least_valuable_attacker(squares, sq: int, by_white: bool) -> int:
+    """ช่องของหมากฝ่าย by_white ที่ถูกที่สุดซึ่งโจมตี sq ได้ ; ไม่มี -> -1"""
+    side = 0 if by_white else BLACK
+
+    pawn = PAWN | side
+    for s in PAWN_ATTACKERS[0 if by_white else 1][sq]:
+        if squares[s] == pawn:
+            return s
+
+    knight = KNIGHT | side
+    for s in KNIGHT_TARGETS[sq]:
+        if squares[s] == knight:
+            return s
+
+    # slider: ตัวแรกที่ขวางในแต่ละ ray ; เลือกชนิดที่ถูกที่สุด (bishop < rook < queen)
+    best, best_type = -1, KING
+    bishop, rook, queen = BISHOP | side, ROOK | side, QUEEN | side
+    for ray in BISHOP_RAYS:
+        for s in ray[sq]:
+            code = squares[s]
+            if code:
+                if code == bishop:
+                    return s
+                if code == queen and best_type > QUEEN:
+                    best, best_type = s, QUEEN
+                break
+    for ray in ROOK_RAYS:
+        for s in ray[sq]:
+            code = squares[s]
+            if code:
+                if code == rook:
+                    return s
+                if code == queen and best_type > QUEEN:
+                    best, best_type = s, QUEEN
+                break
+    if best >= 0:
+        return best
+
+    king = KING | side
+    for s in KING_TARGETS[sq]:
+        if squares[s] == king:
+            return s
+    return -1
+
+
+def see(position: Position, move: int) -> int:
+    """ผลได้เสีย (centipawn) ของ move จากมุมฝ่ายที่เดิน ; move ที่ไม่ใช่ capture / promotion ก็ใช้ได้ (ดูว่าโดนกินฟรีไหม)"""
+    squares = bytearray(position.squares)  # สำเนา: เอาหมากที่กินแล้วออก -> x-ray โผล่เอง
+    s = move & 63
+    t = (move >> 6) & 63
+    flags = (move >> 12) & 31
+    promotion = move >> 17
+
+    code = squares[s]
+    if flags & FLAG_EN_PASSANT:
+        victim = PAWN
+        squares[(s & ~7) | (t & 7)] = 0
+    else:
+        victim = squares[t] & TYPE_MASK if flags & FLAG_CAPTURE else 0
+
+    gains = [SEE_VALUES[victim]]
+    if promotion:
+        gains[0] += SEE_VALUES[promotion] - SEE_VALUES[PAWN]
+        code = promotion | (code & BLACK)
+    squares[s] = 0
+    squares[t] = code
+    on_square = code & TYPE_MASK  # หมากที่ยืนอยู่บน t (จะโดนกินต่อ)
+    white = not (code & BLACK)
+
+    while True:
+        white = not white
+        attacker = least_valuable_attacker(squares, t, white)
+        if attacker < 0:
+            break
+        attacker_code = squares[attacker]
+        if attacker_code & TYPE_MASK == KING and least_valuable_attacker(squares, t, not white) >= 0:
+            break  # คิงกินเข้าช่องที่ยังโดนโจมตีไม่ได้
+        gains.append(SEE_VALUES[on_square] - gains[-1])
+        squares[attacker] = 0
+        squares[t] = attacker_code
+        on_square = attacker_code & TYPE_MASK
+
+    # ย้อนจากท้าย: แต่ละฝ่ายเลือกได้ว่าจะกินต่อหรือหยุด
+    for i in range(len(gains) - 1, 0, -1):
+        gains[i - 1] = -max(-gains[i - 1], gains[i])
+    return gains[0]
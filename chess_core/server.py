@@ -0,0 +1,355 @@
+"""
+asyncio game server: หลายเกมพร้อมกันใน process เดียว (คน-คน / คน-engine) คุยกันด้วย JSON ทีละบรรทัด (NDJSON)
+
+    python -m chess_core.server --port 8765 --engine-workers 4
+    python -m chess_core.server --unix /tmp/chess.sock
+
+request 1 บรรทัด -> response 1 บรรทัด ; ใส่ "id" มาใน request แล้วจะได้ "id" เดิมกลับ (ส่งหลาย request ต่อกันได้)
+    {"op": "new", "engine": "black", "movetime": 0.2, "fen": "..."}  -> {"ok": true, "game": "g1", "fen": ..., "status": ...}
+    {"op": "move", "game": "g1", "move": "e2e4"}                      -> {"ok": true, "san": "e4", ..., "reply": {...}}
+    {"op": "state", "game": "g1"}   {"op": "close", "game": "g1"}   {"op": "list"}   {"op": "stats"}   {"op": "ping"}
+    ใส่ "legal": true ใน new / move / state เพื่อขอ legal move (UCI) ของฝ่ายที่ต้องเดิน
+error -> {"ok": false, "error": "..."}
+
+backpressure: แต่ละ connection มี request ค้างได้ไม่เกิน --max-inflight (เกินแล้วหยุดอ่าน socket -> TCP ชะลอ client เอง),
+search ของ engine รอคิวไม่เกิน --max-searches และส่งออกไปทำใน executor (process pool) ไม่บล็อก event loop
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from chess_core.position import Position
+from chess_core.fen import from_fen
+from chess_core.moves import UCI_RE, move_to_uci
+from chess_core.movegen import generate_legal_moves, parse_uci_move
+from chess_core.san import move_to_san, parse_san
+from chess_core.engine import Engine, SearchLimits
+from chess_core.replay import game_result, ONGOING, START_FEN
+
+DEFAULT_MOVETIME = 0.2
+MAX_MOVETIME = 10.0
+ENGINE_HASH_MB = 8  # TT ต่อ engine (1 ตัวต่อ worker process / thread ; memory คงที่ ไม่ขึ้นกับจำนวนเกม)
+LINE_LIMIT = 1 << 16
+
+
+# ----- engine (รันใน executor) -----
+# Engine ต่อ thread: --executor thread มีหลาย thread ใน process เดียว และ Engine (TT / PV / stop flag) ใช้ร่วมกันไม่ได้
+_local = threading.local()
+
+
+def _engine() -> Engine:
+    engine = getattr(_local, "engine", None)
+    if engine is None:
+        engine = _local.engine = Engine(ENGINE_HASH_MB)
+    return engine
+
+
+def _engine_task(task: Tuple[str, List[str], float]) -> Optional[str]:
+    # สร้าง position จาก FEN เริ่มต้น + move ทั้งเกม (ได้ repetition history ครบ) แล้วค้น ; คืน UCI ของ best move
+    fen, moves, movetime = task
+    position = from_fen(fen)
+    for token in moves:
+        position.make_move(parse_uci_move(position, token))
+    result = _engine().search(position, SearchLimits(movetime=movetime))
+    return move_to_uci(result.best_move) if result.best_move else None
+
+
+# ----- registry -----
+@dataclass
+class Game:
+    id: str
+    position: Position
+    start_fen: str
+    engine_iswhite: Optional[bool] = None  # None = คนเล่นทั้งสองฝ่าย
+    movetime: float = DEFAULT_MOVETIME
+    moves: List[str] = field(default_factory=list)  # UCI ตั้งแต่ start_fen (ส่งให้ engine process)
+    sans: List[str] = field(default_factory=list)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)  # move ของเกมเดียวกันทำทีละ move ตามลำดับที่มาถึง
+
+    def engine_to_move(self) -> bool:
+        return self.engine_iswhite is not None and self.position.white_to_move == self.engine_iswhite
+
+    def summary(self, legal: bool = False) -> dict:
+        result = game_result(self.position, len(self.moves))
+        data = {
+            "game": self.id,
+            "fen": result.final_fen,
+            "status": result.status,
+            "result": result.result,
+            "plies": len(self.moves),
+        }
+        if legal:
+            data["legal"] = [move_to_uci(m) for m in generate_legal_moves(self.position)]
+        return data
+
+
+class RequestError(Exception):
+    pass
+
+
+class GameServer:
+
+    def __init__(
+        self,
+        executor: Executor,
+        max_games: int = 10000,
+        max_inflight: int = 16,
+        max_searches: int = 64,
+    ) -> None:
+        self.executor = executor
+        self.max_games = max_games
+        self.max_inflight = max_inflight
+        self.games: Dict[str, Game] = {}
+        self._ids = itertools.count(1)
+        self._searches = asyncio.Semaphore(max_searches)
+        self.stats = {"connections": 0, "requests": 0, "moves": 0, "engine_moves": 0, "errors": 0}
+        self.started = time.perf_counter()
+
+    # ----- connection -----
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats["connections"] += 1
+        inflight = asyncio.Semaphore(self.max_inflight)
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(line: bytes) -> None:
+            try:
+                response = await self.dispatch(line)
+                data = (json.dumps(response, separators=(",", ":")) + "\n").encode()
+                async with write_lock:
+                    writer.write(data)
+                    await writer.drain()  # client อ่านไม่ทัน -> รอตรงนี้ (ไม่กอง buffer ไว้ใน server)
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+            finally:
+                inflight.release()
+
+        try:
+            while True:
+                # request ค้างครบ max_inflight -> ไม่อ่าน request ใหม่จนกว่าจะตอบไปบ้าง
+                await inflight.acquire()
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    inflight.release()
+                    break  # บรรทัดยาวเกิน LINE_LIMIT
+                if not line:
+                    inflight.release()
+                    break
+                task = asyncio.ensure_future(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, line: bytes) -> dict:
+        self.stats["requests"] += 1
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                raise RequestError("invalid JSON")
+            if not isinstance(request, dict):
+                raise RequestError("request must be a JSON object")
+            request_id = request.get("id")
+            op = request.get("op")
+            handler = self._handlers.get(op) if isinstance(op, str) else None
+            if handler is None:
+                raise RequestError(f"unknown op: {op!r}")
+            response = await handler(self, request)
+            response["ok"] = True
+        except RequestError as exc:
+            self.stats["errors"] += 1
+            response = {"ok": False, "error": str(exc)}
+        except Exception as exc:  # bug / input แปลก ๆ ที่ไม่ได้ตรวจ: ต้องตอบเสมอ ไม่งั้น client รอค้าง
+            self.stats["errors"] += 1
+            response = {"ok": False, "error": f"internal error: {type(exc).__name__}: {exc}"}
+        if request_id is not None:
+            response["id"] = request_id
+        return response
+
+    # ----- ops -----
+    @staticmethod
+    def _str_field(request: dict, name: str, default: Optional[str] = None) -> Optional[str]:
+        value = request.get(name, default)
+        if value is not None and not isinstance(value, str):
+            raise RequestError(f"{name} must be a string")
+        return value
+
+    def _game(self, request: dict) -> Game:
+        game_id = self._str_field(request, "game")
+        game = self.games.get(game_id) if game_id is not None else None
+        if game is None:
+            raise RequestError(f"unknown game: {game_id!r}")
+        return game
+
+    async def op_new(self, request: dict) -> dict:
+        if len(self.games) >= self.max_games:
+            raise RequestError("server is full")
+        fen = self._str_field(request, "fen") or START_FEN
+        try:
+            position = from_fen(fen)
+        except ValueError as exc:
+            raise RequestError(str(exc))
+        side = request.get("engine")
+        if side not in (None, "white", "black"):
+            raise RequestError("engine must be 'white', 'black' or null")
+        try:
+            movetime = min(max(float(request.get("movetime", DEFAULT_MOVETIME)), 0.01), MAX_MOVETIME)
+        except (TypeError, ValueError):
+            raise RequestError("movetime must be a number")
+
+        game = Game(f"g{next(self._ids)}", position, fen, None if side is None else side == "white", movetime)
+        self.games[game.id] = game
+        response = {}
+        async with game.lock:
+            if game.engine_to_move() and game_result(position, 0).status == ONGOING:
+                try:
+                    response["reply"] = await self._engine_reply(game)
+                except RequestError:
+                    del self.games[game.id]  # client ไม่ได้ game id กลับไป -> ไม่มีใครปิดเกมนี้
+                    raise
+            response.update(game.summary(request.get("legal", False)))
+        return response
+
+    async def op_move(self, request: dict) -> dict:
+        game = self._game(request)
+        text = self._str_field(request, "move", "")
+        async with game.lock:
+            position = game.position
+            if game.engine_to_move():
+                raise RequestError("engine is to move")
+            if game_result(position, len(game.moves)).status != ONGOING:
+                raise RequestError("game is over")
+            try:
+                move = parse_uci_move(position, text) if UCI_RE.fullmatch(text) else parse_san(position, text)
+            except ValueError as exc:
+                raise RequestError(str(exc))
+            san = self._play(game, move)
+            response = {"move": move_to_uci(move), "san": san}
+            if game.engine_to_move() and game_result(position, len(game.moves)).status == ONGOING:
+                response["reply"] = await self._engine_reply(game)
+            response.update(game.summary(request.get("legal", False)))
+        return response
+
+    async def op_state(self, request: dict) -> dict:
+        game = self._game(request)
+        async with game.lock:  # รอ move (และคำตอบของ engine) ที่ส่งมาก่อนหน้าให้จบก่อน
+            response = game.summary(request.get("legal", False))
+            response["moves"] = list(game.sans)
+        return response
+
+    async def op_close(self, request: dict) -> dict:
+        game = self._game(request)
+        del self.games[game.id]
+        return {"game": game.id}
+
+    async def op_list(self, request: dict) -> dict:
+        return {"games": list(self.games)}
+
+    async def op_stats(self, request: dict) -> dict:
+        return dict(self.stats, games=len(self.games), uptime=time.perf_counter() - self.started)
+
+    async def op_ping(self, request: dict) -> dict:
+        return {}
+
+    _handlers = {
+        "new": op_new,
+        "move": op_move,
+        "state": op_state,
+        "close": op_close,
+        "list": op_list,
+        "stats": op_stats,
+        "ping": op_ping,
+    }
+
+    # ----- helpers -----
+    def _play(self, game: Game, move: int) -> str:
+        san = move_to_san(game.position, move)
+        game.position.make_move(move)
+        game.moves.append(move_to_uci(move))
+        game.sans.append(san)
+        self.stats["moves"] += 1
+        return san
+
+    async def _engine_reply(self, game: Game) -> dict:
+        # เรียกขณะถือ game.lock ; search ไปทำใน executor — event loop ตอบเกมอื่นต่อได้
+        async with self._searches:
+            loop = asyncio.get_running_loop()
+            try:
+                token = await loop.run_in_executor(
+                    self.executor, _engine_task, (game.start_fen, list(game.moves), game.movetime)
+                )
+            except Exception as exc:  # worker ตาย / replay ไม่ผ่าน -> ตอบ error แทนการเงียบหาย
+                raise RequestError(f"engine failed: {exc}")
+        if token is None:
+            raise RequestError("engine returned no move")
+        try:
+            move = parse_uci_move(game.position, token)
+        except ValueError:
+            raise RequestError(f"engine returned an illegal move: {token}")
+        san = self._play(game, move)
+        self.stats["engine_moves"] += 1
+        return {"move": token, "san": san}
+
+
+def make_executor(kind: str, workers: int) -> Executor:
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    executor = make_executor(args.executor, args.engine_workers)
+    server = GameServer(executor, args.max_games, args.max_inflight, args.max_searches)
+    if args.unix:
+        listener = await asyncio.start_unix_server(server.handle_connection, path=args.unix, limit=LINE_LIMIT)
+        where = args.unix
+    else:
+        listener = await asyncio.start_server(
+            server.handle_connection, args.host, args.port, limit=LINE_LIMIT, backlog=1024
+        )
+        where = f"{args.host}:{args.port}"
+    print(f"chess server listening on {where}", file=sys.stderr, flush=True)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m chess_core.server", description="multi-game NDJSON server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on a Unix socket path instead of TCP")
+    parser.add_argument("--engine-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--executor", choices=("process", "thread"), default="process")
+    parser.add_argument("--max-games", type=int, default=10000)
+    parser.add_argument("--max-inflight", type=int, default=16, help="pending requests per connection")
+    parser.add_argument("--max-searches", type=int, default=64, help="engine searches queued or running")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
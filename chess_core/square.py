@@ -1,15 +1,19 @@
+from chess_core.pieces import EMPTY, PIECE_CLASSES, BLACK
+
 #   A classe Square representa o quadrado no tabuleiro e armazena uma peça. Caso não tenha nenhuma
 #peça no quadrado, Square amazena um EmptySquare
+#   Square agora é uma "view" de uma casa de Position.squares: .piece lê/escreve o código inteiro
+#direto no bytearray, então nenhum objeto novo é criado a cada lance.
 
 class EmptySquare:
 
-    def __init__(self) -> None:
-        self.iswhite = None
-        self.moved = None
-        self.value = 0
-        self.image = "images/Clear.png"
-        self.selected = False
-        self.selected_image = "images/selected-clear.png"
+    __slots__ = ()
+
+    iswhite = None
+    code = EMPTY
+    value = 0
+    image = "images/Clear.png"
+    selected_image = "images/selected-clear.png"
 
     def __str__(self) -> str:
         return '.'
@@ -17,30 +21,67 @@ class EmptySquare:
     def possible_move(start, end):
         return False
     
-    def get_selected_image(self):
-        if self.selected:
+    def get_selected_image(self, selected: bool = False):
+        if selected:
             return self.selected_image
         return self.image
 
 
+# view ของหมากต่อ code (ใช้ instance เดียวร่วมกัน)
+PIECE_VIEWS = [EmptySquare()] * 16
+for _ptype, _cls in PIECE_CLASSES.items():
+    PIECE_VIEWS[_ptype] = _cls(True)
+    PIECE_VIEWS[_ptype | BLACK] = _cls(False)
+
+
 class Square:
 
-    def __init__(self, x, y, piece = None) -> None:
+    __slots__ = (
+        "x", "y", "_cells", "_index", "_position", "legal_move", "legal_capture", "capture_gain", "legal_castle", "selected"
+    )
+
+    def __init__(self, x, y, piece = None, cells = None, position = None) -> None:
 
         self.x = x
         self.y = y
 
+        # cells=None -> Square เดี่ยวที่เก็บหมากเอง (ไม่ผูกกับ Position)
+        if cells is None:
+            self._cells = bytearray(1)
+            self._index = 0
+        else:
+            self._cells = cells
+            self._index = x * 8 + y
+        # Position เจ้าของ cells (ถ้ามี): เขียนหมากผ่าน .piece แล้วต้องคำนวณ hash / eval ใหม่
+        self._position = position
+
         # UI hints (show legal moves)
         self.legal_move = False       # ช่องว่างที่เดินได้
         self.legal_capture = False    # ช่องที่กินได้
+        self.capture_gain = 0         # SEE ของการกินช่องนี้ (centipawn): >0 ได้, <0 เสีย material
         self.legal_castle = False     # ช่อง castling (ปลายทาง king)
+        self.selected = False         # highlight (ช่องที่เลือก / คิงที่โดนรุกจน)
 
-        if piece == None:
-            self.piece = EmptySquare()
-        else:
+        if piece is not None:
             self.piece = piece
+
+    @property
+    def index(self) -> int:
+        return self.x * 8 + self.y
+
+    @property
+    def piece(self):
+        return PIECE_VIEWS[self._cells[self._index]]
+
+    @piece.setter
+    def piece(self, piece) -> None:
+        self._cells[self._index] = EMPTY if piece is None else piece.code
+        position = self._position
+        if position is not None:
+            # วางหมากตรง ๆ ไม่ผ่าน make_move: คำนวณ king / hash / eval ใหม่ทั้งกระดาน (ย้อนด้วย unmake_move ไม่ได้)
+            position.refresh_kings()
+            position.refresh_hash()
+            position.refresh_eval()
         
     def __repr__(self) -> str:
-        if self.piece == None:
-            return '.'
-        return self.piece.__str__()
\ No newline at end of file
+        return self.piece.__str__()
@@ -0,0 +1,147 @@
+"""
+transposition table ขนาดคงที่: จองเป็น array('Q') ก้อนเดียวตามจำนวน MB (ไม่มี dict/obj ต่อ entry)
+
+entry = 2 ช่อง 64 bit: [Zobrist key, data] โดย data อัดไว้ใน int เดียว
+    bit 0-19   best move (int move จาก chess_core.moves)
+    bit 20-27  depth
+    bit 28-29  bound (0 = ว่าง, EXACT / LOWER / UPPER)
+    bit 30-49  score + SCORE_OFFSET
+    bit 50-55  age (search ครั้งที่เท่าไร, วนที่ 64)
+1 bucket = 2 entry ; ตอนเก็บเลือกทับ entry ที่ "ค่าน้อยกว่า": ว่าง > มาจาก search เก่า > depth ต่ำกว่า
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Optional, Tuple
+
+EXACT = 1
+LOWER = 2   # score >= ค่าที่เก็บ (fail high)
+UPPER = 3   # score <= ค่าที่เก็บ (fail low)
+
+_MOVE_MASK = (1 << 20) - 1
+_DEPTH_SHIFT = 20
+_BOUND_SHIFT = 28
+_SCORE_SHIFT = 30
+_SCORE_MASK = (1 << 20) - 1
+SCORE_OFFSET = 1 << 19
+_AGE_SHIFT = 50
+_AGE_MASK = 63
+
+_ENTRY_BYTES = 16
+_BUCKET_BYTES = 2 * _ENTRY_BYTES
+
+
+class TranspositionTable:
+
+    def __init__(self, size_mb: float = 16) -> None:
+        self.size_mb = 0.0
+        self._table = array("Q")
+        self._mask = 0
+        self._age = 0
+        self.resize(size_mb)
+
+    def resize(self, size_mb: float) -> None:
+        # จำนวน bucket ปัดลงเป็นกำลังสอง (index = key & mask) ; ไม่เกิน size_mb
+        buckets = max(1, int(size_mb * (1 << 20)) // _BUCKET_BYTES)
+        buckets = 1 << (buckets.bit_length() - 1)
+        self._table = array("Q", bytes(buckets * _BUCKET_BYTES))
+        self._mask = buckets - 1
+        self.size_mb = buckets * _BUCKET_BYTES / (1 << 20)
+        self.reset_stats()
+
+    def clear(self) -> None:
+        self._table = array("Q", bytes(len(self._table) * 8))
+        self._age = 0
+        self.reset_stats()
+
+    def new_search(self) -> None:
+        # entry จาก search ก่อน ๆ จะถูกทับก่อน (aging)
+        self._age = (self._age + 1) & _AGE_MASK
+
+    # ----- stats -----
+    def reset_stats(self) -> None:
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.probes if self.probes else 0.0
+
+    def hashfull(self) -> int:
+        # ต่อพัน: entry ของ search ปัจจุบันใน 500 bucket แรก (แบบเดียวกับ UCI "hashfull")
+        t = self._table
+        age = self._age
+        sample = min(500, self._mask + 1)
+        used = 0
+        for i in range(0, sample * 4, 2):
+            data = t[i + 1]
+            if data and (data >> _AGE_SHIFT) & _AGE_MASK == age:
+                used += 1
+        return used * 1000 // (sample * 2)
+
+    def stats(self) -> dict:
+        return {
+            "size_mb": self.size_mb,
+            "probes": self.probes,
+            "hits": self.hits,
+            "hit_rate": self.hit_rate,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+            "hashfull": self.hashfull(),
+        }
+
+    # ----- probe / store -----
+    def probe(self, key: int) -> Optional[Tuple[int, int, int, int]]:
+        """(move, depth, score, bound) ของ key นี้ หรือ None"""
+        self.probes += 1
+        t = self._table
+        i = (key & self._mask) << 2
+        if t[i] == key and t[i + 1]:
+            data = t[i + 1]
+        elif t[i + 2] == key and t[i + 3]:
+            data = t[i + 3]
+        else:
+            return None
+        self.hits += 1
+        return (
+            data & _MOVE_MASK,
+            (data >> _DEPTH_SHIFT) & 255,
+            ((data >> _SCORE_SHIFT) & _SCORE_MASK) - SCORE_OFFSET,
+            (data >> _BOUND_SHIFT) & 3,
+        )
+
+    def store(self, key: int, depth: int, score: int, bound: int, move: int) -> None:
+        t = self._table
+        i = (key & self._mask) << 2
+
+        if t[i] == key and t[i + 1]:
+            slot = i
+        elif t[i + 2] == key and t[i + 3]:
+            slot = i + 2
+        else:
+            slot = i if self._worth(t[i + 1]) <= self._worth(t[i + 3]) else i + 2
+            if t[slot + 1]:
+                self.overwrites += 1
+
+        old = t[slot + 1]
+        if not move and old and t[slot] == key:
+            move = old & _MOVE_MASK  # ไม่มี best move ใหม่: เก็บของเดิมไว้ใช้เรียง move
+
+        t[slot] = key
+        t[slot + 1] = (
+            move
+            | min(max(depth, 0), 255) << _DEPTH_SHIFT
+            | bound << _BOUND_SHIFT
+            | (score + SCORE_OFFSET) << _SCORE_SHIFT
+            | self._age << _AGE_SHIFT
+        )
+        self.stores += 1
+
+    def _worth(self, data: int) -> int:
+        # ค่าของ entry เมื่อต้องเลือกทับ: ว่าง = ต่ำสุด, อายุมากขึ้น 1 search = เสีย depth ไป 16
+        if not data:
+            return -1 << 20
+        age = (self._age - (data >> _AGE_SHIFT)) & _AGE_MASK
+        return ((data >> _DEPTH_SHIFT) & 255) - 16 * age
@@ -0,0 +1,255 @@
+"""
+UCI front-end: ใช้ engine แบบไม่มีหน้าจอ (tournament manager / batch analysis)
+
+    python -m chess_core.uci
+
+คำสั่งที่รองรับ: uci, isready, ucinewgame, setoption (Hash / Threads / BookFile), position [startpos | fen ...] [moves ...],
+go [depth | movetime | wtime btime winc binc movestogo | nodes | infinite], stop, quit
+
+stdin อ่านบน main thread ส่วน search รันใน thread แยก — "stop" / "isready" ตอบได้ทันทีระหว่างคิด
+ตั้ง BookFile (Polyglot .bin) แล้ว go ของ position ที่อยู่ใน book ตอบ bestmove ทันทีโดยไม่ค้น
+"""
+from __future__ import annotations
+
+import sys
+import threading
+from typing import List, Optional, TextIO
+
+from chess_core.position import Position
+from chess_core.fen import from_fen
+from chess_core.engine import Engine, SearchLimits, SearchResult, DEFAULT_HASH_MB
+from chess_core.replay import START_FEN
+from chess_core.moves import move_to_uci
+from chess_core.movegen import parse_uci_move
+from chess_core.polyglot import OpeningBook
+
+ENGINE_NAME = "Project_Chess_Kivy"
+ENGINE_AUTHOR = "Project_Chess_Kivy contributors"
+
+MIN_HASH_MB, MAX_HASH_MB = 1, 1024
+# search เป็น Python thread เดียว (GIL) -> รับค่า Threads ได้แต่ใช้ 1 เสมอ ; farm ควรรันหลาย process แทน
+MAX_THREADS = 1
+
+_GO_INT_ARGS = ("depth", "movetime", "wtime", "btime", "winc", "binc", "movestogo", "nodes")
+
+
+def _time_budget(args: dict, white_to_move: bool) -> Optional[float]:
+    """เวลาคิด (วินาที) จากคำสั่ง go ; None = ไม่จำกัดเวลา"""
+    if "movetime" in args:
+        return max(args["movetime"], 1) / 1000.0
+    remaining = args.get("wtime" if white_to_move else "btime")
+    if remaining is None:
+        return None
+    increment = args.get("winc" if white_to_move else "binc", 0)
+    moves_to_go = args.get("movestogo") or 30
+    budget = remaining / moves_to_go + increment * 0.8
+    # กันเวลาหมด: ไม่เกินครึ่งของเวลาที่เหลือ และเผื่อ overhead ของ I/O 50 ms
+    budget = min(budget, remaining * 0.5, remaining - 50)
+    return max(budget, 10) / 1000.0
+
+
+def format_info(result: SearchResult, hashfull: int) -> str:
+    if result.mate_in is not None:
+        score = f"mate {result.mate_in}"
+    else:
+        score = f"cp {result.score}"
+    ms = int(result.time * 1000)
+    nps = int(result.nodes / result.time) if result.time > 0 else 0
+    line = f"info depth {result.depth} score {score} nodes {result.nodes} nps {nps} time {ms} hashfull {hashfull}"
+    if result.pv:
+        line += " pv " + " ".join(result.pv_uci())
+    return line
+
+
+class UciEngine:
+    """สถานะของ 1 session UCI: position ปัจจุบัน + Engine + search thread"""
+
+    def __init__(self, out: TextIO = sys.stdout) -> None:
+        self.out = out
+        self.engine = Engine(DEFAULT_HASH_MB)
+        self.position = Position.initial()
+        self.threads = 1
+        self.book: Optional[OpeningBook] = None
+        self._search: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._infinite = False
+        self._lock = threading.Lock()
+
+    def send(self, line: str) -> None:
+        # search thread กับ main thread เขียนพร้อมกันได้ -> ล็อกทีละบรรทัด
+        with self._lock:
+            self.out.write(line + "\n")
+            self.out.flush()
+
+    # ----- commands -----
+    def handle(self, line: str) -> bool:
+        """รันคำสั่ง 1 บรรทัด ; คืน False เมื่อได้ quit"""
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+
+        if command == "uci":
+            self.send(f"id name {ENGINE_NAME}")
+            self.send(f"id author {ENGINE_AUTHOR}")
+            self.send(f"option name Hash type spin default {DEFAULT_HASH_MB} min {MIN_HASH_MB} max {MAX_HASH_MB}")
+            self.send(f"option name Threads type spin default 1 min 1 max {MAX_THREADS}")
+            self.send("option name BookFile type string default <empty>")
+            self.send("uciok")
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "ucinewgame":
+            self.stop()
+            self.engine.new_game()
+            self.position = Position.initial()
+        elif command == "setoption":
+            self.stop()
+            self.set_option(args)
+        elif command == "position":
+            self.stop()
+            self.set_position(args)
+        elif command == "go":
+            self.stop()
+            self.go(args)
+        elif command == "stop":
+            self.stop()
+        elif command == "quit":
+            self.stop()
+            return False
+        elif command not in ("debug", "register", "ponderhit"):
+            self.send(f"info string unknown command: {command}")
+        return True
+
+    def set_option(self, args: List[str]) -> None:
+        # setoption name <id> [value <x>]
+        text = " ".join(args)
+        if not text.startswith("name "):
+            return
+        name, _, value = text[5:].partition(" value ")
+        name = name.strip().lower()
+        if name == "bookfile":
+            self.set_book(value.strip())
+            return
+        try:
+            number = int(value.strip())
+        except ValueError:
+            self.send(f"info string bad value for {name}: {value!r}")
+            return
+        if name == "hash":
+            self.engine.tt.resize(min(max(number, MIN_HASH_MB), MAX_HASH_MB))
+        elif name == "threads":
+            self.threads = min(max(number, 1), MAX_THREADS)
+        else:
+            self.send(f"info string unknown option: {name}")
+
+    def set_book(self, path: str) -> None:
+        if self.book is not None:
+            self.book.close()
+            self.book = None
+        if not path or path == "<empty>":
+            return
+        try:
+            self.book = OpeningBook(path)
+        except (OSError, ValueError) as exc:
+            self.send(f"info string cannot open book: {exc}")
+
+    def set_position(self, args: List[str]) -> None:
+        # position startpos [moves ...] | position fen <FEN> [moves ...]
+        if "moves" in args:
+            index = args.index("moves")
+            setup, moves = args[:index], args[index + 1:]
+        else:
+            setup, moves = args, []
+        if not setup:
+            return
+        fen = START_FEN if setup[0] == "startpos" else " ".join(setup[1:])
+        try:
+            position = from_fen(fen)
+        except ValueError as exc:
+            # FEN เสีย: ใช้ตำแหน่งเริ่มต้นแทน (ห้ามค้าง position เก่า — go ถัดไปจะค้นผิดกระดาน)
+            self.send(f"info string {exc}; using startpos")
+            position = from_fen(START_FEN)
+        # move ผิด: เดินเฉพาะส่วนที่ถูกก่อนหน้า แล้วแจ้ง token ที่เสีย
+        for token in moves:
+            try:
+                position.make_move(parse_uci_move(position, token))
+            except ValueError as exc:
+                self.send(f"info string {exc}; ignoring it and the moves after it")
+                break
+        self.position = position
+
+    def go(self, args: List[str]) -> None:
+        parsed: dict = {}
+        for i, token in enumerate(args[:-1]):
+            if token in _GO_INT_ARGS:
+                try:
+                    parsed[token] = int(args[i + 1])
+                except ValueError:
+                    pass
+        infinite = "infinite" in args or "ponder" in args
+        if self.book is not None and not infinite:
+            move = self.book.choose(self.position)
+            if move is not None:
+                self.send("info string book move")
+                self.send(f"bestmove {move_to_uci(move)}")
+                return
+        limits = SearchLimits(
+            depth=parsed.get("depth"),
+            movetime=None if infinite else _time_budget(parsed, self.position.white_to_move),
+            nodes=parsed.get("nodes"),
+        )
+        # search กับ snapshot: คำสั่ง position ที่มาระหว่างคิดไม่ชน board ของ search
+        position = self.position.copy()
+        self._stopped.clear()
+        self._infinite = infinite
+        self._search = threading.Thread(target=self._run_search, args=(position, limits, infinite), daemon=True)
+        self._search.start()
+
+    def stop(self) -> None:
+        # หยุด search ที่รันอยู่ (ถ้ามี) แล้วรอให้ส่ง bestmove ก่อนทำคำสั่งถัดไป
+        search = self._search
+        if search is None:
+            return
+        self._stopped.set()
+        # search() ล้าง flag stop ตอนเริ่ม -> ถ้า stop มาเร็วกว่านั้นต้องสั่งซ้ำจนกว่า thread จะจบ
+        while search.is_alive():
+            self.engine.stop()
+            search.join(0.01)
+        self._search = None
+
+    def wait(self) -> None:
+        # stdin ปิด (เช่น pipe จาก batch script): ให้ search ที่มี limit ค้นจนจบก่อน ; infinite -> หยุดเลย
+        search = self._search
+        if search is not None and not self._infinite:
+            search.join()
+        self.stop()
+
+    def _run_search(self, position: Position, limits: SearchLimits, infinite: bool) -> None:
+        tt = self.engine.tt
+
+        def on_iteration(result: SearchResult) -> None:
+            self.send(format_info(result, tt.hashfull()))
+
+        result = self.engine.search(position, limits, on_iteration=on_iteration)
+        if infinite:
+            # go infinite: ห้ามส่ง bestmove ก่อนได้ stop แม้จะค้นจบแล้ว (เช่นเจอ mate)
+            self._stopped.wait()
+        best = move_to_uci(result.best_move) if result.best_move else "0000"
+        if len(result.pv) > 1:
+            self.send(f"bestmove {best} ponder {move_to_uci(result.pv[1])}")
+        else:
+            self.send(f"bestmove {best}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    uci = UciEngine()
+    # readline ทีละบรรทัด (ไม่รอ buffer เต็มเหมือน iterator ของไฟล์)
+    for line in iter(sys.stdin.readline, ""):
+        if not uci.handle(line.strip()):
+            return 0
+    uci.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+engine worker: ค้น / วิเคราะห์ position ใน thread เบื้องหลัง เพื่อไม่ให้ UI thread ค้าง
+
+    worker = EngineWorker(post=lambda fn: Clock.schedule_once(lambda _dt: fn(), 0))
+    worker.search(position, SearchLimits(movetime=1.0), on_done=..., on_progress=...)
+    worker.analyze(position, on_done=lambda status, reason: ...)
+    worker.cancel()
+
+งานทุกชิ้นทำกับ snapshot (Position.copy) — UI แก้ position ตัวจริงต่อได้ระหว่างที่ worker คิด
+callback ทุกตัวถูกส่งกลับผ่าน post (เช่น kivy Clock) จึงรันบน UI thread เสมอ
+cancel() / งานใหม่ ทำให้ผลของงานเก่าที่ยังค้างอยู่ถูกทิ้ง (ไม่เรียก callback)
+search แต่ละงานมี stop token (threading.Event) ของตัวเอง — cancel ก่อน search เริ่มจริงก็หยุดได้ทันที
+Engine (TT ขนาด hash_mb) สร้างตอนใช้ครั้งแรก — เล่นสองคนไม่มี search จึงไม่เสียเวลา / memory ตอนเปิดแอป
+
+ใช้ thread (ไม่ใช่ process) เพราะแอปต้องรันบนมือถือที่ multiprocessing ใช้ไม่ได้ ;
+search ปล่อย GIL ตาม switch interval ของ interpreter ทำให้ event loop ของ Kivy ยังได้รันทุก frame
+"""
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Callable, Optional
+
+from chess_core.position import Position
+from chess_core.engine import DEFAULT_HASH_MB, Engine, SearchLimits, SearchResult
+from chess_core.rules import analyze_position
+
+Post = Callable[[Callable[[], None]], None]
+
+
+def _call_now(fn: Callable[[], None]) -> None:
+    fn()
+
+
+class EngineWorker:
+    """1 thread + 1 Engine (TT / killer / history ใช้ต่อกันข้าม move ของเกมเดียวกัน)"""
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        post: Optional[Post] = None,
+        hash_mb: float = DEFAULT_HASH_MB,
+    ) -> None:
+        self._engine = engine
+        self._hash_mb = hash_mb
+        self._engine_lock = threading.Lock()
+        self._post = post or _call_now
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._generation = 0
+        self._cancel_token = threading.Event()  # token ของ generation ปัจจุบัน ; generation ใหม่ -> set ตัวเก่า
+        self._thread = threading.Thread(target=self._run, name="engine-worker", daemon=True)
+        self._thread.start()
+
+    @property
+    def engine(self) -> Engine:
+        # สร้างครั้งแรกที่ถูกเรียก (เปิดโหมดเล่นกับ engine หรือ search งานแรก) ; lock กัน UI thread กับ worker สร้างซ้อนกัน
+        if self._engine is None:
+            with self._engine_lock:
+                if self._engine is None:
+                    self._engine = Engine(self._hash_mb)
+        return self._engine
+
+    # ----- API (เรียกจาก UI thread) -----
+    def search(
+        self,
+        position: Position,
+        limits: SearchLimits,
+        on_done: Callable[[SearchResult], None],
+        on_progress: Optional[Callable[[SearchResult], None]] = None,
+    ) -> None:
+        """ค้น best move ของ position ปัจจุบัน ; on_progress ทุก depth ที่ค้นจบ, on_done ครั้งเดียวตอนจบ"""
+        generation = self._next_generation()
+        token = self._cancel_token
+        self._jobs.put((generation, self._search_job, (position.copy(), limits, token, on_done, on_progress)))
+
+    def analyze(self, position: Position, on_done: Callable[[str, Optional[str]], None]) -> None:
+        """ตรวจ checkmate / draw หลังเดิน (rules.analyze_position) ; on_done(status, draw reason)"""
+        generation = self._next_generation()
+        self._jobs.put((generation, self._analyze_job, (position.copy(), on_done)))
+
+    def cancel(self) -> None:
+        # ทิ้งงานที่ค้าง + หยุด search ที่กำลังรัน (ผลของ depth ล่าสุดก็ไม่ส่งกลับ)
+        self._next_generation()
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self._jobs.put(None)
+        self._thread.join(timeout=5)
+
+    # ----- worker thread -----
+    def _next_generation(self) -> int:
+        # set token ของงานเก่า (มีผลแม้ search ยังไม่เริ่ม) แล้วออก token ใหม่ให้งานถัดไป
+        self._cancel_token.set()
+        self._cancel_token = threading.Event()
+        self._generation += 1
+        return self._generation
+
+    def _current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def _deliver(self, generation: int, fn: Callable[[], None]) -> None:
+        # ตรวจซ้ำบน UI thread: ระหว่างรอ post อาจมี cancel / งานใหม่เข้ามาแล้ว
+        def run() -> None:
+            if self._current(generation):
+                fn()
+
+        self._post(run)
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            generation, handler, args = job
+            if self._current(generation):
+                handler(generation, *args)
+
+    def _search_job(self, generation, position, limits, token, on_done, on_progress) -> None:
+        def progress(result: SearchResult) -> None:
+            if on_progress is not None and self._current(generation):
+                self._deliver(generation, lambda: on_progress(result))
+
+        result = self.engine.search(position, limits, on_iteration=progress, stop=token)
+        self._deliver(generation, lambda: on_done(result))
+
+    def _analyze_job(self, generation, position, on_done) -> None:
+        status, reason = analyze_position(position)
+        self._deliver(generation, lambda: on_done(status, reason))
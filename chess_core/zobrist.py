@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import random
+
+from chess_core.pieces import PAWN, BLACK
+from chess_core.attacks import PAWN_ATTACKERS
+
+# Zobrist key 64 bit: XOR ของค่าสุ่มประจำ (หมาก, ช่อง) + สิทธิ์ castling + file ของ en passant + ฝ่ายที่เดิน
+# seed คงที่ -> key ของ position เดียวกันเท่ากันทุกครั้งที่รันโปรแกรม
+
+_rng = random.Random(0x5EED_C4E55)
+
+
+def _rand64() -> int:
+    return _rng.getrandbits(64)
+
+
+# PIECE_KEYS[code][sq] (code = ชนิด | BLACK ; แถว 0 = ช่องว่าง เป็น 0 เสมอ)
+PIECE_KEYS = [[0] * 64 if (code & 7) in (0, 7) else [_rand64() for _ in range(64)] for code in range(16)]
+CASTLING_KEYS = [0] + [_rand64() for _ in range(15)]
+EP_FILE_KEYS = [_rand64() for _ in range(8)]
+SIDE_KEY = _rand64()  # XOR เมื่อดำเป็นฝ่ายเดิน
+
+
+def ep_key(squares, ep_square: int, white_to_move: bool) -> int:
+    # นับ en passant เข้า key เฉพาะเมื่อมี pawn ของฝ่ายที่เดินพร้อมกินได้จริง
+    # (ไม่งั้น position เดียวกันหลัง double push จะได้ key ต่างกันและนับซ้ำไม่เจอ)
+    if ep_square < 0:
+        return 0
+    pawn = PAWN if white_to_move else PAWN | BLACK
+    for s in PAWN_ATTACKERS[0 if white_to_move else 1][ep_square]:
+        if squares[s] == pawn:
+            return EP_FILE_KEYS[ep_square & 7]
+    return 0
+
+
+def compute_hash(position) -> int:
+    """คำนวณ key ทั้งกระดานใหม่ (ใช้ตอนตั้ง position ; ระหว่างเกม make_move อัปเดตแบบ incremental)"""
+    squares = position.squares
+    key = 0
+    for sq in range(64):
+        code = squares[sq]
+        if code:
+            key ^= PIECE_KEYS[code][sq]
+    key ^= CASTLING_KEYS[position.castling]
+    key ^= ep_key(squares, position.ep_square, position.white_to_move)
+    if not position.white_to_move:
+        key ^= SIDE_KEY
+    return key
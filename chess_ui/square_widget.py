@@ -55,8 +55,8 @@ class SquareWidget(ButtonBehavior, Widget):
         sq = self._board_getter()[mx][my]
         piece = sq.piece
 
-        # highlight selected จาก flag เดิมในโปรเจกต์คุณ
-        is_selected = bool(getattr(piece, "selected", False))
+        # highlight selected (flag อยู่ที่ Square view)
+        is_selected = bool(getattr(sq, "selected", False))
         self._hl_color.rgba = (0.2, 0.85, 0.2, 0.9) if is_selected else (0, 0, 0, 0)
 
         # วาดตัวหมาก + hints บน canvas.after
@@ -68,9 +68,15 @@ class SquareWidget(ButtonBehavior, Widget):
         radius = min(self.width, self.height) * 0.18
 
         with self.canvas.after:
-            # capture = กรอบแดงบาง
+            # capture = กรอบบาง สีตาม SEE: เขียว = ได้ material, เหลือง = แลกเท่ากัน, แดง = เสีย
             if bool(getattr(sq, "legal_capture", False)):
-                Color(0.9, 0.1, 0.1, 0.9)
+                gain = getattr(sq, "capture_gain", 0)
+                if gain > 0:
+                    Color(0.1, 0.75, 0.2, 0.9)
+                elif gain == 0:
+                    Color(0.95, 0.75, 0.1, 0.9)
+                else:
+                    Color(0.9, 0.1, 0.1, 0.9)
                 Line(rectangle=(self.x + 3, self.y + 3, self.width - 6, self.height - 6), width=1.6)
 
             # move = จุดฟ้าอ่อน
@@ -1,30 +1,39 @@
 from chess_core.rules import (
     turn,
-    SAN_HISTORY,
     compute_legal_hints_for,
     clear_legal_hints,
-    apply_promotion,
-    end_turn,
-    check_for_check,
-    check_for_checkmate,
+    finish_promotion,
+    undo_last_move,
+    play_move,
+    apply_analysis,
 )
-from chess_core.board import Board
+from chess_core.position import Position
+from chess_core.engine import SearchLimits
+from chess_core.worker import EngineWorker
+from chess_core.evaluation import white_score
 from chess_core.square import EmptySquare
 from chess_core.pieces import King, Queen, Rook, Bishop, Knight, Pawn
-from chess_core.game_state import GAME_STATE
 
 from kivy.app import App
+from kivy.clock import Clock
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.boxlayout import BoxLayout
-from kivy.core.window import Window
-from kivy.properties import StringProperty
+from kivy.properties import StringProperty, NumericProperty
 
 from chess_ui.font_piece_renderer import ChessCasesRenderer
 from chess_ui.square_widget import SquareWidget
 from chess_ui.promotion_popup import PromotionPopup
 
-# init model
-Board.create_board()
+def _on_ui_thread(fn) -> None:
+    # callback จาก engine worker -> รันใน frame ถัดไปบน main thread (Clock.schedule_once เรียกจาก thread อื่นได้)
+    Clock.schedule_once(lambda _dt: fn(), 0)
+
+
+def _window_size():
+    # import Window ตอนสร้าง widget (หน้าต่างถูกสร้างตอน import kivy.core.window)
+    from kivy.core.window import Window
+
+    return Window._get_size()
 
 
 class ChessGame(BoxLayout):
@@ -52,10 +61,22 @@ def piece_to_letter(piece) -> str:
 class BoardGrid(GridLayout):
     move_list_text = StringProperty("")
 
+    # eval bar: สัดส่วนฝั่งขาว (0..1) + คะแนนเป็นตัวหนังสือ (มุมขาว, หน่วย pawn)
+    eval_fraction = NumericProperty(0.5)
+    eval_text = StringProperty("0.00")
+    # ความคืบหน้าของ engine (depth / คะแนน / PV) ระหว่างคิด
+    engine_info = StringProperty("")
+
+    # เวลาคิดของ engine ต่อ move (วินาที) ในโหมดเล่นคนเดียว
+    ENGINE_MOVETIME = 1.0
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.cols = 8
 
+        # model ของเกมนี้ (ไม่ใช้กระดาน global)
+        self.position = Position.initial()
+
         self.iswhite = True
         self.view_iswhite = self.iswhite
 
@@ -66,7 +87,17 @@ class BoardGrid(GridLayout):
         # pending promotion state
         self._pending_promotion = None
 
-        w, h = Window._get_size()
+        # เล่นคนเดียว: engine เดินฝ่าย engine_iswhite (None = สองคนเล่นเครื่องเดียวกัน)
+        self.engine = None
+        self.engine_iswhite = False
+
+        # งานหนัก (engine search / ตรวจจบเกมหลังเดิน) ทำใน thread เบื้องหลัง ; ผลกลับมาผ่าน Clock
+        self.worker = EngineWorker(post=_on_ui_thread)
+        self._thinking = False
+        # ฝ่ายที่เพิ่งเดิน ระหว่างรอผลตรวจจบเกม (None = ไม่มีงานค้าง)
+        self._analyzing = None
+
+        w, h = _window_size()
         self.board_size = h if w > h else w
         self.square_size = int(self.board_size / 8)
 
@@ -81,7 +112,7 @@ class BoardGrid(GridLayout):
                     ui_y=ui_col,
                     ui_to_model=self.ui_to_model,
                     on_click_model=self.click_model,
-                    board_getter=lambda: Board.board,
+                    board_getter=lambda: self.position.board,
                     piece_letter_getter=piece_to_letter,
                     renderer=self.renderer,
                 )
@@ -105,41 +136,62 @@ class BoardGrid(GridLayout):
             sw.refresh()
 
     def _update_move_list(self) -> None:
-        base = SAN_HISTORY.formatted()
-        if GAME_STATE.result_text:
+        state = self.position.state
+        base = self.position.history.formatted()
+        if state.result_text:
             self.move_list_text = (
-                base + ("\n\n" if base else "") + GAME_STATE.result_text
+                base + ("\n\n" if base else "") + state.result_text
             )
         else:
             self.move_list_text = base
+        self._update_eval()
+
+    def _update_eval(self) -> None:
+        # อ่านค่าที่ make/unmake อัปเดตไว้แล้ว (O(1)) ไม่ต้อง search ; checkmate รู้จากผลตรวจของ worker
+        position = self.position
+        if position.state.game_over and position.state.result_text.startswith("Checkmate"):
+            self.eval_fraction = 0.0 if position.white_to_move else 1.0
+            self.eval_text = "0-1" if position.white_to_move else "1-0"
+            return
+        score = white_score(position)
+        # logistic: ได้เปรียบ 4 pawn ~ 90% ของแถบ
+        self.eval_fraction = 1.0 / (1.0 + 10.0 ** (-score / 400.0))
+        self.eval_text = f"{score / 100:+.2f}"
 
     def click_model(self, mx, my):
         # ล็อกเกมเมื่อจบ (รวมเสมอ)
-        if GAME_STATE.game_over:
+        if self.position.state.game_over:
             return
 
         # promotion ค้างอยู่: บล็อกการคลิกกระดาน
         if self._pending_promotion is not None:
             return
 
+        # ตาของ engine / รอผลตรวจจบเกมของ move ก่อน
+        if self.engine is not None and self.iswhite == self.engine_iswhite:
+            return
+        if self._analyzing is not None:
+            return
+
         if not self.selected:
             self.s_x = mx
             self.s_y = my
             self.selected = True
 
-            Board.board[mx][my].piece.selected = True
-            compute_legal_hints_for(mx, my, self.iswhite)
+            self.position.board[mx][my].selected = True
+            compute_legal_hints_for(mx, my, self.iswhite, self.position)
 
             self.refresh_all()
             return
 
-        result = turn(self.s_x, self.s_y, mx, my, self.iswhite)
+        moved_iswhite = self.iswhite
+        result = turn(self.s_x, self.s_y, mx, my, self.iswhite, position=self.position, analyze=False)
 
-        clear_legal_hints()
+        clear_legal_hints(self.position)
 
         self.selected = False
-        Board.board[self.s_x][self.s_y].piece.selected = False
-        Board.board[mx][my].piece.selected = False
+        self.position.board[self.s_x][self.s_y].selected = False
+        self.position.board[mx][my].selected = False
 
         # promotion pending
         if isinstance(result, tuple) and result and result[0] == "PROMOTION":
@@ -149,94 +201,150 @@ class BoardGrid(GridLayout):
             self.refresh_all()
             return
 
-        # draw
-        if isinstance(result, tuple) and result and result[0] == "DRAW":
-            self._update_move_list()
+        if result:
+            self._analyze_after_move(moved_iswhite)
+        else:
             self.refresh_all()
+
+    def _finalize_promotion(self, choice: str) -> None:
+        position = self.position
+        state = position.state
+        if self._pending_promotion is None or state.game_over:
             return
 
-        moved = bool(result)
-        if moved:
-            self.iswhite = not self.iswhite
-            self.view_iswhite = self.iswhite
+        fen_before, x1, y1, x2, y2, moved_iswhite = self._pending_promotion
+        self._pending_promotion = None
 
+        finish_promotion(x1, y1, x2, y2, moved_iswhite, choice, fen_before, position, analyze=False)
+        self._analyze_after_move(moved_iswhite)
+
+    # ----- หลังเดิน: ตรวจ checkmate / draw ใน worker -----
+    def _analyze_after_move(self, moved_iswhite: bool) -> None:
+        # วาด move ทันที แล้วรอผลตรวจจบเกมจาก worker (กระดานยังไม่หมุนจนกว่าจะรู้ผล)
+        self._analyzing = moved_iswhite
         self._update_move_list()
         self.refresh_all()
+        self.worker.analyze(self.position, self._on_analysis)
 
-    def _finalize_promotion(self, choice: str) -> None:
-        if self._pending_promotion is None or GAME_STATE.game_over:
+    def _on_analysis(self, status: str, reason) -> None:
+        moved_iswhite = self._analyzing
+        if moved_iswhite is None:
             return
+        self._analyzing = None
+        result = apply_analysis(moved_iswhite, status, reason, self.position)
 
-        fen_before, x1, y1, x2, y2, moved_iswhite = self._pending_promotion
-        self._pending_promotion = None
+        # flip side (ถ้าไม่เสมอ)
+        if not (isinstance(result, tuple) and result[0] == "DRAW"):
+            self._sync_turn()
 
-        apply_promotion(x2, y2, moved_iswhite, choice)
+        self._update_move_list()
+        self.refresh_all()
+        self._schedule_engine()
 
-        SAN_HISTORY.push_from_fen_and_coords(
-            fen_before_move=fen_before,
-            x1=x1,
-            y1=y1,
-            x2=x2,
-            y2=y2,
-            promotion=choice,
-        )
+    def takeback(self) -> None:
+        # ย้อน 1 move ด้วย unmake_move (ไม่ต้อง replay ทั้งเกม)
+        if self._pending_promotion is not None:
+            return
+        # ยกเลิก search / การตรวจที่ค้างอยู่ (ผลของ position เก่าจะถูกทิ้ง)
+        self.worker.cancel()
+        self._thinking = False
+        self._analyzing = None
+        self.engine_info = ""
+        if not undo_last_move(self.position):
+            return
+        # เล่นคนเดียว: ย้อน move ของ engine ด้วย ให้กลับมาเป็นตาผู้เล่น
+        if self.engine is not None and self.position.white_to_move == self.engine_iswhite:
+            undo_last_move(self.position)
 
-        # clocks: promotion = pawn move
-        GAME_STATE.halfmove_clock = 0
-        if not moved_iswhite:
-            GAME_STATE.fullmove_number += 1
-
-        end_turn(moved_iswhite)
-
-        other_iswhite = not moved_iswhite
-        if check_for_check(other_iswhite):
-            if check_for_checkmate(other_iswhite):
-                for i in range(64):
-                    sq = Board.board[i // 8][i % 8]
-                    if isinstance(sq.piece, King) and sq.piece.iswhite == other_iswhite:
-                        sq.piece.selected = True
-
-        # draw check after promotion
-        import chess
-        from chess_core.fen import to_fen
-
-        fen_after = to_fen(
-            side_to_move_iswhite=other_iswhite,
-            halfmove_clock=GAME_STATE.halfmove_clock,
-            fullmove_number=GAME_STATE.fullmove_number,
-        )
-        b = chess.Board(fen_after)
+        self.selected = False
+        clear_legal_hints(self.position)
+        for line in self.position.board:
+            for sq in line:
+                sq.selected = False
 
-        reason = None
-        if b.is_stalemate():
-            reason = "Draw by stalemate"
-        elif b.can_claim_threefold_repetition():
-            reason = "Draw by threefold repetition (claim)"
-        elif b.can_claim_fifty_moves():
-            reason = "Draw by 50-move rule (claim)"
+        self._sync_turn()
 
-        if reason:
-            GAME_STATE.game_over = True
-            GAME_STATE.result_text = reason
+        self._update_move_list()
+        self.refresh_all()
+        self._schedule_engine()
 
-        # flip side (ถ้าไม่เสมอ)
-        if not GAME_STATE.game_over:
-            self.iswhite = not self.iswhite
+    def _sync_turn(self) -> None:
+        self.iswhite = self.position.white_to_move
+        # เล่นคนเดียว: หันกระดานเข้าหาผู้เล่นตลอด ; สองคน: หันตามฝ่ายที่ต้องเดิน
+        if self.engine is None:
             self.view_iswhite = self.iswhite
-
-        self._update_move_list()
+        else:
+            self.view_iswhite = not self.engine_iswhite
+
+    # ----- single player -----
+    def set_single_player(self, enabled: bool) -> None:
+        if not enabled:
+            self.worker.cancel()
+            self._thinking = False
+            self.engine_info = ""
+            if self._analyzing is not None:
+                # การตรวจจบเกมที่ถูกยกเลิกไปด้วย -> ส่งใหม่
+                self.worker.analyze(self.position, self._on_analysis)
+        self.engine = self.worker.engine if enabled else None
+        self._sync_turn()
         self.refresh_all()
+        self._schedule_engine()
+
+    def _engine_to_move(self) -> bool:
+        return (
+            self.engine is not None
+            and not self.position.state.game_over
+            and self._pending_promotion is None
+            and self._analyzing is None
+            and self.position.white_to_move == self.engine_iswhite
+        )
+
+    def _schedule_engine(self) -> None:
+        if self._engine_to_move() and not self._thinking:
+            # engine คิดใน worker thread ; UI ยังวาด / รับ event ได้ตามปกติ
+            self._thinking = True
+            self.engine_info = "thinking..."
+            self.worker.search(
+                self.position,
+                SearchLimits(movetime=self.ENGINE_MOVETIME),
+                on_done=self._on_engine_result,
+                on_progress=self._on_engine_progress,
+            )
+
+    def _on_engine_progress(self, result) -> None:
+        # คะแนนของ search เป็นมุม engine -> แปลงเป็นมุมขาวให้ตรงกับ eval bar
+        sign = 1 if self.engine_iswhite else -1
+        if result.mate_in is not None:
+            score = f"#{sign * result.mate_in}"
+        else:
+            score = f"{sign * result.score / 100:+.2f}"
+        self.engine_info = f"depth {result.depth}  {score}  {' '.join(result.pv_uci()[:4])}"
+
+    def _on_engine_result(self, result) -> None:
+        self._thinking = False
+        if not self._engine_to_move() or not result.best_move:
+            return
+        moved_iswhite = self.position.white_to_move
+        play_move(result.best_move, self.position, analyze=False)
+        self._analyze_after_move(moved_iswhite)
 
 
 class Ui(BoxLayout):
-    w, h = Window._get_size()
-    ui_size_x = max(w, h) - min(w, h)
-    ui_size_y = min(w, h)
-    ui_pos_x = min(w, h)
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        w, h = _window_size()
+        self.ui_size_x = max(w, h) - min(w, h)
+        self.ui_size_y = min(w, h)
+        self.ui_pos_x = min(w, h)
 
 
 class ChessApp(App):
     pass
 
 
-ChessApp().run()
+def main() -> None:
+    ChessApp().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+วัดเวลา cold start ของเกม แล้วปิดเองหลัง frame แรก
+    python startup_timing.py
+
+รายงาน (ms นับจากบรรทัดแรกของไฟล์นี้ ไม่รวมเวลาเริ่ม interpreter):
+- import chess_core (สิ่งที่ worker แบบไม่มี UI ต้องโหลด)
+- import UI (kivy + main.py)
+- build (โหลด chess.kv + สร้าง widget) และ frame แรกที่วาดขึ้นจอ
+"""
+import time
+
+_T0 = time.perf_counter()
+
+import chess_core.rules  # noqa: E402
+
+_T_CORE = time.perf_counter()
+
+import main as chess_main  # noqa: E402
+
+_T_UI = time.perf_counter()
+
+
+def _ms(t: float) -> str:
+    return f"{(t - _T0) * 1000:8.1f} ms"
+
+
+def run() -> None:
+    from kivy.clock import Clock
+    from kivy.core.window import Window
+
+    marks = {}
+    app = chess_main.ChessApp()
+
+    def on_first_frame(*_args):
+        Window.unbind(on_flip=on_first_frame)
+        marks["frame"] = time.perf_counter()
+        # ปิดหลังรายงาน (รอ tick ถัดไปเพื่อให้ frame นี้วาดจบก่อน)
+        Clock.schedule_once(lambda _dt: finish(), 0)
+
+    def on_start(*_args):
+        marks["build"] = time.perf_counter()
+        Window.bind(on_flip=on_first_frame)
+
+    def finish():
+        print("import chess_core :", _ms(_T_CORE))
+        print("import UI (kivy)  :", _ms(_T_UI))
+        print("build (kv/widgets):", _ms(marks["build"]))
+        print("first frame       :", _ms(marks["frame"]))
+        app.stop()
+
+    app.bind(on_start=on_start)
+    app.run()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,84 @@
+"""
+แกนของ engine: perft ของทั้งสอง backend, FEN / SAN ไป-กลับ และ hash / eval ที่ make / unmake อัปเดตแบบ incremental
+"""
+import random
+
+import pytest
+
+from chess_core.fen import from_fen
+from chess_core.zobrist import compute_hash
+from chess_core.evaluation import compute_eval
+from chess_core.movegen import generate_legal_moves, get_move_backend, set_move_backend, MOVE_BACKENDS
+from chess_core.san import move_to_san, parse_san
+from chess_core.perft import perft, SUITE
+
+MAX_DEPTH = 3
+
+
+@pytest.fixture(params=MOVE_BACKENDS)
+def backend(request):
+    previous = get_move_backend()
+    set_move_backend(request.param)
+    yield request.param
+    set_move_backend(previous)
+
+
+@pytest.mark.parametrize("name, fen, counts", SUITE, ids=[name for name, _fen, _counts in SUITE])
+def test_perft_suite(backend, name, fen, counts):
+    position = from_fen(fen)
+    for depth, expected in enumerate(counts[:MAX_DEPTH], start=1):
+        assert perft(position, depth) == expected, f"{name} depth {depth}"
+    assert position.to_fen() == fen
+
+
+@pytest.mark.parametrize("fen", [fen for _name, fen, _counts in SUITE])
+def test_fen_round_trip(fen):
+    assert from_fen(fen).to_fen() == fen
+
+
+def _random_games(plies=80, seeds=range(2)):
+    # เกมสุ่มจากทุก position ใน SUITE: ได้ทั้ง castling / en passant / promotion / capture
+    for seed in seeds:
+        for _name, fen, _counts in SUITE:
+            rng = random.Random(seed)
+            position = from_fen(fen)
+            for _ in range(plies):
+                moves = list(generate_legal_moves(position))
+                if not moves:
+                    break
+                yield position, moves, rng.choice(moves)
+
+
+def _incremental_matches(position):
+    return position.hash_key == compute_hash(position) and (
+        (position.eval_mg, position.eval_eg, position.phase) == compute_eval(position.squares)
+    )
+
+
+def test_make_unmake_keeps_hash_and_eval():
+    for position, moves, chosen in _random_games():
+        before = (position.to_fen(), position.hash_key, position.eval_mg, position.eval_eg, position.phase)
+        for move in moves:
+            position.make_move(move)
+            assert _incremental_matches(position), position.to_fen()
+            assert position.unmake_move() == move
+            after = (position.to_fen(), position.hash_key, position.eval_mg, position.eval_eg, position.phase)
+            assert after == before
+        position.make_move(chosen)
+
+
+def test_san_round_trip():
+    for position, moves, chosen in _random_games(seeds=range(1)):
+        sans = [move_to_san(position, move, moves) for move in moves]
+        assert len(set(sans)) == len(sans)
+        for move, san in zip(moves, sans):
+            assert parse_san(position, san) == move, san
+        position.make_move(chosen)
+
+
+def test_repetition_count():
+    position = from_fen(SUITE[0][1])
+    for _ in range(2):
+        for san in ("Nf3", "Nf6", "Ng1", "Ng8"):
+            position.make_move(parse_san(position, san))
+    assert position.repetition_count() == 3
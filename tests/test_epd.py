@@ -0,0 +1,41 @@
+"""
+EPD: clock ของ position มาจาก opcode hmvc / fmvn (ไม่ใช่ 0 1 เสมอ) เพราะ halfmove clock ใช้ตัดสินเสมอ 50 ตา
+"""
+import io
+
+import pytest
+
+from chess_core.epd import read_epd, split_epd_line
+from chess_core.replay import game_result, DRAW_FIFTY_MOVES, ONGOING
+
+KINGS_AND_ROOK = "4k3/8/8/8/8/8/8/4K2R w K -"
+
+
+def test_hmvc_fmvn_become_fen_clocks():
+    fen, ops = split_epd_line(KINGS_AND_ROOK + ' hmvc 37; fmvn 52; id "x";')
+    assert fen == KINGS_AND_ROOK + " 37 52"
+    assert ops["id"] == '"x"'
+
+
+def test_missing_clock_ops_default():
+    fen, _ops = split_epd_line(KINGS_AND_ROOK + " bm Rh8+;")
+    assert fen.endswith(" 0 1")
+
+
+def test_explicit_fen_clocks_win():
+    fen, _ops = split_epd_line(KINGS_AND_ROOK + " 5 9")
+    assert fen.endswith(" 5 9")
+
+
+def test_bad_clock_operand():
+    with pytest.raises(ValueError):
+        split_epd_line(KINGS_AND_ROOK + " hmvc x;")
+
+
+def test_fifty_move_status_from_hmvc():
+    source = io.StringIO(KINGS_AND_ROOK + " hmvc 100; fmvn 80;\n" + KINGS_AND_ROOK + " bm Rh8+;\n")
+    positions = [position for position, _ops in read_epd(source)]
+    assert positions[0].halfmove_clock == 100
+    assert positions[0].to_fen().endswith(" 100 80")
+    assert game_result(positions[0], 0).status == DRAW_FIFTY_MOVES
+    assert game_result(positions[1], 0).status == ONGOING
@@ -0,0 +1,58 @@
+"""
+เล่นสุ่มแบบเดียวกับ UI: เลือกหมากของฝ่ายที่ต้องเดิน -> compute_legal_hints_for -> เดินไปช่องที่ hint บอก
+hint / ตรวจเช็ค / ตรวจจบเกม ต้องทำงานกับกระดานของ Position ที่ส่งไปเท่านั้น (ไม่แตะกระดาน global ที่ว่างอยู่)
+"""
+import random
+
+from chess_core.position import Position
+from chess_core.rules import compute_legal_hints_for, turn
+
+
+def _hinted_targets(position, x, y):
+    compute_legal_hints_for(x, y, position.white_to_move, position)
+    grid = position.board
+    return [
+        (tx, ty)
+        for tx in range(8)
+        for ty in range(8)
+        if grid[tx][ty].legal_move or grid[tx][ty].legal_capture or grid[tx][ty].legal_castle
+    ]
+
+
+def _own_squares(position):
+    grid = position.board
+    return [
+        (x, y)
+        for x in range(8)
+        for y in range(8)
+        if type(grid[x][y].piece).__name__ != "EmptySquare" and grid[x][y].piece.iswhite == position.white_to_move
+    ]
+
+
+def _play_random_game(seed, max_plies):
+    rng = random.Random(seed)
+    position = Position.initial()
+    plies = attempts = 0
+    while plies < max_plies and attempts < 4 * max_plies:
+        attempts += 1
+        squares = _own_squares(position)
+        rng.shuffle(squares)
+        for x1, y1 in squares:
+            targets = _hinted_targets(position, x1, y1)
+            if targets:
+                break
+        else:
+            break  # checkmate / stalemate
+        x2, y2 = rng.choice(targets)
+        result = turn(x1, y1, x2, y2, position.white_to_move, position=position)
+        if result is False:
+            continue
+        plies += 1
+        if isinstance(result, tuple):
+            break  # promotion รอเลือกหมาก / เสมอ
+    return plies
+
+
+def test_random_hint_play():
+    for seed in range(8):
+        assert _play_random_game(seed, 80) > 10
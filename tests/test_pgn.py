@@ -0,0 +1,67 @@
+"""
+ตัวอ่าน PGN: บรรทัดว่าง, เกมที่ไม่มีผลเกมท้าย movetext, comment {} หลายบรรทัด, comment ; และ variation ซ้อนกัน
+"""
+import io
+
+from chess_core.pgn import read_pgn
+
+
+def _games(text, validate=True):
+    return list(read_pgn(io.StringIO(text), validate=validate))
+
+
+def test_blank_line_after_movetext_without_result():
+    games = _games('[Event "y"]\n\n1. d4 d5\n\n[Event "z"]\n\n1. c4 *\n')
+    assert [g.tags["Event"] for g in games] == ["y", "z"]
+    assert games[0].sans == ["d4", "d5"]
+    assert games[0].result == "*"
+    assert games[1].sans == ["c4"]
+    assert all(g.error is None for g in games)
+
+
+def test_blank_line_inside_movetext():
+    games = _games('[Event "a"]\n[Result "1-0"]\n\n1. e4 e5\n\n2. Nf3 Nc6\n\n1-0\n')
+    assert len(games) == 1
+    assert games[0].sans == ["e4", "e5", "Nf3", "Nc6"]
+    assert games[0].result == "1-0"
+
+
+def test_missing_result_uses_tag():
+    games = _games('[Event "a"]\n[Result "0-1"]\n\n1. e4 e5\n')
+    assert len(games) == 1
+    assert games[0].sans == ["e4", "e5"]
+    assert games[0].result == "0-1"
+
+
+def test_multiline_brace_comment():
+    text = (
+        '[Event "a"]\n\n'
+        "1. e4 {a comment that\n"
+        "[looks like a tag] and spans\n"
+        "lines} e5 2. Nf3 1/2-1/2\n"
+    )
+    games = _games(text)
+    assert len(games) == 1
+    assert games[0].tags == {"Event": "a"}
+    assert games[0].sans == ["e4", "e5", "Nf3"]
+    assert games[0].result == "1/2-1/2"
+
+
+def test_semicolon_comment():
+    games = _games('[Event "a"]\n\n1. e4 ; rest of line is a comment Nf3\ne5 *\n')
+    assert games[0].sans == ["e4", "e5"]
+
+
+def test_nested_variations_and_nags():
+    text = '[Event "a"]\n\n1. e4 $1 (1. d4 d5 (1... Nf6 2. c4) 2. c4) e5 2. Nf3 (2. f4 exf4) Nc6 *\n'
+    games = _games(text)
+    assert games[0].sans == ["e4", "e5", "Nf3", "Nc6"]
+    assert games[0].error is None
+    assert games[0].final_fen.startswith("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+
+
+def test_illegal_move_is_reported_not_raised():
+    games = _games('[Event "a"]\n\n1. e4 e5 2. Ke3 *\n\n[Event "b"]\n\n1. d4 *\n')
+    assert len(games) == 2
+    assert games[0].error.startswith("ply 3")
+    assert games[1].error is None